@@ -34,6 +34,7 @@ consequence, some features may be undocumented and/or very experimental.
     ore_algebra.analytic.function
     ore_algebra.analytic.monodromy
     ore_algebra.analytic.path
+    ore_algebra.analytic.piecewise_eval
     ore_algebra.analytic.polynomial_approximation
     ore_algebra.analytic.ui
 
@@ -642,7 +643,7 @@ from __future__ import absolute_import
 from . import analytic_continuation as ancont
 from . import polynomial_approximation as polapprox
 
-from .bounds import RatSeqBound, DiffOpBound
+from .bounds import RatSeqBound, IncrementalRatSeqBound, DiffOpBound
 from .differential_operator import DifferentialOperator
 from .function import DFiniteFunction
 from .local_solutions import LogSeriesInitialValues
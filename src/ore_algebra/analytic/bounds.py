@@ -23,13 +23,14 @@ Reference:
 from __future__ import division, print_function
 from six.moves import range
 
-import collections, itertools, logging, sys, warnings
+import bisect, collections, itertools, logging, sys, warnings
 
 from sage.arith.srange import srange
 from sage.misc.cachefunc import cached_function, cached_method
 from sage.misc.lazy_string import lazy_string
 from sage.misc.misc_c import prod
 from sage.misc.random_testing import random_testing
+from sage.modules.free_module_element import vector
 from sage.rings.all import ComplexIntervalField
 from sage.rings.complex_arb import CBF, ComplexBallField, ComplexBall
 from sage.rings.infinity import infinity
@@ -938,12 +939,19 @@ class RatSeqBound(object):
             self.exn = {0: 1}
         self._Pol = self._rcpq_den.parent()
         self._pol_class = self._Pol.Element
+        # Staircase data, see _update_stairs()
+        self._exn_edges = tuple(sorted(n for n in self.exn if n >= 0))
+        self._stair_vals = vector(IR, 0)
+        self._stair_count = 0
+        self._exn_cursor = 0
         self.extend(nums)
 
     def extend(self, nums):
         r"""
         Add new sequences to this bound, without changing the rest of the data.
 
+        The data associated to the existing sequences is kept and reused.
+
         Use with care!
         """
         self.nums.extend(nums)
@@ -952,7 +960,6 @@ class RatSeqBound(object):
         deg = self.den.degree()
         # rcpq_num/rcpq_den = (1/n)*rat(1/n)
         self._rcpq_nums.extend([num.reverse(deg-1) for num in ivnums])
-        self._stairs.clear_cache()
 
     def __len__(self):
         return len(self.nums)
@@ -992,7 +999,7 @@ class RatSeqBound(object):
         return "\n".join(self.entries_repr("full"))
 
     def __getitem__(self, i):
-        return RatSeqBound([self.nums[i]], self.den, self.exn)
+        return type(self)([self.nums[i]], self.den, self.exn)
 
     @cached_method
     def _den_data(self):
@@ -1081,11 +1088,14 @@ class RatSeqBound(object):
                 res *= abs((IC.one() - root/n))**mult
         return res
 
-    def _bound_rat(self, n, ord, tight=None):
+    def _bound_rat(self, n, ord, tight=None, seqs=None):
         r"""
         A componentwise bound on the vector ref[ord](k), valid for all k ≥ n
         with n, k ∉ exn.
 
+        When ``seqs`` is a slice, only compute the bounds for the corresponding
+        subset of the sequences.
+
         When ord = 1, this method simply evaluates the reciprocal polynomials
         of nums and den, rescaled by a suitable power of n, on an interval of
         the form [0,1/n]. (It works for exceptional indices, but doesn't do
@@ -1101,7 +1111,8 @@ class RatSeqBound(object):
         jet = iv*jet1
         # Most expensive part. Perhaps consider simplifying rcpq_num, rcpq_den
         # by bounding the high-degree terms for large n???
-        nums = [num.compose_trunc(jet, ord) for num in self._rcpq_nums]
+        rcpq_nums = self._rcpq_nums if seqs is None else self._rcpq_nums[seqs]
+        nums = [num.compose_trunc(jet, ord) for num in rcpq_nums]
         den = self._rcpq_den.compose_trunc(jet, ord)
         invabscst = IR.one()
         if tight or tight is None and den[0].accuracy() < 0:
@@ -1135,48 +1146,80 @@ class RatSeqBound(object):
             bounds.append(bound)
         return bounds
 
-    @cached_method
-    def _stairs(self, count):
+    def _update_stairs(self):
         r"""
         Shared part of the computation of _bound_exn(n) for varying n.
 
-        OUTPUT:
-
-        A list whose element of index i is a list of pairs (edge, val), ordered
-        by increasing edge, and such that |ref(n)[i]| ≤ val for all n ≥ edge.
+        Set self._stair_vals to a flat vector over IR of length
+        len(self._exn_edges)*len(self.nums), whose entry of index j*N + i
+        (where N = len(self.nums)) bounds |ref(n)[i]| for all n ≥
+        self._exn_edges[j]. The values for the sequences added since the last
+        call are computed without touching the existing ones.
         """
-        # consistency check, we need to recompute or at least extend the stairs
-        # each time the sequence of numerators is extended
-        assert count == len(self.nums)
-        stairs = [[(infinity, IR.zero())] for _ in self.nums]
+        edges = self._exn_edges
+        start = self._stair_count
+        if not edges or start == len(self.nums):
+            return
+        seqs = slice(start, None)
+        cur = [IR.zero()]*(len(self.nums) - start)
+        new_vals = [None]*len(edges)
         ord = sum(m for n, m in self.exn.items())
-        exn = sorted([n for n in self.exn if n >= 0], reverse=True)
-        for n in exn:
+        for j in range(len(edges) - 1, -1, -1):
+            n = edges[j]
             # We want the bound to hold for ordinary k ≥ n too, so we take the
             # max of the exceptional value at n and the value at n + 1, when
             # n + 1 is an ordinary index. (When n + 1 is an exceptional index,
             # it has already been done during the previous iteration.)
-            refs = self.ref(n, ord)
-            if n + 1 not in exn:
-                rats = self._bound_rat(n + 1, ord)
+            refs = self.ref(n, ord, seqs)
+            if n + 1 not in self.exn:
+                rats = self._bound_rat(n + 1, ord, seqs=seqs)
             else:
                 rats = [IR.zero()]*len(refs)
-            assert len(refs) == len(rats) == len(stairs) == len(self.nums)
-            for (ref, rat, seq_stairs) in zip(refs, rats, stairs):
+            assert len(refs) == len(rats) == len(cur)
+            for i, (ref, rat) in enumerate(zip(refs, rats)):
                 val = ref.max(rat)
-                if val.upper() > seq_stairs[-1][1].upper():
-                    seq_stairs.append((n, val))
+                if val.upper() > cur[i].upper():
+                    cur[i] = val
+            new_vals[j] = list(cur)
             ord -= self.exn[n]
+        old = self._stair_vals
+        self._stair_vals = vector(IR, [
+            val for j in range(len(edges))
+                for val in itertools.chain(old[j*start:(j+1)*start],
+                                           new_vals[j])])
+        self._stair_count = len(self.nums)
+
+    def _stair_row(self, j):
+        count = self._stair_count
+        return list(self._stair_vals[j*count:(j+1)*count])
+
+    def _stairs(self, count):
+        r"""
+        Staircase functions bounding ref, in human-readable form.
+
+        OUTPUT:
+
+        A list whose element of index i is a list of pairs (edge, val), ordered
+        by increasing edge, and such that |ref(n)[i]| ≤ val for all n ≥ edge.
+        """
+        assert count == len(self.nums)
+        self._update_stairs()
+        stairs = [[] for _ in self.nums]
+        prev = [IR.zero()]*len(self.nums)
+        for j in range(len(self._exn_edges) - 1, -1, -1):
+            edge = self._exn_edges[j]
+            for i, val in enumerate(self._stair_row(j)):
+                if val.upper() > prev[i].upper():
+                    stairs[i].append((edge, val))
+                    prev[i] = val
         for seq_stairs in stairs:
             seq_stairs.reverse()
-            # remove (∞,0) (faster and permits testing "stairs == []")
-            seq_stairs.pop()
         return stairs
 
     def _bound_exn(self, n):
         r"""
         A list of *non-increasing* staircase functions defined on the whole
-        of ℕ such that, whenever *n* (sic) is an exceptional index, the
+        of ℕ such that, whenever *n* (sic) is an exceptional index, the
         inequality ref(k) ≤ _bound_exn(n) holds (componentwise) for all k ≥ n
         (both ordinary and exceptional).
 
@@ -1184,16 +1227,24 @@ class RatSeqBound(object):
         of each stair: the index associated to a given value is the last time
         this value will be reached by the staircase function _bound_exn().
         One may well have |f[i](n)| > _bound_exn(n)[i] when n is ordinary.)
+
+        Successive calls with nondecreasing values of n take amortized
+        constant time.
         """
-        # Return the value associated to the smallest step larger than n. (This
-        # might be counter-intuitive!)
-        def doit(seq_stairs):
-            for (edge, val) in seq_stairs:
-                if n <= edge:
-                    return val
-            return IR.zero()
-        stairs = self._stairs(len(self.nums))
-        return [doit(seq_stairs) for seq_stairs in stairs]
+        # Return the value associated to the smallest edge larger than n.
+        # (This might be counter-intuitive!)
+        self._update_stairs()
+        edges = self._exn_edges
+        j = self._exn_cursor
+        if j > 0 and n <= edges[j-1]:
+            j = bisect.bisect_left(edges, n)
+        else:
+            while j < len(edges) and edges[j] < n:
+                j += 1
+        self._exn_cursor = j
+        if j == len(edges):
+            return [IR.zero()]*len(self.nums)
+        return self._stair_row(j)
 
     def ord(self, n):
         return sum(m for (k, m) in self.exn.items() if k <= n)
@@ -1219,12 +1270,16 @@ class RatSeqBound(object):
             bound_rat = self._bound_rat(n, ord, tight)
             return [b1.max(b2) for b1, b2 in zip(bound_rat, bound_exn)]
 
-    def ref(self, n, ord):
+    def ref(self, n, ord, seqs=None):
         r"""
         Reference value for a single n.
+
+        When ``seqs`` is a slice, only compute the reference values for the
+        corresponding subset of the sequences.
         """
         jet = self._pol_class(self._Pol, [n, 1])
-        nums = [num.compose_trunc(jet, ord) for num in self._ivnums]
+        ivnums = self._ivnums if seqs is None else self._ivnums[seqs]
+        nums = [num.compose_trunc(jet, ord) for num in ivnums]
         mult = self.exn.get(n, 0)
         # den has a root of order mult at n, so den(pert) = O(X^mult), but the
         # computed value might include terms of degree < mult with interval
@@ -1344,6 +1399,84 @@ class RatSeqBound(object):
             n = ref.max(self.ref(n, self.ord(n))[0])
             assert not (self(n)[0] < ref)
 
+class IncrementalRatSeqBound(RatSeqBound):
+    r"""
+    Variant of :class:`RatSeqBound` optimized for nondecreasing sequences of
+    queries.
+
+    The value ``b(n)`` of a :class:`RatSeqBound` at an index ``n`` bounds the
+    reference function at all ``k ≥ n``. This class takes advantage of this
+    fact to reuse the generic part of the bound computed at some index ``n0``
+    for all subsequent queries ``n0 ≤ n ≤ (1 + 2^(-reuse_shift))·n0`` such
+    that there is no exceptional index in ``(n0, n]``. It is thus less tight
+    than :class:`RatSeqBound`, but much cheaper to evaluate repeatedly for
+    increasing ``n``, as happens when summing series.
+
+    When new sequences are added using :meth:`extend`, the cached bounds for
+    the existing sequences are kept, and only the bounds on the new ones are
+    computed.
+
+    EXAMPLES::
+
+        sage: Pols.<n> = QQ[]
+        sage: from ore_algebra.analytic.bounds import (RatSeqBound,
+        ....:         IncrementalRatSeqBound)
+
+        sage: ref = RatSeqBound([-n], n*(n-3), {-1: 1, 0:1, 3:1})
+        sage: bnd = IncrementalRatSeqBound([-n], n*(n-3), {-1: 1, 0:1, 3:1})
+        sage: [bnd(k)[0] for k in range(5)] == [ref(k)[0] for k in range(5)]
+        True
+        sage: bnd._test()
+
+        sage: bnd = IncrementalRatSeqBound([Pols(1)], n*(n-1))
+        sage: ref = RatSeqBound([Pols(1)], n*(n-1))
+        sage: bnd(80)[0].upper() == ref(80)[0].upper()
+        True
+        sage: bnd(85)[0].upper() == ref(80)[0].upper() > ref(85)[0].upper()
+        True
+        sage: bnd(100)[0].upper() == ref(100)[0].upper()
+        True
+        sage: bnd.extend([n]); ref.extend([n])
+        sage: b = bnd(105)
+        sage: b[0].upper() == ref(100)[0].upper()
+        True
+        sage: b[1].upper() == ref(105)[1].upper()
+        True
+        sage: all(u.upper() == v.upper() for u, v in zip(bnd(10), ref(10)))
+        True
+    """
+
+    reuse_shift = 3
+
+    def __init__(self, nums, den, exceptional_indices={-1: 1}):
+        # (n0, ord, tight, bounds)
+        self._rat_cache = None
+        super(IncrementalRatSeqBound, self).__init__(nums, den,
+                                                     exceptional_indices)
+
+    def __call__(self, n, tight=None):
+        r"""
+        The bounds.
+        """
+        bound_exn = self._bound_exn(n)
+        if n in self.exn:
+            return bound_exn
+        ord = self.ord(n)
+        cache = self._rat_cache
+        if (cache is not None
+                and cache[0] <= n <= cache[0] + (cache[0] >> self.reuse_shift)
+                and cache[1] == ord and cache[2] == tight):
+            bound_rat = cache[3]
+            if len(bound_rat) < len(self.nums):
+                # sequences added since the cached value was computed
+                bound_rat = bound_rat + self._bound_rat(n, ord, tight,
+                                        seqs=slice(len(bound_rat), None))
+                self._rat_cache = (n, ord, tight, bound_rat)
+        else:
+            bound_rat = self._bound_rat(n, ord, tight)
+            self._rat_cache = (n, ord, tight, bound_rat)
+        return [b1.max(b2) for b1, b2 in zip(bound_rat, bound_exn)]
+
 @random_testing
 def _test_RatSeqBound(number=10, base=QQ, deg=20, verbose=False):
     r"""
@@ -1532,13 +1665,16 @@ class DiffOpBound(object):
         sage: for l in range(10):
         ....:     DiffOpBound(Dx - 5*x^4, pol_part_len=l)._test()
         ....:     DiffOpBound((1-x^5)*Dx - 5*x^4, pol_part_len=l)._test()
+        ....:     DiffOpBound((1-x^5)*Dx - 5*x^4, pol_part_len=l,
+        ....:                 incremental=True)._test()
 
         sage: from ore_algebra.analytic.bounds import _test_diffop_bound
         sage: _test_diffop_bound() # long time
     """
 
     def __init__(self, dop, leftmost=ZZ.zero(), special_shifts=None,
-            max_effort=2, pol_part_len=None, bound_inverse="simple"):
+            max_effort=2, pol_part_len=None, bound_inverse="simple",
+            incremental=False):
         r"""
         Construct a DiffOpBound for a subset of the solutions of dop.
 
@@ -1570,7 +1706,10 @@ class DiffOpBound(object):
 
         The remaining parameters are used to set properties of the DiffOpBound
         object related to the effort/tightness trade-off of the algorithm. They
-        have no influence on the semantics of the bound.
+        have no influence on the semantics of the bound. In particular, when
+        incremental is True, the sequences pol[n] and num[n] are bounded using
+        IncrementalRatSeqBound objects, which are cheaper to evaluate for
+        increasing n but give looser bounds than the default RatSeqBound.
         """
 
         logger.info("bounding local operator "
@@ -1603,6 +1742,8 @@ class DiffOpBound(object):
         self.bound_inverse = bound_inverse
         self.max_effort = max_effort
         self._effort = 0
+        self._RatSeqBound = (IncrementalRatSeqBound if incremental
+                             else RatSeqBound)
         if bound_inverse == "solve":
             self._effort += 1
         self._dop_deg = self.dop.degree()
@@ -1634,7 +1775,8 @@ class DiffOpBound(object):
         self.ind = self._dop_D._indicial_polynomial_at_zero().monic()(self.alg_idx)
         assert self.ind.is_monic()
         assert self.ind.base_ring().is_exact()
-        self.majseq_pol_part = RatSeqBound([], self.ind, self.special_shifts)
+        self.majseq_pol_part = self._RatSeqBound([], self.ind,
+                                                 self.special_shifts)
         self._update_num_bound(pol_part_len, first_nz, rem_num_nz)
 
     def __repr__(self, asympt=True):
@@ -1757,9 +1899,11 @@ class DiffOpBound(object):
         self.majseq_pol_part.extend([first_nz[i](self.alg_idx)
                 for i in range(old_pol_part_len + 1, pol_part_len + 1)])
         assert len(self.majseq_pol_part) == pol_part_len
-        self.majseq_num = RatSeqBound(
+        self.majseq_num = self._RatSeqBound(
                 [pol(self.alg_idx) for pol in rem_num_nz],
                 self.ind, self.special_shifts)
+        # Both bounds share the same denominator and exceptional indices
+        self.majseq_num._den_data.set_cache(self.majseq_pol_part._den_data())
 
     def effort(self):
         return self._effort
@@ -19,17 +19,18 @@ from six.moves import range
 
 import collections, logging, sys
 
+import numpy
+
 import sage.plot.all as plot
 
 from sage.misc.cachefunc import cached_method
-from sage.plot.plot import generate_plot_points
 from sage.rings.all import ZZ, QQ, RBF, CBF, RIF, CIF
 from sage.rings.complex_arb import ComplexBall, ComplexBallField
 from sage.rings.complex_number import ComplexNumber
 from sage.rings.infinity import AnInfinity
 from sage.rings.real_arb import RealBall, RealBallField
 from sage.rings.real_mpfi import RealIntervalField
-from sage.rings.real_mpfr import RealNumber
+from sage.rings.real_mpfr import RealField, RealNumber
 
 from . import analytic_continuation as ancont
 from . import bounds
@@ -37,7 +38,8 @@ from . import polynomial_approximation as polapprox
 
 from .analytic_continuation import normalize_post_transform
 from .differential_operator import DifferentialOperator
-from .path import Point
+from .path import Path, Point
+from .piecewise_eval import horner
 from .safe_cmp import *
 
 logger = logging.getLogger(__name__)
@@ -216,15 +218,59 @@ class DFiniteFunction(object):
 
     def _path_to(self, dest, prec=None):
         r"""
-        Find a path from a point with known "initial" values to pt
+        Find a path from a point with known "initial" values to ``dest``.
+
+        Return a pair ``(ini, path)`` where ``ini`` is a vector of initial
+        values at ``path[0]``.
+
+        When ``dest`` is real, the path starts from the cached vertex closest to
+        ``dest`` among those whose initial values are accurate enough for the
+        target precision ``prec``, falling back on the user-provided initial
+        values otherwise. The path passes through the intermediate points
+        that analytic continuation would visit anyway, so that the associated
+        initial vectors can be cached.
+
+        TESTS::
+
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: Dops, x, Dx = DifferentialOperators()
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: ini, path = f._path_to(3, 53); path[0], path[-1], len(path) > 2
+            (0, 3, True)
+            sage: f(3)
+            [1.24904577239825...]
+            sage: ini, path = f._path_to(4, 53); path[0] > 0
+            True
+            sage: ini, path = f._path_to(4, 300); path[0]
+            0
+            sage: ini, path = f._path_to(CBF(1/2, 1/2), 53); path[0]
+            0
         """
-        # TODO:
-        # - attempt to start as close as possible to the destination
-        #   [and perhaps add logic to change for a starting point with exact
-        #   initial values if loosing too much precision]
-        # - return a path passing through "interesting" points (and cache the
-        #   associated initial vectors)
+        if prec is None:
+            prec = 53
+        dest = Point(dest, self.dop)
         start, ini = list(self.ini.items())[0]
+        if dest.is_real() and Point(start, self.dop).is_real():
+            # Paths along the real axis between points reached by analytic
+            # continuation from the same initial point cannot wind around
+            # singularities, so any cached real vertex will do.
+            best = None
+            for vert, vec in iteritems(self._inivecs):
+                if not Point(vert, self.dop).is_real():
+                    continue
+                if min(c.accuracy() for c in vec) < prec:
+                    continue
+                dist = (Point(vert, self.dop).iv() - dest.iv()).abs()
+                if best is None or safe_lt(dist, best[0]):
+                    best = (dist, vert, vec)
+            if best is not None:
+                start_dist = (Point(start, self.dop).iv() - dest.iv()).abs()
+                if safe_lt(best[0], start_dist):
+                    _, start, ini = best
+                    logger.debug("starting from cached vertex %s", start)
+            path = Path([start, dest], self.dop).subdivide()
+            return ini, [v.value for v in path.vert]
         return ini, [start, dest]
 
     # Having the update (rather than the full test-and-update) logic in a
@@ -232,14 +278,19 @@ class DFiniteFunction(object):
     def _update_approx(self, center, rad, prec, derivatives):
         ini, path = self._path_to(center, prec)
         eps = RBF.one() >> prec
-        # keep="all" won't do anything until _path_to returns better paths
+        # Compute the initial values at the vertices with some extra accuracy,
+        # so that they remain usable as starting points for further steps
         ctx = ancont.Context(keep="all")
-        sol = ancont.analytic_continuation(self.dop, path, eps, ctx, ini=ini)
+        sol = ancont.analytic_continuation(self.dop, path,
+                                           eps >> _ini_acc_margin, ctx, ini=ini)
         for point_dict in sol:
             vert, val = point_dict["point"], point_dict["value"]
             known = self._inivecs.get(vert)
             if known is None or known[0].accuracy() < val[0][0].accuracy():
                 self._inivecs[vert] = [c[0] for c in val]
+        # Now that we have initial values at the center, compute the
+        # approximations from there
+        ini, path = self._inivecs[center], [center]
         logger.info("computing new polynomial approximations: "
                     "ini=%s, path=%s, rad=%s, eps=%s, ord=%s",
                     ini, path, rad, eps, derivatives)
@@ -347,7 +398,7 @@ class DFiniteFunction(object):
             logger.info("performing high-prec evaluation "
                         "(pt=%s, prec=%s, post_transform=%s)",
                         pt, prec, post_transform)
-            ini, path = self._path_to(pt)
+            ini, path = self._path_to(pt, prec)
             eps = RBF.one() >> prec
             return self.dop.numerical_solution(ini, path, eps,
                     post_transform=post_transform)
@@ -355,7 +406,7 @@ class DFiniteFunction(object):
         if center is None:
             # raise NotImplementedError
             logger.info("falling back on generic evaluator")
-            ini, path = self._path_to(pt)
+            ini, path = self._path_to(pt, prec)
             eps = RBF.one() >> prec
             return self.dop.numerical_solution(ini, path, eps,
                     post_transform=post_transform)
@@ -376,6 +427,229 @@ class DFiniteFunction(object):
     def __call__(self, x, prec=None):
         return self.approx(x, prec=prec)
 
+    def approx_array(self, pts, prec=53, derivative=0):
+        r"""
+        Evaluate this function or one of its derivatives at many real points.
+
+        INPUT:
+
+        - ``pts`` - NumPy array or list of floating-point numbers or real balls
+        - ``prec`` - precision of the polynomial approximations to use
+        - ``derivative`` - order of the derivative to evaluate, must be less
+          than the order of the operator
+
+        OUTPUT:
+
+        A pair ``(val, rad)`` of NumPy arrays of floats, with the same shape as
+        ``pts``, such that the value at ``pts[k]`` lies in the interval
+        ``[val[k] - rad[k], val[k] + rad[k]]``.
+
+        The points are grouped by approximation disk, and the polynomial
+        approximation attached to each disk is evaluated on all its points at
+        once in floating-point arithmetic, with a rigorous bound on the
+        rounding errors. Points for which no approximation disk is available
+        are evaluated one by one using :meth:`approx`.
+
+        EXAMPLES::
+
+            sage: import numpy
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: DiffOps, x, Dx = DifferentialOperators()
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: pts = numpy.linspace(-3, 3, 10001)
+            sage: val, rad = f.approx_array(pts)
+            sage: val.shape, rad.shape
+            ((10001,), (10001,))
+            sage: all(RBF(val[k]).add_error(rad[k]).overlaps(RBF(pts[k]).arctan())
+            ....:     for k in range(0, 10001, 97))
+            True
+            sage: bool(numpy.max(rad) < 1e-12)
+            True
+
+            sage: val, rad = f.approx_array(pts, derivative=1)
+            sage: all(RBF(val[k]).add_error(rad[k]).overlaps(1/(1 + RBF(pts[k])^2))
+            ....:     for k in range(0, 10001, 97))
+            True
+
+            sage: val, rad = f.approx_array([RBF(1/3), RBF(1).add_error(1e-10)])
+            sage: RBF(val[0]).add_error(rad[0]).overlaps(RBF(1/3).arctan())
+            True
+            sage: bool(1e-11 < rad[1] < 1e-8)
+            True
+
+        TESTS::
+
+            sage: f.approx_array(numpy.array([]))
+            (array([], dtype=float64), array([], dtype=float64))
+            sage: f.approx_array([0.], derivative=2)
+            Traceback (most recent call last):
+            ...
+            ValueError: derivative order too large
+        """
+        if derivative >= self._max_derivatives:
+            raise ValueError("derivative order too large")
+        derivatives = derivative + 1
+        pts = numpy.asarray(pts)
+        shape = pts.shape
+        pts = pts.ravel()
+        if pts.dtype == object:
+            mid = numpy.empty(len(pts))
+            xrad = numpy.empty(len(pts))
+            for k, pt in enumerate(pts):
+                mid[k], xrad[k] = _ball_to_floats(RealBallField(prec)(pt))
+        else:
+            mid = pts.astype(float)
+            xrad = numpy.zeros(len(pts))
+        val = numpy.empty(len(pts))
+        rad = numpy.empty(len(pts))
+        todo = numpy.ones(len(pts), dtype=bool)
+        order = numpy.argsort(mid)
+        sorted_mid = mid[order]
+
+        def process(center, polys):
+            c = float(center)
+            if QQ(c) != center:
+                return
+            r = float(self._rad(center))
+            lo = numpy.searchsorted(sorted_mid, c - r, 'left')
+            hi = numpy.searchsorted(sorted_mid, c + r, 'right')
+            idx = order[lo:hi]
+            idx = idx[todo[idx]]
+            y = mid[idx] - c
+            # the subtraction is exact in most cases, but not always
+            dy = xrad[idx] + _float_eps*numpy.abs(y)
+            idx = idx[numpy.abs(y) + dy <= r]
+            if len(idx) == 0:
+                return
+            y = mid[idx] - c
+            dy = xrad[idx] + _float_eps*numpy.abs(y)
+            v, e = _eval_ball_pol(polys[derivative], y, dy)
+            fact = float(ZZ(derivative).factorial())
+            v *= fact
+            val[idx] = v
+            rad[idx] = (e*fact + _float_eps*numpy.abs(v))*(1 + 4*_float_eps)
+            todo[idx] = False
+
+        if prec < self.max_prec:
+            for center, approx in list(self._polys.items()):
+                if (len(approx) >= derivatives
+                        and approx[derivatives-1].prec >= prec):
+                    process(center, [a.pol for a in approx])
+        Dx = self.dop.parent().gen()
+        while todo.any():
+            k = numpy.flatnonzero(todo)[0]
+            ball = RealBallField(prec)(mid[k]).add_error(xrad[k])
+            if prec < self.max_prec:
+                center, crad = self._disk(Point(ball, self.dop))
+                if center is not None:
+                    approx = self._polys.get(center, [])
+                    if (len(approx) < derivatives
+                            or approx[derivatives-1].prec < prec):
+                        polys = self._update_approx(center, crad, prec,
+                                                    derivatives)
+                    else:
+                        polys = [a.pol for a in approx]
+                    process(center, polys)
+            if todo[k]:
+                logger.info("falling back on pointwise evaluation at %s", ball)
+                res = self.approx(ball, prec, post_transform=Dx**derivative)
+                val[k], rad[k] = _ball_to_floats(res)
+                todo[k] = False
+
+        return val.reshape(shape), rad.reshape(shape)
+
+    def export(self, filename, derivative=0):
+        r"""
+        Export the polynomial approximations computed so far to a file.
+
+        The file can be loaded using
+        :func:`ore_algebra.analytic.piecewise_eval.load`, which only requires
+        NumPy, and then evaluated at arrays of floating-point numbers with
+        rigorous error bounds.
+
+        The exported table covers the union of the approximation disks on
+        which approximations of the derivative of order ``derivative`` of this
+        function are known. Where several disks overlap, the approximation
+        associated to the smallest one is used.
+
+        EXAMPLES::
+
+            sage: import numpy
+            sage: from ore_algebra import *
+            sage: from ore_algebra.analytic.function import DFiniteFunction
+            sage: from ore_algebra.analytic.piecewise_eval import load
+            sage: DiffOps, x, Dx = DifferentialOperators()
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: _ = f.approx_array(numpy.linspace(-2, 2, 100))
+            sage: fn = tmp_filename(ext='.npy')
+            sage: f.export(fn)
+            sage: tab = load(fn); tab
+            Table of ... polynomial approximations of degree < ... on [..., ...]
+            sage: pts = numpy.linspace(-2, 2, 1001)
+            sage: val, rad = tab(pts)
+            sage: all(RBF(val[k]).add_error(rad[k]).overlaps(RBF(pts[k]).arctan())
+            ....:     for k in range(0, 1001, 7))
+            True
+            sage: bool(numpy.max(rad) < 1e-12)
+            True
+
+            sage: _ = f.approx_array(numpy.linspace(-2, 2, 100), derivative=1)
+            sage: f.export(fn, derivative=1)
+            sage: val, rad = load(fn)(pts)
+            sage: all(RBF(val[k]).add_error(rad[k]).overlaps(1/(1+RBF(pts[k])^2))
+            ....:     for k in range(0, 1001, 7))
+            True
+        """
+        from . import piecewise_eval
+        if derivative >= self._max_derivatives:
+            raise ValueError("derivative order too large")
+        disks = []
+        for center, approx in iteritems(self._polys):
+            if len(approx) > derivative and QQ(float(center)) == center:
+                disks.append((QQ(self._rad(center)), center,
+                              approx[derivative].pol))
+        ends = sorted(set(c + s*r for r, c, _ in disks for s in (-1, 1)))
+        segments = []
+        for a, b in zip(ends, ends[1:]):
+            containing = [d for d in disks if d[1] - d[0] <= a
+                                              and b <= d[1] + d[0]]
+            if not containing:
+                continue
+            disk = min(containing, key=lambda d: d[0])
+            if segments and segments[-1][2] is disk and segments[-1][1] == a:
+                segments[-1][1] = b
+            else:
+                segments.append([a, b, disk])
+        fact = ZZ(derivative).factorial()
+        RRup = RealField(53, rnd='RNDU')
+        lo, hi, centers, rads, coeffs = [], [], [], [], []
+        for a, b, (_, center, pol) in segments:
+            Balls = pol.base_ring()
+            pol = fact*pol
+            mid = [float(c.mid()) for c in pol]
+            n = len(mid)
+            rho = Balls(max(b - center, center - a))
+            u = Balls.one() >> 53
+            # approximation error and rounding errors on the coefficients
+            err = sum((c - Balls(m)).above_abs()*rho**k
+                      for k, (c, m) in enumerate(zip(pol, mid)))
+            # rounding errors in Horner's rule and in the computation of
+            # x - center
+            gamma = 2*n*u/(1 - 2*n*u)
+            err += gamma*sum(abs(Balls(m))*rho**k for k, m in enumerate(mid))
+            err += u*rho*sum(k*abs(Balls(m))*rho**(k-1)
+                             for k, m in enumerate(mid) if k > 0)
+            lo.append(float(a))
+            hi.append(float(b))
+            centers.append(float(center))
+            rads.append(float(RRup(err.upper())))
+            coeffs.append(mid)
+        piecewise_eval.save(filename, lo, hi, centers, rads, coeffs,
+                            derivative=derivative)
+
     def plot(self, x_range, **options):
         r"""
         Plot this function.
@@ -395,12 +669,11 @@ class DFiniteFunction(object):
             sage: plot(f, (-10, 5), color='black')
             Graphics object consisting of 1 graphics primitive
         """
-        mids = generate_plot_points(
-                lambda x: self.approx(x, 20).mid(),
-                x_range, plot_points=200)
-        ivs = [(x, self.approx(x, 20)) for x, _ in mids]
-        bounds  = [(x, y.upper()) for x, y in ivs]
-        bounds += [(x, y.lower()) for x, y in reversed(ivs)]
+        plot_points = options.pop('plot_points', 400)
+        xs = numpy.linspace(float(x_range[0]), float(x_range[1]), plot_points)
+        val, rad = self.approx_array(xs, prec=20)
+        bounds  = [(x, y + r) for x, y, r in zip(xs, val, rad)]
+        bounds += [(x, y - r) for x, y, r in reversed(list(zip(xs, val, rad)))]
         options.setdefault('aspect_ratio', 'automatic')
         g = plot.polygon(bounds, thickness=1, **options)
         return g
@@ -494,6 +767,48 @@ class DFiniteFunction(object):
         self._update_approx_hook = self._sollya_annotate
         return self._sollya_object
 
+# Number of extra bits of accuracy with which to compute cached initial values
+_ini_acc_margin = 16
+
+_float_eps = float(2)**-53
+
+def _ball_to_floats(ball):
+    r"""
+    Return a pair of floats ``(mid, rad)`` such that the interval ``[mid - rad,
+    mid + rad]`` contains ``ball``.
+    """
+    mid = float(ball.mid())
+    rad = float(ball.rad()) + _float_eps*abs(mid)
+    return mid, rad*(1 + 2*_float_eps)
+
+def _eval_ball_pol(pol, y, dy):
+    r"""
+    Evaluate a polynomial with real ball coefficients at the points ``y ± dy``
+    (NumPy arrays of floats) in floating-point arithmetic.
+
+    Return a pair of arrays ``(val, err)`` such that the value of ``pol`` at the
+    point ``y[k] + delta`` lies in ``[val[k] - err[k], val[k] + err[k]]``
+    whenever ``|delta| <= dy[k]``.
+    """
+    coeff = [_ball_to_floats(c) for c in pol]
+    n = len(coeff)
+    if n == 0:
+        return numpy.zeros(len(y)), numpy.zeros(len(y))
+    mid = [m for m, _ in coeff]
+    absmid = [abs(m) for m in mid]
+    rad = [r for _, r in coeff]
+    dcoeff = [k*(absmid[k] + rad[k]) for k in range(1, n)]
+    ay = numpy.abs(y) + dy
+    val = horner(mid, y)
+    # standard error bound for Horner's rule, plus propagation of the errors
+    # on the coefficients and on the evaluation point
+    gamma = 2*n*_float_eps/(1 - 2*n*_float_eps)
+    err = (horner(rad, ay) + gamma*horner(absmid, ay)
+           + dy*horner(dcoeff, ay))
+    err *= 1 + (4*n + 8)*_float_eps
+    err += n*numpy.nextafter(0., 1.)
+    return val, err
+
 def _guess_prec(pt):
     if isinstance(pt, (RealNumber, ComplexNumber, RealBall, ComplexBall)):
         return pt.parent().precision()
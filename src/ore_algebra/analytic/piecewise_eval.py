@@ -0,0 +1,178 @@
+# -*- coding: utf-8 - vim: tw=80
+r"""
+Standalone evaluation of exported piecewise polynomial approximations
+
+This module reads and evaluates the tables of polynomial approximations written
+by :meth:`ore_algebra.analytic.function.DFiniteFunction.export`. It only
+depends on NumPy, so that it can be copied and used on its own by programs
+that need to evaluate a D-finite function at many points but do not want to
+pay for starting SageMath.
+
+A table covers a union of disjoint segments ``[lo[i], hi[i]]`` sorted in
+increasing order. On each segment, the function is approximated by a
+polynomial in ``x - center[i]`` with floating-point coefficients, and the
+error of the floating-point evaluation of this polynomial at any point of the
+segment (including the approximation error, the rounding errors on the
+coefficients and those of Horner's rule) is bounded by ``rad[i]``.
+
+The table is stored as a single ``.npy`` file containing a two-dimensional
+float64 array, so that it can be memory-mapped. Column 0 is a header; the
+remaining columns correspond to the segments, with rows ``lo``, ``hi``,
+``center``, ``rad`` followed by the coefficients in increasing degree order.
+
+EXAMPLES::
+
+    sage: import numpy
+    sage: from ore_algebra.analytic.piecewise_eval import save, load
+    sage: fn = tmp_filename(ext='.npy')
+    sage: save(fn, lo=[0., 1.], hi=[1., 2.], center=[.5, 1.5], rad=[0., 1e-10],
+    ....:      coeff=[[1., 2.], [3., 0.]])
+    sage: tab = load(fn); tab
+    Table of 2 polynomial approximations of degree < 2 on [0.0, 2.0]
+    sage: val, rad = tab(numpy.array([0., .5, 1.5, 1.75, 3.]))
+    sage: val[:4].tolist(), rad[:4].tolist()
+    ([0.0, 1.0, 3.0, 3.0], [0.0, 0.0, 1e-10, 1e-10])
+    sage: bool(numpy.isnan(val[4])), bool(numpy.isnan(rad[4]))
+    (True, True)
+"""
+
+# Distributed under the terms of the GNU General Public License (GPL) either
+# version 2, or (at your option) any later version
+#
+# http://www.gnu.org/licenses/
+
+import numpy
+
+_MAGIC = 1852794.
+_VERSION = 1.
+_HEADER_SIZE = 5
+
+_ROW_LO, _ROW_HI, _ROW_CENTER, _ROW_RAD, _ROW_COEFF = range(5)
+
+def horner(coeff, y):
+    r"""
+    Evaluate the polynomial with coefficients ``coeff`` (in increasing degree
+    order) at all entries of the NumPy array ``y``.
+
+    The coefficients may themselves be arrays of the same length as ``y``.
+
+    EXAMPLES::
+
+        sage: import numpy
+        sage: from ore_algebra.analytic.piecewise_eval import horner
+        sage: horner([1., 0., 2.], numpy.array([0., 1., 2.]))
+        array([1., 3., 9.])
+    """
+    y = numpy.asarray(y, dtype=float)
+    if len(coeff) == 0:
+        return numpy.zeros(y.shape)
+    acc = numpy.zeros(y.shape)
+    acc += coeff[-1]
+    for c in reversed(coeff[:-1]):
+        acc *= y
+        acc += c
+    return acc
+
+def save(filename, lo, hi, center, rad, coeff, derivative=0):
+    r"""
+    Write a table of polynomial approximations to ``filename``.
+
+    INPUT:
+
+    - ``lo``, ``hi``, ``center``, ``rad`` - sequences of floats of length `n`,
+      see the module documentation
+    - ``coeff`` - sequence of `n` sequences of floats, coefficients of the
+      polynomials in increasing degree order
+    - ``derivative`` - integer recorded in the header (order of the derivative
+      of the function that the table approximates)
+    """
+    n = len(lo)
+    if not (len(hi) == len(center) == len(rad) == len(coeff) == n):
+        raise ValueError("inconsistent table size")
+    if any(hi[i] > lo[i+1] for i in range(n - 1)):
+        raise ValueError("segments must be disjoint and sorted")
+    m = max([len(c) for c in coeff] + [1])
+    data = numpy.zeros((max(_ROW_COEFF + m, _HEADER_SIZE), n + 1))
+    data[:_HEADER_SIZE, 0] = [_MAGIC, _VERSION, n, m, derivative]
+    data[_ROW_LO, 1:] = lo
+    data[_ROW_HI, 1:] = hi
+    data[_ROW_CENTER, 1:] = center
+    data[_ROW_RAD, 1:] = rad
+    for i, c in enumerate(coeff):
+        data[_ROW_COEFF:_ROW_COEFF+len(c), i+1] = c
+    numpy.save(filename, data)
+
+def load(filename, mmap_mode='r'):
+    r"""
+    Load a table of polynomial approximations written by :func:`save`.
+
+    By default, the file is memory-mapped rather than read into memory.
+    """
+    return PiecewisePolynomialTable(numpy.load(filename, mmap_mode=mmap_mode))
+
+class PiecewisePolynomialTable(object):
+    r"""
+    Table of polynomial approximations of a real function, see the module
+    documentation.
+    """
+
+    def __init__(self, data):
+        if data.ndim != 2 or data[0, 0] != _MAGIC:
+            raise ValueError("not a table of polynomial approximations")
+        if data[1, 0] != _VERSION:
+            raise ValueError("unsupported table format version")
+        self.data = data
+        self.size = int(data[2, 0])
+        self.ncoeff = int(data[3, 0])
+        self.derivative = int(data[4, 0])
+        self.lo = data[_ROW_LO, 1:]
+        self.hi = data[_ROW_HI, 1:]
+        self.center = data[_ROW_CENTER, 1:]
+        self.rad = data[_ROW_RAD, 1:]
+        self.coeff = data[_ROW_COEFF:_ROW_COEFF+self.ncoeff, 1:]
+
+    def __repr__(self):
+        return ("Table of {} polynomial approximations of degree < {} "
+                "on [{}, {}]".format(self.size, self.ncoeff, *self.domain()))
+
+    def domain(self):
+        r"""
+        Return the endpoints of the smallest segment containing all the
+        segments covered by the table.
+        """
+        if self.size == 0:
+            return (numpy.nan, numpy.nan)
+        return (float(self.lo[0]), float(self.hi[-1]))
+
+    def segment_index(self, x):
+        r"""
+        Return the indices of the segments containing the entries of ``x``,
+        with -1 for entries that are not covered by the table.
+        """
+        x = numpy.asarray(x, dtype=float)
+        idx = numpy.searchsorted(self.lo, x, 'right') - 1
+        valid = idx >= 0
+        valid[valid] = x[valid] <= self.hi[idx[valid]]
+        idx[~valid] = -1
+        return idx
+
+    def __call__(self, x):
+        r"""
+        Evaluate the approximated function at the entries of the array ``x``.
+
+        Return a pair of arrays ``(val, rad)`` such that the exact value at
+        ``x[k]`` lies in ``[val[k] - rad[k], val[k] + rad[k]]``. Both entries
+        are NaN at points that are not covered by the table.
+        """
+        x = numpy.asarray(x, dtype=float)
+        shape = x.shape
+        x = x.ravel()
+        idx = self.segment_index(x)
+        val = numpy.full(len(x), numpy.nan)
+        rad = numpy.full(len(x), numpy.nan)
+        ok = numpy.flatnonzero(idx >= 0)
+        seg = idx[ok]
+        y = x[ok] - self.center[seg]
+        val[ok] = horner([c[seg] for c in self.coeff], y)
+        rad[ok] = self.rad[seg]
+        return val.reshape(shape), rad.reshape(shape)
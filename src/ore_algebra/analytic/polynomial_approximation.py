@@ -22,18 +22,21 @@ Rigorous approximation of D-finite functions by polynomials
 
 from six.moves import range
 
-import logging
+import bisect, logging
 logger = logging.getLogger(__name__)
 
 import sage.rings.real_arb
 import sage.rings.complex_arb
 
+from sage.parallel.decorate import parallel
+from sage.rings.integer_ring import ZZ
 from sage.rings.rational_field import QQ
+from sage.rings.real_mpfi import RealIntervalField
 
 from . import accuracy, analytic_continuation as ancont, bounds, utilities
 
 from .naive_sum import series_sum
-from .path import EvaluationPoint, Path
+from .path import EvaluationPoint, Path, Point
 from .safe_cmp import *
 
 def combine_radii(pol):
@@ -267,10 +270,16 @@ def on_disk(dop, ini, path, rad, eps):
     # complex x). (TBI!)
     return doit(dop, ini, path, rad, eps, 1, taylor_economization, False)[0]
 
-def on_interval(dop, ini, path, eps, rad=None):
+def on_interval(dop, ini, path, eps, rad=None, tiling=False, ncpus=1):
     r"""
     Compute a polynomial approximation of a solution of ``dop`` on a segment.
 
+    When ``tiling`` is ``True``, the last element of ``path`` must be a
+    segment, which is covered by several disks adapted to the distance to the
+    singular points of ``dop``. The approximations on the individual disks are
+    then computed by up to ``ncpus`` parallel processes, and the result is a
+    :class:`PiecewisePolynomialApproximation`.
+
     EXAMPLES::
 
         sage: from ore_algebra import *
@@ -302,7 +311,36 @@ def on_interval(dop, ini, path, eps, rad=None):
         ....:         ini=[1/(gamma(2/3)*3^(2/3)), -1/(gamma(1/3)*3^(1/3))],
         ....:         path=[0,[-1,1]], eps=1e-8)
         sage: _test_fun_approx(pol, lambda x: RBF(CBF(x).airy_ai()), interval_rad=1)
+
+    Tiling mode::
+
+        sage: dop = (x^2 + 1)*Dx^2 + 2*x*Dx
+        sage: pw = polapprox.on_interval(dop, [0, 1], [0, [-3, 3]], 1e-10,
+        ....:                            tiling=True)
+        sage: pw
+        Piecewise polynomial approximation on [-3, 3] (... pieces)
+        sage: all(pw(t).overlaps(t.arctan())
+        ....:     for t in [RBF(k/7) for k in range(-21, 22)])
+        True
+        sage: pw2 = polapprox.on_interval(dop, [0, 1], [0, [-3, 3]], 1e-10,
+        ....:                             tiling=True, ncpus=2)
+        sage: pw2.breakpoints == pw.breakpoints
+        True
+        sage: polapprox.on_interval(dop, [0, 1], [0], 1e-10, rad=1, tiling=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: tiling mode chooses the radii itself, specify the segment at the end of the path instead of rad
+        sage: polapprox.on_interval(dop, [0, 1], [0], 1e-10, tiling=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: tiling mode requires a segment at the end of the path
     """
+    if tiling:
+        if rad is not None:
+            raise ValueError("tiling mode chooses the radii itself, specify "
+                             "the segment at the end of the path instead of "
+                             "rad")
+        return piecewise_on_interval(dop, ini, path, eps, ncpus=ncpus)
     if rad is None:
         try:
             left, right = path[-1]
@@ -315,6 +353,195 @@ def on_interval(dop, ini, path, eps, rad=None):
         mypath = path
     return doit(dop, ini, mypath, rad, eps, 1, chebyshev_economization, True)[0]
 
+class PiecewisePolynomialApproximation(object):
+    r"""
+    Piecewise polynomial approximation of a function on a real segment.
+
+    The segment ``[breakpoints[0], breakpoints[-1]]`` is split into pieces
+    ``[breakpoints[i], breakpoints[i+1]]``. On the ``i``-th piece, the function
+    is approximated by ``polys[i](x - centers[i])``, where the polynomials
+    have real ball coefficients and include a bound on the approximation error.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import *
+        sage: from ore_algebra.analytic import polynomial_approximation as polapprox
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: pw = polapprox.piecewise_on_interval(Dx - 1, [1], [0, [0, 10]],
+        ....:                                      1e-20)
+        sage: pw(RBF(7.5))
+        [1808.04241445...]
+        sage: pw(RBF(7.5)).overlaps(RBF(7.5).exp())
+        True
+        sage: pw(RBF(5, 0.5)).overlaps(RBF(5.4).exp())
+        True
+        sage: pw(11)
+        Traceback (most recent call last):
+        ...
+        ValueError: point outside the approximation domain
+    """
+
+    def __init__(self, breakpoints, centers, polys):
+        assert len(breakpoints) == len(centers) + 1 == len(polys) + 1
+        self.breakpoints = breakpoints
+        self.centers = centers
+        self.polys = polys
+        self._Balls = polys[0].base_ring()
+        self._Ivs = RealIntervalField(self._Balls.precision())
+
+    def __repr__(self):
+        return "Piecewise polynomial approximation on [{}, {}] ({} pieces)".format(
+                self.breakpoints[0], self.breakpoints[-1], len(self))
+
+    def __len__(self):
+        return len(self.polys)
+
+    def _index(self, x):
+        if not self.breakpoints[0] <= x <= self.breakpoints[-1]:
+            raise ValueError("point outside the approximation domain")
+        i = bisect.bisect_right(self.breakpoints, x) - 1
+        return min(i, len(self.polys) - 1)
+
+    def __call__(self, x):
+        x = self._Balls(x)
+        lo = self._index(x.lower())
+        hi = self._index(x.upper())
+        val = None
+        for i in range(lo, hi + 1):
+            dom = self._Ivs(self.breakpoints[i], self.breakpoints[i+1])
+            dom = self._Balls(dom.intersection(self._Ivs(x)))
+            img = self.polys[i](dom - self.centers[i])
+            val = img if val is None else val.union(img)
+        return val
+
+def tiling(dop, left, right, max_rad=None):
+    r"""
+    Cover the segment ``[left, right]`` by disks adapted to the distance to the
+    singular points of ``dop``.
+
+    Return a list of pairs ``(center, rad)`` of rational numbers such that the
+    real segments ``[center - rad, center + rad]`` form a partition of
+    ``[left, right]``, and that the distance from each center to the nearest
+    singular point is at least twice the corresponding radius. The radii are
+    powers of two except for the last one, and never exceed ``max_rad``. If
+    ``dop`` has no finite singular points and ``max_rad`` is not given, the
+    whole segment is covered by a single disk.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import *
+        sage: from ore_algebra.analytic.polynomial_approximation import tiling
+        sage: Dops, x, Dx = DifferentialOperators()
+        sage: tiling((x^2 + 1)*Dx^2 + 2*x*Dx, 0, 3)
+        [(1/4, 1/4), (3/4, 1/4), (5/4, 1/4), (2, 1/2), (11/4, 1/4)]
+        sage: tiling(Dx - 1, 0, 3)
+        [(3/2, 3/2)]
+        sage: tiling(Dx - 1, 0, 3, max_rad=5)
+        [(1, 1), (5/2, 1/2)]
+        sage: tiling(x*Dx - 1, -1, 1)
+        Traceback (most recent call last):
+        ...
+        ValueError: singular point in the approximation domain
+    """
+    from .differential_operator import DifferentialOperator
+    dop = DifferentialOperator(dop)
+    left, right = QQ(left), QQ(right)
+    if not left < right:
+        raise ValueError("empty segment")
+    dom = accuracy.IC(accuracy.IR(left).union(accuracy.IR(right)))
+    if any(s.overlaps(dom) for s in dop._singularities(accuracy.IC)):
+        raise ValueError("singular point in the approximation domain")
+    if max_rad is None:
+        max_rad = accuracy.IR('inf')
+    tiles = []
+    cur = left
+    while cur < right:
+        # Any disk of radius dist/3 whose leftmost point is cur stays at
+        # distance at least twice its radius from the singularities
+        dist = Point(cur, dop).dist_to_sing().min(accuracy.IR(max_rad))
+        if dist.is_finite():
+            expo = ZZ((dist/3).log(2).lower().floor())
+            rad = QQ(2)**expo
+        else: # no singular points and no max_rad
+            rad = right - cur
+        if cur + 2*rad >= right:
+            rad = (right - cur)/2
+        tiles.append((cur + rad, rad))
+        cur += 2*rad
+    return tiles
+
+def piecewise_on_interval(dop, ini, path, eps, max_rad=None, ncpus=1):
+    r"""
+    Compute a piecewise polynomial approximation of a solution of ``dop`` on
+    a segment.
+
+    The last element of ``path`` should be a segment ``[left, right]``. The
+    segment is split using :func:`tiling`, initial values at the centers of the
+    tiles are computed by a single analytic continuation along ``path``, and
+    the polynomial approximations on the tiles are then computed independently
+    from each other, by up to ``ncpus`` parallel processes.
+
+    OUTPUT:
+
+    A :class:`PiecewisePolynomialApproximation`.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import *
+        sage: from ore_algebra.analytic import polynomial_approximation as polapprox
+        sage: Dops, x, Dx = DifferentialOperators()
+
+        sage: pw = polapprox.piecewise_on_interval(Dx^2 - x,
+        ....:         ini=[1/(gamma(2/3)*3^(2/3)), -1/(gamma(1/3)*3^(1/3))],
+        ....:         path=[0, [-5, 2]], eps=1e-15, ncpus=2)
+        sage: all(pw(t).overlaps(RBF(CBF(t).airy_ai()))
+        ....:     for t in [RBF(k/10) for k in range(-50, 21)])
+        True
+    """
+    from .differential_operator import DifferentialOperator
+    dop = DifferentialOperator(dop)
+
+    try:
+        left, right = path[-1]
+    except TypeError:
+        raise ValueError("tiling mode requires a segment at the end of the "
+                         "path")
+    if max_rad is None:
+        max_rad = accuracy.IR('inf')
+        if dop.leading_coefficient().is_constant():
+            # see DFiniteFunction.__init__
+            kappa, alpha = bounds.growth_parameters(dop)
+            max_rad = max_rad.min(1/(alpha*accuracy.IR(kappa)**kappa))
+    tiles = tiling(dop, left, right, max_rad)
+    centers = [c for c, _ in tiles]
+    logger.info("%s tiles on [%s, %s]", len(tiles), left, right)
+
+    ctx = ancont.Context(keep="all")
+    sol = ancont.analytic_continuation(dop, list(path[:-1]) + centers,
+                                       accuracy.IR(eps)/4, ctx, ini=ini)
+    values = {rec["point"]: rec["value"] for rec in sol}
+    local_ini = [[c[0] for c in values[center]] for center in centers]
+
+    def piece(center, rad, ini):
+        return doit(dop, ini, [center], rad, eps, 1, chebyshev_economization,
+                    True)[0]
+
+    if ncpus == 1:
+        polys = [piece(c, r, ini) for (c, r), ini in zip(tiles, local_ini)]
+    else:
+        forked_piece = parallel(ncpus=ncpus)(piece)
+        args = [(c, r, ini) for (c, r), ini in zip(tiles, local_ini)]
+        res = {}
+        for (arg, _), pol in forked_piece(args):
+            if isinstance(pol, str): # the worker failed
+                raise RuntimeError("failed to compute the approximation on "
+                                   "the disk centered at {}".format(arg[0]))
+            res[arg[0]] = pol
+        polys = [res[c] for c in centers]
+
+    breakpoints = [left] + [c + r for c, r in tiles]
+    return PiecewisePolynomialApproximation(breakpoints, centers, polys)
+
 def _test_fun_approx(pol, ref, disk_rad=None, interval_rad=None,
         prec=53, test_count=100):
     r"""
@@ -0,0 +1,184 @@
+r"""
+Benchmarks
+
+Timing helpers for comparing the algorithms that ore_algebra provides for some
+operations, e.g., specialized arithmetic kernels against the generic code they
+replace. The functions in this module return the
+measured timings as a list of tuples, so that they can be stored or compared
+across versions, and optionally print them as a table.
+
+EXAMPLES::
+
+    sage: from ore_algebra.benchmarks import bench_mul
+    sage: res = bench_mul(algebras=['D', 'S'], orders=[2], degrees=[3], repeat=1, verbose=False)
+    sage: [(alg, r, d) for (alg, r, d, _, _) in res]
+    [('D', 2, 3), ('S', 2, 3)]
+"""
+
+#############################################################################
+#                                                                           #
+#  Distributed under the terms of the GNU General Public License (GPL)      #
+#  either version 2, or (at your option) any later version                  #
+#                                                                           #
+#  http://www.gnu.org/licenses/                                             #
+#############################################################################
+
+from __future__ import absolute_import, print_function
+
+from sage.misc.misc import cputime
+from sage.misc.randstate import set_random_seed
+from sage.rings.integer_ring import ZZ
+from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
+
+from .ore_algebra import OreAlgebra
+
+_mul_algebras = {'D': ('Dx', {}), 'S': ('Sx', {}), 'T': ('Tx', {}), 'Q': ('Qx', {'q': 3})}
+
+def _timeit(fun, repeat):
+    best = None
+    for _ in range(repeat):
+        t = cputime()
+        res = fun()
+        t = cputime(t)
+        if best is None or t < best:
+            best = t
+    return res, best
+
+def random_operator(A, order, degree):
+    r"""
+    Return a random operator of the given order whose coefficients are
+    random polynomials of degree at most the given degree, with a leading
+    coefficient of degree exactly ``degree``.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import OreAlgebra
+        sage: from ore_algebra.benchmarks import random_operator
+        sage: A.<Dx> = OreAlgebra(ZZ['x'], 'Dx')
+        sage: L = random_operator(A, 3, 2)
+        sage: L.order(), L.degree()
+        (3, 2)
+    """
+    R = A.base_ring()
+    x = R.gen()
+    coeffs = [R.random_element(degree) for _ in range(order)]
+    coeffs.append(x**degree + R.random_element(degree - 1) if degree > 0 else R.one())
+    return A(coeffs)
+
+def bench_mul(algebras=('D', 'S', 'T'), orders=(2, 4, 8, 16), degrees=(2, 8, 32),
+              base_ring=ZZ, repeat=3, seed=0, verbose=True):
+    r"""
+    Compare the multiplication kernels of univariate Ore operators with the
+    generic multiplication loop.
+
+    For each algebra, order `r` and degree `d`, two random operators of order
+    `r` and degree `d` are multiplied using ``*`` and using
+    :meth:`~ore_algebra.ore_operator.UnivariateOreOperator._mul_generic`.
+    The results are checked to agree.
+
+    INPUT:
+
+    - ``algebras`` - list of algebra types among ``'D'`` (derivation),
+      ``'S'`` (shift), ``'T'`` (Euler derivation) and ``'Q'`` (`q`-shift with
+      `q=3`)
+    - ``orders``, ``degrees`` - lists of orders and degrees to test
+    - ``base_ring`` - coefficient ring of the polynomials
+    - ``repeat`` - number of runs of each multiplication; the best time is kept
+    - ``seed`` - random seed used to create the operators
+    - ``verbose`` - whether to print a table of timings
+
+    OUTPUT:
+
+    A list of tuples ``(algebra, order, degree, time, generic_time)``, where
+    times are in seconds of cpu time.
+
+    EXAMPLES::
+
+        sage: from ore_algebra.benchmarks import bench_mul
+        sage: _ = bench_mul(algebras=['T'], orders=[1, 3], degrees=[2], repeat=1)
+        alg  order  degree  kernel    generic   speedup
+        T    1      2       ...
+        T    3      2       ...
+        sage: _ = bench_mul(orders=[4, 8, 16, 32], degrees=[8, 32, 128]) # not tested
+    """
+    R = PolynomialRing(base_ring, 'x')
+    res = []
+    if verbose:
+        print("{:<4} {:<6} {:<7} {:<9} {:<9} {}".format(
+            "alg", "order", "degree", "kernel", "generic", "speedup"))
+    set_random_seed(seed)
+    for alg in algebras:
+        gen, kwds = _mul_algebras[alg]
+        A = OreAlgebra(R, gen, **kwds)
+        for r in orders:
+            for d in degrees:
+                L = random_operator(A, r, d)
+                M = random_operator(A, r, d)
+                P, t = _timeit(lambda: L*M, repeat)
+                Q, t0 = _timeit(lambda: L._mul_generic(M), repeat)
+                if P != Q:
+                    raise AssertionError("kernel and generic products differ")
+                res.append((alg, r, d, t, t0))
+                if verbose:
+                    print("{:<4} {:<6} {:<7} {:<9.4f} {:<9.4f} {:.1f}".format(
+                        alg, r, d, t, t0, t0/t if t else float('inf')))
+    return res
+
+def _example_operator_pairs():
+    from .examples import fcc, ssw, stdfun
+    return [("stdfun: arctan, dawson", stdfun.arctan.dop, stdfun.dawson.dop),
+            ("stdfun: airy, erf", stdfun.airy_ai.dop, stdfun.erf.dop),
+            ("ssw: dop[1,0,0], dop[2,0,0]", ssw.dop[1,0,0], ssw.dop[2,0,0]),
+            ("ssw: dop[3,0,0], dop[4,0,0]", ssw.dop[3,0,0], ssw.dop[4,0,0]),
+            ("fcc: dop4, dop5", fcc.dop4, fcc.dop5)]
+
+def bench_lclm(pairs=None, algorithms=('linalg', 'euclid', 'guess', 'modular', 'auto'),
+               repeat=1, verbose=True):
+    r"""
+    Compare the lclm algorithms on pairs of operators.
+
+    INPUT:
+
+    - ``pairs`` - list of triples ``(name, L1, L2)``; by default, pairs of
+      differential operators taken from :mod:`ore_algebra.examples`
+    - ``algorithms`` - list of values of the ``algorithm`` argument of
+      :meth:`~ore_algebra.ore_operator.UnivariateOreOperator.lclm` to compare
+    - ``repeat`` - number of runs of each computation; the best time is kept
+    - ``verbose`` - whether to print a table of timings
+
+    OUTPUT:
+
+    A list of tuples ``(name, algorithm, time)``, with times in seconds of cpu
+    time. The results of all algorithms are checked to agree up to
+    normalization.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import DifferentialOperators
+        sage: from ore_algebra.benchmarks import bench_lclm
+        sage: Dops, x, Dx = DifferentialOperators(QQ, 'x')
+        sage: _ = bench_lclm([("small", Dx - x, (x + 1)*Dx^2 + 1)], ['linalg', 'modular'])
+        pair   algorithm  time
+        small  linalg     ...
+        small  modular    ...
+        sage: _ = bench_lclm() # not tested
+    """
+    if pairs is None:
+        pairs = _example_operator_pairs()
+    width = max(len(name) for name, _, _ in pairs)
+    res = []
+    if verbose:
+        print("{:<{w}}  {:<9}  {}".format("pair", "algorithm", "time", w=width))
+    for name, L1, L2 in pairs:
+        ref = None
+        for alg in algorithms:
+            L, t = _timeit(lambda: L1.lclm(L2, algorithm=alg), repeat)
+            L = L.numerator().normalize()
+            if ref is None:
+                ref = L
+            elif L != ref:
+                raise AssertionError("lclm algorithms disagree on " + name)
+            res.append((name, alg, t))
+            if verbose:
+                print("{:<{w}}  {:<9}  {:.4f}".format(name, alg, t, w=width))
+    return res
@@ -37,6 +37,7 @@ AUTHOR:
 
 from __future__ import absolute_import, division, print_function
 
+import heapq
 import pprint
 
 from copy import copy
@@ -69,7 +70,7 @@ class DFiniteFunctionRing(Algebra):
     
 # constructor
     
-    def __init__(self, ore_algebra, domain = NN, name=None, element_class=None, category=None):
+    def __init__(self, ore_algebra, domain = NN, name=None, element_class=None, category=None, closure_algorithm="linalg"):
         r"""
         Constuctor for a D-finite function ring.
         
@@ -82,6 +83,10 @@ class DFiniteFunctionRing(Algebra):
             i.e. if the domain is ``ZZ``also negative sequence inidices exist.
             So far for d-finite sequences ``NN`` and ``ZZ`` are supported and for D-finite
             functions only ``NN``is supported.
+        - ``closure_algorithm`` (default ``"linalg"``) -- how the annihilating operators of sums and products
+            are computed: ``"linalg"`` uses the methods ``lclm`` and ``symmetric_product`` of the Ore algebra,
+            which make an ansatz over the base ring; ``"guess"`` guesses the operators from terms computed
+            modulo a prime and then over the rationals and verifies them (see ``closure_algorithm``).
         
         OUTPUT:
         
@@ -106,6 +111,9 @@ class DFiniteFunctionRing(Algebra):
         """
         if domain != ZZ and domain != NN:
             raise TypeError("Domain does not fit")
+        if closure_algorithm not in ("linalg", "guess"):
+            raise ValueError("unknown closure algorithm: " + str(closure_algorithm))
+        self._closure_algorithm = closure_algorithm
         
         self._ore_algebra = ore_algebra
         self._base_ring = ore_algebra.base_ring()
@@ -398,7 +406,7 @@ class DFiniteFunctionRing(Algebra):
             int_val = {n:(x.derivative(n)(0)/factorial(n)) for n in initial_val}
             
             #getting the coefficient sequence
-            seq = UnivariateDFiniteSequence(DFiniteFunctionRing(OreAlg,NN),s_ann, int_val)
+            seq = UnivariateDFiniteSequence(DFiniteFunctionRing(OreAlg,NN,closure_algorithm=self._closure_algorithm),s_ann, int_val)
                 
             return UnivariateDFiniteFunction(self,ann,seq)
     
@@ -679,6 +687,63 @@ class DFiniteFunctionRing(Algebra):
         """
         return self._domain
 
+    def closure_algorithm(self):
+        r"""
+        Return the algorithm used for computing the annihilating operators of sums and products of elements
+        of ``self``.
+
+        With ``"linalg"``, the operators are computed by the methods ``lclm`` and ``symmetric_product`` of the
+        Ore algebra. With ``"guess"``, they are obtained with a guess-and-verify strategy: a few hundred terms of
+        random solutions of the operands are computed modulo a prime and combined, the order and degree of
+        the result are guessed from them, the operator is guessed from just enough terms over the rationals
+        and finally checked to be a left multiple of the operands (for sums) or to annihilate the products
+        of their solutions (for products). If the check fails, ``"linalg"`` is used instead. This applies to
+        ``_add_``, ``_mul_``, ``cauchy_product`` and ``hadamard_product``, and to lazy expressions.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: A = OreAlgebra(QQ['n'],'Sn')
+            sage: D = DFiniteFunctionRing(A, closure_algorithm="guess")
+            sage: D.closure_algorithm()
+            'guess'
+            sage: n = A.base_ring().gen()
+            sage: a = UnivariateDFiniteSequence(D, "Sn^2 - Sn - 1", [0,1])
+            sage: b = D(harmonic_number(n))
+            sage: (a + b).expand(8)
+            [0, 2, 5/2, 23/6, 61/12, 437/60, 209/20, 2183/140, 6641/280]
+            sage: (a*b).expand(5) == [a[k]*b[k] for k in range(6)]
+            True
+
+        """
+        return self._closure_algorithm
+
+    def _lclm(self, L, M):
+        r"""
+        Return the lclm of the operators ``L`` and ``M`` using the closure algorithm of ``self``.
+        """
+        if self._closure_algorithm == "guess":
+            try:
+                result = L._closure_guess(M, "lclm")
+                if result is not None:
+                    return result
+            except (TypeError, ValueError, ZeroDivisionError, ArithmeticError):
+                pass
+        return L.lclm(M)
+
+    def _symmetric_product(self, L, M):
+        r"""
+        Return the symmetric product of the operators ``L`` and ``M`` using the closure algorithm of ``self``.
+        """
+        if self._closure_algorithm == "guess":
+            try:
+                result = L._closure_guess(M, "symmetric_product")
+                if result is not None:
+                    return result
+            except (TypeError, ValueError, ZeroDivisionError, ArithmeticError):
+                pass
+        return L.symmetric_product(M)
+
     def characteristic(self):
         r"""
         Return the characteristic of this DFiniteFunctionRing, which is the
@@ -769,7 +834,7 @@ class DFiniteFunctionRing(Algebra):
         if R is self._base_ring:
             return self
         else:
-            D = DFiniteFunctionRing(self._ore_algebra.change_ring(R), self._domain)
+            D = DFiniteFunctionRing(self._ore_algebra.change_ring(R), self._domain, closure_algorithm=self._closure_algorithm)
             return D
 
     def change_domain(self,R):
@@ -782,7 +847,7 @@ class DFiniteFunctionRing(Algebra):
         if self.domain() == R:
             return self
 
-        return DFiniteFunctionRing(self.ore_algebra(), R)
+        return DFiniteFunctionRing(self.ore_algebra(), R, closure_algorithm=self._closure_algorithm)
 
 
 ####################################################################################################
@@ -869,7 +934,7 @@ class DFiniteFunction(RingElement):
                     raise ValueError("not enough initial conditions given")
                 R = parent.ore_algebra().base_ring().change_var('n')
                 A = OreAlgebra(R,'Sn')
-                D = DFiniteFunctionRing(A,NN)
+                D = DFiniteFunctionRing(A,NN,closure_algorithm=parent._closure_algorithm)
                 ann = self.__ann.to_S(A)
                 self._initial_values = UnivariateDFiniteSequence(D, ann, initial_val)
         
@@ -883,6 +948,52 @@ class DFiniteFunction(RingElement):
         """
         return self
 
+    def lazy(self):
+        r"""
+        Return ``self`` as a leaf of a lazy arithmetic expression.
+
+        Sums, differences and products of lazy expressions are not evaluated immediately. Instead, the expression is
+        recorded, nested sums and products are fused, and the annihilating operator is only computed when the
+        expression is materialized. See ``LazyDFiniteExpression``.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: A = OreAlgebra(QQ['n'],'Sn')
+            sage: D = DFiniteFunctionRing(A)
+            sage: n = A.base_ring().gen()
+            sage: a = D(n)
+            sage: b = UnivariateDFiniteSequence(D, "Sn - 2", [1])
+            sage: c = UnivariateDFiniteSequence(D, "Sn^2 - Sn - 1", [0,1])
+            sage: e = a.lazy()*b + c - a
+            sage: e
+            Lazy sum of 3 D-finite sequences
+            sage: e.annihilator().order() <= 4
+            True
+            sage: e.expand(8) == [a[k]*b[k] + c[k] - a[k] for k in range(9)]
+            True
+
+        """
+        return LazyDFiniteExpression(self.parent(), "leaf", value=self)
+
+    # Mixed arithmetic with lazy expressions: the coercion model does not know about LazyDFiniteExpression, so
+    # we hand these operations over to the expression, which keeps the result unevaluated.
+
+    def __add__(self, right):
+        if isinstance(right, LazyDFiniteExpression):
+            return right.__radd__(self)
+        return super(DFiniteFunction, self).__add__(right)
+
+    def __sub__(self, right):
+        if isinstance(right, LazyDFiniteExpression):
+            return right.__rsub__(self)
+        return super(DFiniteFunction, self).__sub__(right)
+
+    def __mul__(self, right):
+        if isinstance(right, LazyDFiniteExpression):
+            return right.__rmul__(self)
+        return super(DFiniteFunction, self).__mul__(right)
+
 # action
 
     def compress(self):
@@ -1736,6 +1847,68 @@ class DFiniteFunction(RingElement):
         return self._initial_values
 
 #############################################################################################################
+
+class _TermCache(object):
+    r"""
+    Store of already computed terms of a D-finite sequence.
+
+    The store consists of a dense prefix, which contains the terms with indices
+    `0, 1, \dots, m-1` as computed by ``expand``, and of a bounded number of
+    checkpoints. A checkpoint at index `k` is the vector of the `r` terms with
+    indices `k, \dots, k+r-1`, where `r` is the order of the annihilating
+    operator, from which the computation of any later term can be resumed.
+    Checkpoints are taken at the multiples of ``interval``; when there are
+    more than ``max_checkpoints`` of them, the least recently used one is
+    discarded.
+    """
+
+    def __init__(self, prefix_length=1024, interval=256, max_checkpoints=64):
+        self.prefix_length = prefix_length
+        self.interval = interval
+        self.max_checkpoints = max_checkpoints
+        self.clear()
+
+    def clear(self):
+        self.prefix = []
+        self.checkpoints = {}
+        self._last_use = {}
+        self._clock = 0
+
+    def update_prefix(self, terms):
+        if len(terms) > len(self.prefix):
+            self.prefix = terms[:self.prefix_length]
+
+    def nearest_checkpoint(self, n, order):
+        r"""
+        Return the pair `(k, state)` where `k \leq n` is the largest index for
+        which the terms `k, \dots, k+r-1` are known, or ``None``.
+        """
+        best = None
+        m = len(self.prefix)
+        if order <= m and None not in self.prefix[m-order:]:
+            k = min(m - order, n)
+            best = (k, self.prefix[k:k+order])
+        keys = [k for k in self.checkpoints if k <= n]
+        if keys:
+            k = max(keys)
+            if best is None or k > best[0]:
+                best = (k, self.checkpoints[k])
+                self._clock += 1
+                self._last_use[k] = self._clock
+        return best
+
+    def add_checkpoint(self, k, state):
+        if self.max_checkpoints <= 0 or None in state:
+            return
+        if k not in self.checkpoints and len(self.checkpoints) >= self.max_checkpoints:
+            oldest = min(self.checkpoints, key=lambda j: self._last_use[j])
+            del self.checkpoints[oldest]
+            del self._last_use[oldest]
+        self.checkpoints[k] = list(state)
+        self._clock += 1
+        self._last_use[k] = self._clock
+
+#############################################################################################################
     
 class UnivariateDFiniteSequence(DFiniteFunction):
     r"""
@@ -2055,53 +2228,70 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         D = DFiniteFunctionRing(A)
         return UnivariateDFiniteFunction(D,self.ann().to_D(A),self)
     
-    def __add_without_compress__(self,right):
+    def _combine(self, ann, operands, op):
         r"""
-        Adds the D-finite sequences ``self`` and ``right`` without automatically trying
-        to compress the result. This method is called whenever equality testing is done
-        because in that case compressing the result would be unnecessary work.
+        Return the D-finite sequence annihilated by (a left multiple of) ``ann`` whose n-th term is ``op`` applied to
+        the list of the n-th terms of the sequences in ``operands``, or ``None`` if one of those terms is ``None``.
+
+        The initial values and the values at the singularities of ``ann`` and at the critical points of the operands are
+        computed from the terms of the operands. This is the common part of ``_add_``, ``_mul_`` and of the lazy
+        evaluation of sums and products, see ``lazy``.
         """
         #getting the operator
         N = self.parent().base_ring().gen()
         A = self.parent().ore_algebra()
-        sum_ann = self.ann().lclm(right.ann())
-        
+
+        terms = {}
+        def term(n):
+            if n not in terms:
+                values = [a[n] for a in operands]
+                terms[n] = op(values) if all(x is not None for x in values) else None
+            return terms[n]
+
         #getting the largest and smallest degree of the operator
-        ord = sum_ann.order()
-        min_degree = next((index for index, coeff in enumerate(sum_ann.list()) if coeff != 0), None)
+        ord = ann.order()
+        min_degree = next((index for index, coeff in enumerate(ann.list()) if coeff != 0), None)
 
         #initial values and singularities of the new operator
-        singularities_positive = sum_ann.singularities()
+        singularities_positive = ann.singularities()
         singularities_negative = set()
         if self.parent()._backward_calculation is True:
-            singularities_negative = set([i for i in sum_ann.singularities(True) if i < 0])
-    
+            singularities_negative = set([i for i in ann.singularities(True) if i < 0])
+
         initial_val = set(range(ord)).union(singularities_positive, singularities_negative)
-        int_val_sum = {n:self[n] + right[n] if (self[n] is not None and right[n] is not None) else None for n in initial_val}
+        int_val = {n:term(n) for n in initial_val}
 
         #critical points for forward calculation
-        critical_points_positive = self.critical_points(ord).union( right.critical_points(ord) )
+        critical_points_positive = set().union(*[a.critical_points(ord) for a in operands])
         for n in singularities_positive:
             critical_points_positive.update(range(n+1,n+ord+1))
-        
+
         for n in critical_points_positive:
-            int_val_sum.update({n:self[n] + right[n] if (self[n] is not None and right[n] is not None) else None})
-            sum_ann = A(N - (n - ord) )*sum_ann
+            int_val.update({n:term(n)})
+            ann = A(N - (n - ord) )*ann
             if self.parent()._backward_calculation is True and n < ord - min_degree:
-                int_val_sum.update({(n-ord)+min_degree: self[(n-ord)+min_degree] + right[(n-ord)+min_degree] if (self[(n-ord)+min_degree] is not None and right[(n-ord)+min_degree] is not None) else None})
-        
+                int_val.update({(n-ord)+min_degree: term((n-ord)+min_degree)})
+
         #critical points for backward calculation
-        critical_points_negative = self.critical_points(ord,True).union( right.critical_points(ord,True) )
+        critical_points_negative = set().union(*[a.critical_points(ord,True) for a in operands])
         for n in singularities_negative:
             critical_points_negative.update(range(n-ord,n))
-            
+
         for n in critical_points_negative:
-            int_val_sum.update({n:self[n] + right[n] if (self[n] is not None and right[n] is not None) else None})
-            sum_ann = A(N - (n - min_degree) )*sum_ann
+            int_val.update({n:term(n)})
+            ann = A(N - (n - min_degree) )*ann
             if n >= min_degree:
-                int_val_sum.update({(n-min_degree)+ord:self[(n-min_degree)+ord] + right[(n-min_degree)+ord] if (self[(n-min_degree)+ord] is not None and right[(n-min_degree)+ord] is not None) else None})
-                
-        return UnivariateDFiniteSequence(self.parent(), sum_ann, int_val_sum)
+                int_val.update({(n-min_degree)+ord:term((n-min_degree)+ord)})
+
+        return UnivariateDFiniteSequence(self.parent(), ann, int_val)
+
+    def __add_without_compress__(self,right):
+        r"""
+        Adds the D-finite sequences ``self`` and ``right`` without automatically trying
+        to compress the result. This method is called whenever equality testing is done
+        because in that case compressing the result would be unnecessary work.
+        """
+        return self._combine(self.parent()._lclm(self.ann(), right.ann()), [self, right], sum)
 
 #arithmetic
 
@@ -2134,49 +2324,7 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         if right.__is_zero__():
             return self
         
-        #getting the operator
-        N = self.parent().base_ring().gen()
-        A = self.parent().ore_algebra()
-        sum_ann = self.ann().lclm(right.ann())
-        
-        #getting the largest and smallest degree of the operator
-        ord = sum_ann.order()
-        min_degree = next((index for index, coeff in enumerate(sum_ann.list()) if coeff != 0), None)
-
-        #initial values and singularities of the new operator
-        singularities_positive = sum_ann.singularities()
-        singularities_negative = set()
-        if self.parent()._backward_calculation is True:
-            singularities_negative = set([i for i in sum_ann.singularities(True) if i < 0])
-    
-        initial_val = set(range(ord)).union(singularities_positive, singularities_negative)
-        int_val_sum = {n:self[n] + right[n] if (self[n] != None and right[n] != None) else None for n in initial_val}
-
-        #critical points for forward calculation
-        critical_points_positive = self.critical_points(ord).union( right.critical_points(ord) )
-        for n in singularities_positive:
-            critical_points_positive.update(range(n+1,n+ord+1))
-        
-        for n in critical_points_positive:
-            int_val_sum.update({n:self[n] + right[n] if (self[n] != None and right[n] != None) else None})
-            sum_ann = A(N - (n - ord) )*sum_ann
-            if self.parent()._backward_calculation is True and n < ord - min_degree:
-                int_val_sum.update({(n-ord)+min_degree: self[(n-ord)+min_degree] + right[(n-ord)+min_degree] if (self[(n-ord)+min_degree] != None and right[(n-ord)+min_degree] != None) else None})
-        
-        #critical points for backward calculation
-        critical_points_negative = self.critical_points(ord,True).union( right.critical_points(ord,True) )
-        for n in singularities_negative:
-            critical_points_negative.update(range(n-ord,n))
-            
-        for n in critical_points_negative:
-            int_val_sum.update({n:self[n] + right[n] if (self[n] != None and right[n] != None) else None})
-            sum_ann = A(N - (n - min_degree) )*sum_ann
-            if n >= min_degree:
-                int_val_sum.update({(n-min_degree)+ord:self[(n-min_degree)+ord] + right[(n-min_degree)+ord] if (self[(n-min_degree)+ord] != None and right[(n-min_degree)+ord] != None) else None})
-        
-        sum = UnivariateDFiniteSequence(self.parent(), sum_ann, int_val_sum)
-
-        return sum.compress()
+        return self._combine(self.parent()._lclm(self.ann(), right.ann()), [self, right], sum).compress()
         
     def _neg_(self):
         r"""
@@ -2223,48 +2371,7 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         if self.__is_zero__() or right.__is_zero__():
             return self.parent().zero()
         
-        #getting the operator
-        N = self.parent().base_ring().gen()
-        A = self.parent().ore_algebra()
-        prod_ann = self.ann().symmetric_product(right.ann())
-        
-        #getting the largest and smallest degree of the operator
-        ord = prod_ann.order()
-        min_degree = next((index for index, coeff in enumerate(prod_ann.list()) if coeff != 0), None)
-
-        #initial values and singularities of the new operator
-        singularities_positive = prod_ann.singularities()
-        singularities_negative = set()
-        if self.parent()._backward_calculation is True:
-            singularities_negative = set([i for i in prod_ann.singularities(True) if i < 0])
-    
-        initial_val = set(range(ord)).union(singularities_positive, singularities_negative)
-        int_val_prod = {n:self[n] * right[n] if (self[n] != None and right[n] != None) else None for n in initial_val }
-        
-        #critical points for forward calculation
-        critical_points_positive = self.critical_points(ord).union( right.critical_points(ord) )
-        for n in singularities_positive:
-            critical_points_positive.update(range(n+1,n+ord+1))
-        
-        for n in critical_points_positive:
-            int_val_prod.update({n:self[n] * right[n] if (self[n] != None and right[n] != None) else None})
-            prod_ann = A(N - (n - ord) )*prod_ann
-            if self.parent()._backward_calculation is True and n < ord - min_degree:
-                int_val_prod.update({(n-ord)+min_degree: self[(n-ord)+min_degree] * right[(n-ord)+min_degree] if (self[(n-ord)+min_degree] != None and right[(n-ord)+min_degree] != None) else None})
-        
-        #critical points for backward calculation
-        critical_points_negative = self.critical_points(ord,True).union( right.critical_points(ord,True) )
-        for n in singularities_negative:
-            critical_points_negative.update(range(n-ord,n))
-        
-        for n in critical_points_negative:
-            int_val_prod.update({n:self[n] * right[n] if (self[n] != None and right[n] != None) else None})
-            prod_ann = A(N-(n-min_degree))*prod_ann
-            if n >= min_degree:
-                int_val_prod.update({(n-min_degree)+ord:self[(n-min_degree)+ord] * right[(n-min_degree)+ord] if (self[(n-min_degree)+ord] != None and right[(n-min_degree)+ord] != None) else None})
-        
-        prod = UnivariateDFiniteSequence(self.parent(), prod_ann, int_val_prod)
-        return prod
+        return self._combine(self.parent()._symmetric_product(self.ann(), right.ann()), [self, right], prod)
         
         
     def cauchy_product(self, right):
@@ -2304,7 +2411,7 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         L = self.ann().to_D(D)
         M = right.ann().to_D(D)
         
-        prod_ann = L.symmetric_product(M).to_S(A)
+        prod_ann = self.parent()._symmetric_product(L, M).to_S(A)
         
         #getting the largest and smallest degree of the operator
         ord = prod_ann.order()
@@ -2543,7 +2650,82 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         return UnivariateDFiniteSequence(self.parent(), sum_ann, int_val_sum)
     
 #evaluation
-    
+
+    def _term_cache(self):
+        r"""
+        Return the store of already computed terms of ``self``, see ``set_term_cache``.
+        """
+        try:
+            return self.__term_cache
+        except AttributeError:
+            self.__term_cache = _TermCache()
+            return self.__term_cache
+
+    def set_term_cache(self, prefix_length=None, interval=None, max_checkpoints=None):
+        r"""
+        Configure the memory used to store the already computed terms of ``self``.
+
+        The terms with indices `0, \dots, m-1` returned by ``expand`` are kept in a dense prefix of length
+        at most ``prefix_length``. In addition, whenever a term of index `n` is computed by ``__getitem__``,
+        the vector of `r` consecutive terms (`r` being the order of the annihilating operator) at the largest
+        multiple of ``interval`` below `n` is kept as a checkpoint, from which later evaluations resume instead of
+        starting again from the initial values. At most ``max_checkpoints`` checkpoints are kept. The methods
+        ``sum`` and ``cauchy_product``, which need many terms of ``self``, use the same store.
+
+        Changing any of the parameters discards the terms computed so far.
+
+        INPUT:
+
+        - ``prefix_length`` (default: 1024) -- maximal number of terms in the dense prefix
+        - ``interval`` (default: 256) -- distance between two checkpoints
+        - ``max_checkpoints`` (default: 64) -- maximal number of checkpoints, 0 disables them
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: A = OreAlgebra(QQ['n'],'Sn')
+            sage: D = DFiniteFunctionRing(A)
+            sage: a = UnivariateDFiniteSequence(D, "Sn^2 - Sn - 1", [0,1]) #the Fibonacci numbers
+            sage: a.set_term_cache(prefix_length=5, interval=10)
+            sage: a.expand(7)
+            [0, 1, 1, 2, 3, 5, 8, 13]
+            sage: a[25], a[27], a[4]
+            (75025, 196418, 3)
+            sage: sorted(a._term_cache().checkpoints)
+            [20]
+            sage: a[25] == fibonacci(25)
+            True
+
+        """
+        cache = self._term_cache()
+        if prefix_length is not None:
+            cache.prefix_length = prefix_length
+        if interval is not None:
+            cache.interval = interval
+        if max_checkpoints is not None:
+            cache.max_checkpoints = max_checkpoints
+        cache.clear()
+
+    def _forward_state(self, k, state, n):
+        r"""
+        Return the terms of ``self`` with indices `n, \dots, n+r-1` given the terms with indices `k, \dots, k+r-1`,
+        where `k \leq n` and `r` is the order of the annihilating operator of ``self``.
+
+        The values stored at singularities between `k` and `n` are taken into account.
+        """
+        ord = len(state)
+        roots = sorted(x - ord for x in self.singularities() if max(k,0) <= x - ord < n)
+        for root in roots + [n]:
+            if root > k:
+                Q,M = self.ann().forward_matrix_bsplit(ZZ(root-k),ZZ(k))
+                v = Matrix([state]).transpose()/M
+                result = Q * v
+                state = [result[i][0] for i in range(result.nrows())]
+            if root < n:
+                state = state[1:] + [self.initial_conditions()[root+ord]]
+                k = root + 1
+        return state
+
     def expand(self, n):
         r"""
         Return all the terms of ``self`` between 0 and ``n``
@@ -2572,6 +2754,21 @@ class UnivariateDFiniteSequence(DFiniteFunction):
         start = 0
         
         if n >= 0:
+            #terms that have already been computed
+            cache = self._term_cache()
+            if n < len(cache.prefix):
+                return cache.prefix[:n+1]
+            if 0 < ord <= len(cache.prefix) and None not in cache.prefix[-ord:]:
+                r = copy(cache.prefix)
+                s = sorted(x for x in self.initial_conditions() if len(r) <= x <= n)
+                for m in s + [n+1]:
+                    if m > len(r):
+                        r = r + self.ann().to_list(r[len(r)-ord:], m-len(r)+ord, len(r)-ord, True)[ord:]
+                    if m <= n:
+                        r.append(self._initial_values[m])
+                cache.update_prefix(r)
+                return r
+
             n = n+1
             #check if self is coming from a d-finite function that contains added zeros:
             if self.parent()._backward_calculation is False and min(self.initial_conditions()) < 0:
@@ -2586,7 +2783,9 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             #2nd case: n is smaller than all relevant singularities - nothing to worry about
             s = [x for x in self.initial_conditions() if ord <= x]
             if all(n < x for x in s):
-                return self.ann().to_list(self.initial_values(),n, -start)[start:]
+                r = self.ann().to_list(self.initial_values(),n, -start)[start:]
+                cache.update_prefix(r)
+                return r
 
             #3rd case: there is at least one singularity in the first n terms of the sequence
             s = set(x for x in self.initial_conditions() if ord <= x < n)
@@ -2603,6 +2802,7 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             r2 = self.ann().to_list( r[len(r)-ord:], n-len(r)+ord, -start+len(r)-ord,True)
             r = r + r2[ord:]
 
+            cache.update_prefix(r[start:])
             return r[start:]
       
         if n < 0:
@@ -2661,6 +2861,11 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             return self.expand(n)[-n]
     
         #normal case: n >= 0
+        n = ZZ(n)
+        cache = self._term_cache()
+        if n < len(cache.prefix):
+            return cache.prefix[n]
+
         if self.parent()._backward_calculation is False and min(self.initial_conditions()) < 0:
             start = min(self.initial_conditions())
         else:
@@ -2672,29 +2877,22 @@ class UnivariateDFiniteSequence(DFiniteFunction):
             index = max([i for i in self.initial_conditions() if self.initial_conditions()[i] is None and 0 <= i < n])
             start += index+1
             int_val = [ self.initial_conditions()[i] for i in range(index+1,index+ord+1) ]
-            roots = [ x - ord for x in self.singularities() if start <= x-ord <= n ]
         else:
-            roots = [x - ord for x in self.singularities() if 0 <= x-ord <= n]
             int_val = self.initial_values()
-        
-        #handling singularities
-        while len(roots) > 0:
-            root = min(roots)
-            Q,M = self.ann().forward_matrix_bsplit(ZZ(root-start),ZZ(start))
-            v = Matrix([int_val]).transpose()/M
-            result = Q * v
-            if n < root + ord:
-                d = n - (root+ord)
-                return result[d][0]
-            else:
-                int_val = [result[i][0] for i in range(1,result.nrows())] + [self.initial_conditions()[root+ord]]
-                start = root+1
-                roots.remove(root)
 
-        Q,M = self.ann().forward_matrix_bsplit(ZZ(n-start),ZZ(start))
-        v = Matrix([int_val]).transpose()/M
-        result = Q * v
-        return result[0][0]
+        #resuming from the closest checkpoint
+        checkpoint = cache.nearest_checkpoint(n, ord)
+        if checkpoint is not None and checkpoint[0] > start:
+            start, int_val = checkpoint
+
+        if cache.max_checkpoints > 0:
+            k = n - n % cache.interval
+            if k > start and None not in int_val:
+                int_val = self._forward_state(start, int_val, k)
+                start = k
+                cache.add_checkpoint(k, int_val)
+
+        return self._forward_state(start, int_val, n)[0]
 
 ###############################################################################################################
 class UnivariateDFiniteFunction(DFiniteFunction):
@@ -2823,7 +3021,7 @@ class UnivariateDFiniteFunction(DFiniteFunction):
                 int_val.update({ n : poly.derivative(n)(x=0)/factorial(n) })
                 s_ann = S(s_ann.base_ring().gen() - (n - ord) )*s_ann
             
-            seq = UnivariateDFiniteSequence(DFiniteFunctionRing(S,NN),s_ann,int_val)
+            seq = UnivariateDFiniteSequence(DFiniteFunctionRing(S,NN,closure_algorithm=self.parent()._closure_algorithm),s_ann,int_val)
         
             return UnivariateDFiniteFunction(self.parent(), ann, seq)
 
@@ -2993,7 +3191,7 @@ class UnivariateDFiniteFunction(DFiniteFunction):
         to compress the result. This method is called whenever equality testing is done
         because there compressing the result would be unnecessary work.
         """
-        sum_ann = self.ann().lclm(right.ann())
+        sum_ann = self.parent()._lclm(self.ann(), right.ann())
         
         lseq = self.initial_conditions()
         rseq = right.initial_conditions()
@@ -3070,7 +3268,7 @@ class UnivariateDFiniteFunction(DFiniteFunction):
         if right.__is_zero__():
             return self
         
-        sum_ann = self.ann().lclm(right.ann())
+        sum_ann = self.parent()._lclm(self.ann(), right.ann())
         
         lseq = self.initial_conditions()
         rseq = right.initial_conditions()
@@ -3134,45 +3332,51 @@ class UnivariateDFiniteFunction(DFiniteFunction):
         if right == self.parent().one():
             return self
         
-        lseq = self.initial_conditions()
-        rseq = right.initial_conditions()
-        
+        return self._combine_product(self.parent()._symmetric_product(self.ann(), right.ann()), [self, right])
+
+    def _combine_product(self, prod_ann, operands):
+        r"""
+        Return the D-finite function annihilated by ``prod_ann`` which is the product of the functions in ``operands``.
+
+        The coefficient sequence of the product is determined by the Cauchy products of the coefficient sequences of the
+        operands at the initial values and critical points of the recurrence operator corresponding to ``prod_ann``.
+        This is the common part of ``_mul_`` and of the lazy evaluation of products, see ``lazy``.
+        """
+        seqs = [a.initial_conditions() for a in operands]
+
         #getting the new operators
-        prod_ann = self.ann().symmetric_product(right.ann())
         A = OreAlgebra(self.parent().base_ring().change_var('n'),'Sn')
         N = A.base_ring().gen()
         s_ann = prod_ann.to_S(A)
         ord = s_ann.order()
 
+        def cauchy(n):
+            a = seqs[0].expand(n)
+            for seq in seqs[1:-1]:
+                b = seq.expand(n)
+                a = [sum(a[i]*b[k-i] for i in range(k+1)) for k in range(n+1)]
+            b = seqs[-1].expand(n)
+            b.reverse()
+            return sum([x*y for x,y in zip(a,b)])
+
         #initial values and singularities of the sequence operator
         singularities_positive = s_ann.singularities()
     
         initial_val = set(range(ord)).union(singularities_positive)
-        int_val_prod = {}
-        for n in initial_val:
-            a = lseq.expand(n)
-            b = rseq.expand(n)
-            b.reverse()
-            cauchy = sum([x*y for x,y in zip(a,b)])
-            int_val_prod.update({n:cauchy})
+        int_val_prod = {n:cauchy(n) for n in initial_val}
         
         #critical points for forward calculation
-        critical_points_positive = lseq.critical_points(ord).union( rseq.critical_points(ord) )
+        critical_points_positive = set().union(*[seq.critical_points(ord) for seq in seqs])
         for n in singularities_positive:
             critical_points_positive.update(range(n+1,n+ord+1))
         
         for n in critical_points_positive:
-            a = lseq.expand(n)
-            b = rseq.expand(n)
-            b.reverse()
-            cauchy = sum([x*y for x,y in zip(a,b)])
-            int_val_prod.update({n:cauchy})
+            int_val_prod.update({n:cauchy(n)})
             s_ann = A(N - (n - ord) )*s_ann
         
-        seq = UnivariateDFiniteSequence(DFiniteFunctionRing(A,NN),s_ann,int_val_prod)
+        seq = UnivariateDFiniteSequence(DFiniteFunctionRing(A,NN,closure_algorithm=self.parent()._closure_algorithm),s_ann,int_val_prod)
     
-        prod = UnivariateDFiniteFunction(self.parent(), prod_ann, seq)
-        return prod
+        return UnivariateDFiniteFunction(self.parent(), prod_ann, seq)
         
     def hadamard_product(self,right):
         r"""
@@ -3230,7 +3434,7 @@ class UnivariateDFiniteFunction(DFiniteFunction):
             int_val.update({n:self[n-1]/n})
             s_ann = A(N - (n - ord) )*s_ann
         
-        seq = UnivariateDFiniteSequence(DFiniteFunctionRing(A,NN),s_ann,int_val)
+        seq = UnivariateDFiniteSequence(DFiniteFunctionRing(A,NN,closure_algorithm=self.parent()._closure_algorithm),s_ann,int_val)
         integral = UnivariateDFiniteFunction(self.parent(), ann, seq)
         return integral
     
@@ -3318,3 +3522,224 @@ class UnivariateDFiniteFunction(DFiniteFunction):
         else:
             raise NotImplementedError("evalutation point has to be given in form of a single point or in form of a list")
 
+###############################################################################################################
+class LazyDFiniteExpression(object):
+    r"""
+    Unevaluated arithmetic expression built from D-finite sequences or functions.
+
+    Each call to ``_add_`` or ``_mul_`` on D-finite objects immediately computes an annihilating operator (an lclm
+    or a symmetric product) together with its initial values and critical points. A lazy expression instead records
+    the directed acyclic graph of the operations and only evaluates it when needed:
+
+    - nested sums and nested products are fused into a single node with many operands, so that for instance
+      ``a*b + c*d - e`` leads to one sum node whose annihilator is the lclm of three operators;
+    - equal annihilating operators of the operands of a sum are only taken into account once;
+    - the operands of a fused node are combined pairwise starting with the operators of smallest order
+      and degree, which keeps the intermediate operators small;
+    - the annihilating operator of a node (``annihilator``) can be computed without its initial values, and the
+      D-finite object itself (``materialize``) is computed at most once per node, even if the node is shared
+      by several expressions.
+
+    Lazy expressions are created by the method ``lazy`` of D-finite objects. Elements of the D-finite function ring
+    and anything that can be converted into it can be mixed with them in arithmetic operations.
+
+    EXAMPLES::
+
+        sage: from ore_algebra import *
+        sage: A = OreAlgebra(QQ['x'],'Dx')
+        sage: D = DFiniteFunctionRing(A)
+        sage: x = A.base_ring().gen()
+        sage: a = D(1/(1-x)).lazy()
+        sage: e = a*a*(x+1) - 1
+        sage: e
+        Lazy sum of 2 D-finite functions
+        sage: e.expand(5)
+        [0, 3, 5, 7, 9, 11]
+
+    D-finite objects on the left of a lazy expression give lazy expressions as well::
+
+        sage: b = D(x)
+        sage: e = b*a + b - a
+        sage: e
+        Lazy sum of 3 D-finite functions
+        sage: e.expand(5)
+        [-1, 1, 0, 0, 0, 0]
+
+    """
+
+    def __init__(self, parent, op, operands=(), value=None):
+        self._parent = parent
+        self._op = op
+        self._operands = tuple(operands)
+        self._value = value
+        self._ann = None
+
+    def parent(self):
+        r"""
+        Return the D-finite function ring in which ``self`` is evaluated.
+        """
+        return self._parent
+
+    def __repr__(self):
+        if self._parent.ore_algebra().is_S():
+            objects = "D-finite sequences"
+        else:
+            objects = "D-finite functions"
+        if self._op == "leaf":
+            return "Lazy leaf " + repr(self._value)
+        elif self._op == "neg":
+            return "Lazy negation of " + repr(self._operands[0])
+        elif self._op == "add":
+            return "Lazy sum of %s %s" % (len(self._operands), objects)
+        else:
+            return "Lazy product of %s %s" % (len(self._operands), objects)
+
+#construction
+
+    def _coerce(self, other):
+        if isinstance(other, LazyDFiniteExpression):
+            if other._parent != self._parent:
+                raise TypeError("lazy expressions over different D-finite function rings")
+            return other
+        return LazyDFiniteExpression(self._parent, "leaf", value=self._parent(other))
+
+    def _fused(self, op, operands):
+        r"""
+        Return the node ``op`` of the given operands, where operands that are unevaluated nodes of the same
+        kind are replaced by their own operands.
+        """
+        flat = []
+        for a in operands:
+            if a._op == op and a._value is None:
+                flat.extend(a._operands)
+            else:
+                flat.append(a)
+        return LazyDFiniteExpression(self._parent, op, flat)
+
+    def __add__(self, other):
+        return self._fused("add", [self, self._coerce(other)])
+
+    def __radd__(self, other):
+        return self._fused("add", [self._coerce(other), self])
+
+    def __neg__(self):
+        if self._op == "neg":
+            return self._operands[0]
+        return LazyDFiniteExpression(self._parent, "neg", [self])
+
+    def __sub__(self, other):
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other):
+        return self._coerce(other) + (-self)
+
+    def __mul__(self, other):
+        return self._fused("mul", [self, self._coerce(other)])
+
+    def __rmul__(self, other):
+        return self._fused("mul", [self._coerce(other), self])
+
+#evaluation
+
+    @staticmethod
+    def _balanced(operators, combine):
+        r"""
+        Combine the list ``operators`` using ``combine``, always combining the two operators of smallest
+        (order, degree) first.
+        """
+        heap = [(L.order(), L.degree(), i, L) for i, L in enumerate(operators)]
+        heapq.heapify(heap)
+        count = len(heap)
+        while len(heap) > 1:
+            L1 = heapq.heappop(heap)[3]
+            L2 = heapq.heappop(heap)[3]
+            L = combine(L1, L2)
+            heapq.heappush(heap, (L.order(), L.degree(), count, L))
+            count += 1
+        return heap[0][3]
+
+    def _leaves(self):
+        r"""
+        Return the operands of ``self`` as D-finite objects, leaving out zeros of sums.
+        """
+        values = [a.materialize() for a in self._operands]
+        if self._op == "add":
+            values = [v for v in values if not v.__is_zero__()]
+        return values
+
+    def annihilator(self):
+        r"""
+        Return an annihilating operator of ``self``.
+
+        The operator is computed from the annihilating operators of the operands without computing any
+        initial values, and it is cached.
+        """
+        if self._ann is not None:
+            return self._ann
+        if self._value is not None:
+            self._ann = self._value.ann()
+        elif self._op == "neg":
+            self._ann = self._operands[0].annihilator()
+        elif self._op == "add":
+            operators = []
+            for a in self._operands:
+                # only operands that are known to be zero can be left out: an operator of order zero may still
+                # annihilate a nonzero sequence (with finite support)
+                if a._value is not None and a._value.__is_zero__():
+                    continue
+                L = a.annihilator()
+                if all(L != M for M in operators):
+                    operators.append(L)
+            if not operators:
+                self._ann = self._parent.ore_algebra().one()
+            else:
+                self._ann = self._balanced(operators, self._parent._lclm)
+        else:
+            operators = [a.annihilator() for a in self._operands]
+            self._ann = self._balanced(operators, self._parent._symmetric_product)
+        return self._ann
+
+    def materialize(self):
+        r"""
+        Evaluate ``self`` and return the resulting D-finite object. The result is cached.
+        """
+        if self._value is not None:
+            return self._value
+        D = self._parent
+        if self._op == "neg":
+            self._value = -self._operands[0].materialize()
+            return self._value
+
+        values = self._leaves()
+        if self._op == "add":
+            if not values:
+                self._value = D.zero()
+            elif len(values) == 1:
+                self._value = values[0]
+            elif D.ore_algebra().is_S():
+                self._value = values[0]._combine(self.annihilator(), values, sum).compress()
+            else:
+                seqs = [v.initial_conditions() for v in values]
+                s_ann = self._balanced([u.ann() for u in seqs], seqs[0].parent()._lclm)
+                seq = seqs[0]._combine(s_ann, seqs, sum)
+                self._value = UnivariateDFiniteFunction(D, self.annihilator(), seq).compress()
+        else:
+            if any(v.__is_zero__() for v in values):
+                self._value = D.zero()
+            elif D.ore_algebra().is_S():
+                self._value = values[0]._combine(self.annihilator(), values, prod)
+            else:
+                self._value = values[0]._combine_product(self.annihilator(), values)
+        return self._value
+
+    def expand(self, *args, **kwds):
+        r"""
+        Materialize ``self`` and call its method ``expand``.
+        """
+        return self.materialize().expand(*args, **kwds)
+
+    def __getitem__(self, n):
+        return self.materialize()[n]
+
+    def __call__(self, *args, **kwds):
+        return self.materialize()(*args, **kwds)
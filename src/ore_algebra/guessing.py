@@ -50,7 +50,7 @@ from sage.modules.free_module_element import vector
 from sage.sets.primes import Primes
 
 from . import nullspace
-from .nullspace import _hermite
+from .nullspace import _hermite, _hermite_rec, _interpolation_base
 from .ore_algebra import OreAlgebra
 
 def guess_rec(data, n, S, **kwargs):
@@ -126,6 +126,11 @@ def guess(data, algebra, **kwargs):
       reports during the calculation. 
     - ``method`` -- either "linalg" (for linear algebra) or "hp" (for Hermite-Pade) or "automatic" 
       (for the default choice), or a callable with the specification of a raw guesser.
+      The default choice is "hp" for algebraic equations, and also for differential equations 
+      when the computation takes place modulo primes that are larger than the number of terms 
+      and no ``solver`` is given. Otherwise, in particular for recurrence equations, it is "linalg". 
+      For algebras with several generators, the option is passed on to ``guess_mult``, which 
+      accepts "linalg" (default) and "hp". 
 
     OUTPUT:
 
@@ -156,6 +161,18 @@ def guess(data, algebra, **kwargs):
       sage: cat = [binomial(2*n,n) // (n+1) for n in range(10)]
       sage: guess(cat, R)
       -x*C^2 + C - 1
+
+    The shortest data which determine an equation are enough::
+
+      sage: guess([fibonacci(n) for n in range(6)], OreAlgebra(GF(1091)['n'], 'Sn'))
+      Sn^2 + 1090*Sn + 1090
+      sage: guess([fibonacci(n) for n in range(6)], OreAlgebra(ZZ['n'], 'Sn'))
+      Sn^2 - Sn - 1
+
+    Hermite-Pade approximation can also be requested for recurrences::
+
+      sage: guess([catalan_number(n) for n in range(20)], OreAlgebra(GF(1091)['n'], 'Sn'), method='hp')
+      (n + 2)*Sn + 1087*n + 1089
     """
 
     A = algebra; R = A.base_ring(); K = R.base_ring(); x = R.gen()
@@ -421,12 +438,12 @@ def guess_raw(data, A, order=-1, degree=-1, lift=None, solver=None, cut=25, ensu
 
 def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infolevel=0):
     """
-    Guesses differential equations or algebraic equations for a given sample of terms.
+    Guesses differential equations, recurrence equations, or algebraic equations for a given sample of terms.
 
     INPUT:
 
     - ``data`` -- list of terms
-    - ``A`` -- an Ore algebra of differential operators or ordinary polynomials. 
+    - ``A`` -- an Ore algebra of differential operators, recurrence operators, or ordinary polynomials. 
     - ``order`` -- maximum order of the sought operators
     - ``degree`` -- maximum degree of the sought operators
     - ``lift`` (optional) -- a function to be applied to the terms in ``data``
@@ -446,18 +463,26 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
     A basis of the ``K``-vector space of all the operators `L` in ``A`` of order
     at most ``order`` and degree at most ``degree`` such that `L` applied to
     the truncated power series with ``data`` as terms gives the zero power series.
+    In the case of recurrence operators, `L` applied to ``data`` must give the zero sequence. 
 
     An error is raised in the following situations:
 
     * the algebra ``A`` has more than one generator, or its unique generator
-      is neither a standard derivation nor a commutative variable. 
+      is neither a standard derivation nor a standard shift nor a commutative variable. 
+    * ``A`` is an algebra of recurrence operators and the characteristic of ``K`` is positive 
+      but not larger than the number of terms used. 
     * ``data`` contains some item which does not belong to ``K``, even after
       application of ``lift``
     * if the condition on ``ensure`` is violated. 
 
     ALGORITHM:
 
-    Hermite-Pade approximation.
+    Hermite-Pade approximation. For recurrence operators, the polynomial coefficients are written in 
+    the falling factorial basis `n^{(j)} = n(n-1)...(n-j+1)`. If `E_i` denotes the exponential generating
+    function of the sequence shifted by `i`, then `x^j E_{i+j}` is the exponential generating function
+    of `n^{(j)} S^i` applied to the sequence. The terms `n^{(j)} S^k` with `k + j = i` therefore all come 
+    from the same series `E_i`, with polynomial multipliers whose degree and valuation depend on `i`, 
+    and the problem becomes a Hermite-Pade problem with a degree bound for each of these series. 
 
     .. NOTE::
 
@@ -474,6 +499,19 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
       [(x^4 + 819*x^3 + 136*x^2 + 17*x + 635)*Dx^4 + (14*x^3 + 417*x^2 + 952*x + 605)*Dx^3 + (598*x^2 + 497*x + 99)*Dx^2 + (598*x + 794)*Dx + 893]
       sage: len(guess_hp(data, OreAlgebra(R, 'C'), order=16, degree=64, lift=K))
       1
+      sage: data = [K(binomial(2*n, n)) for n in range(50)]
+      sage: guess_hp(data, OreAlgebra(R, 'Sx'), order=1, degree=1)
+      [(x + 1)*Sx + 1087*x + 1089]
+      sage: data = [K(catalan_number(n)) for n in range(50)]
+      sage: guess_hp(data, OreAlgebra(R, 'Sx'), order=1, degree=1)
+      [(x + 2)*Sx + 1087*x + 1089]
+      sage: data = [K(sum(binomial(n, 2*k)*catalan_number(k) for k in range(n//2 + 1))) for n in range(50)] # Motzkin
+      sage: L = guess_hp(data, OreAlgebra(R, 'Sx'), order=2, degree=1); L
+      [(x + 4)*Sx^2 + (1089*x + 1086)*Sx + 1088*x + 1088]
+      sage: all(sum(L[0][i](n)*data[n + i] for i in range(3)) == 0 for n in range(48))
+      True
+      sage: len(guess_hp(data, OreAlgebra(R, 'Sx'), order=3, degree=2))
+      4
     """
 
     if min(order, degree) < 0:
@@ -488,11 +526,12 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
     info(1, lazy_string(lambda: datetime.today().ctime() + ": Hermite/Pade guessing started."))
     info(1, "len(data)=" + str(len(data)) + ", algebra=" + str(A._latex_()))
 
-    if A.ngens() > 1 or (not A.is_C() and not A.is_D() ):
+    if A.ngens() > 1 or (not A.is_C() and not A.is_D() and not A.is_S()):
         raise TypeError("unexpected algebra")
 
     diff_case = True if A.is_D() else False
-    min_len_data = (order + 1)*(degree + 2)
+    shift_case = True if A.is_S() else False
+    min_len_data = (order + 1)*(degree + 2) # as in guess_raw, so that the paths of guess fit both
 
     if cut is not None and len(data) > min_len_data + cut:
         data = data[:min_len_data + cut]
@@ -512,6 +551,24 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
             series.append(series[-1].derivative())
         truncate = len(data) - order 
         series = [s.truncate(truncate) for s in series]
+    elif shift_case:
+        # with E_i = sum(data[n + i] x^n/n!, n >= 0), we have x^j*E_i = sum(n^(j) data[n + i - j] x^n/n!, n >= 0),
+        # where n^(j) denotes the falling factorial n(n-1)...(n-j+1). the terms n^(j)*S^k, 0 <= k <= order,
+        # 0 <= j <= degree, are thus obtained from x^j*E_(k + j), so for each i = k + j the series 
+        # x^(i - (order or less))*E_i is multiplied with a polynomial of degree at most the number of such j's minus one. 
+        truncate = len(data) - order
+        if 0 < K.characteristic() <= truncate:
+            raise ValueError("characteristic too small")
+        fact = [K.one()]
+        for n in range(1, truncate):
+            fact.append(fact[-1]*n)
+        fact = [~f for f in fact]
+        x = R.gen(); val = []; shifts = []; series = []
+        for i in range(order + degree + 1):
+            val.append(max(0, i - order)) # smallest j with k = i - j <= order
+            shifts.append(degree - (min(i, degree) - val[-1]))
+            E = R([data[n + i]*fact[n] for n in range(min(truncate, len(data) - i))])
+            series.append((x**val[-1]*E).truncate(truncate))
     else:
         truncate = len(data)
         series = [R.one(), R(data)]
@@ -519,9 +576,23 @@ def guess_hp(data, A, order=-1, degree=-1, lift=None, cut=25, ensure=0, infoleve
             series.append((series[1]*series[-1]).truncate(truncate))
 
     info(2, lazy_string(lambda: datetime.today().ctime() + ": matrix construction completed."))
-    sol = _hermite(True, matrix(R, [series]), [degree], infolevel - 2, truncate = truncate - 1)
+    sol = _hermite(True, matrix(R, [series]), [degree], infolevel - 2, truncate = truncate - 1, 
+                   shifts = shifts if shift_case else None)
     info(2, lazy_string(lambda: datetime.today().ctime() + ": hermite pade approximation completed."))
 
+    if shift_case: # back from the falling factorial basis: the coefficient of x^j in the ith entry belongs to n^(j + val[i])*S^(i - j - val[i])
+        ff = [R.one()]
+        for j in range(degree):
+            ff.append(ff[-1]*(x - j))
+        coeffs = []
+        for s in sol:
+            c = [R.zero() for k in range(order + 1)]
+            for i, p in enumerate(s):
+                for j in range(p.degree() + 1):
+                    c[i - j - val[i]] += p[j]*ff[j + val[i]]
+            coeffs.append(c)
+        sol = coeffs
+
     sol = [A(list(map(R, s))) for s in sol]
     sol = [(~L.leading_coefficient().leading_coefficient())*L for L in sol]
 
@@ -806,7 +877,12 @@ def _guess_via_gcrd(data, A, **kwargs):
     if 'min_order' in kwargs:
         min_ord = kwargs['min_order']; del kwargs['min_order']
 
-    subguesser = guess_hp if A.is_C() else guess_raw # default = hp for algeqs and raw for other
+    # default = hp for algeqs, and also for differential equations if the characteristic is large enough, 
+    # because then the per-prime solve benefits from the word size order bases in nullspace. 
+    if A.is_C() or A.is_D() and K.characteristic() > len(data) and 'solver' not in kwargs:
+        subguesser = guess_hp
+    else:
+        subguesser = guess_raw
     if 'method' in kwargs:
         if kwargs['method'] == 'linalg':
             subguesser = guess_raw
@@ -1226,6 +1302,14 @@ def guess_mult(data, algebra, **kwargs):
       Default: None (everything allowed).
     - ``solver`` -- function to be used for computing the right kernel of a matrix
       with elements in `K`. 
+    - ``sparse`` -- if ``True``, the linear systems are set up as sparse matrices. This 
+      saves memory when most entries vanish, e.g., for differential operators. Default: ``False``.
+    - ``method`` -- either "linalg" (for linear algebra) or "hp" (for order bases). In the latter
+      case, the unknown coefficients are viewed as polynomials in one variable, preferably one 
+      whose generator is a derivation, and the systems are solved by Hermite-Pade approximation 
+      or interpolation in this variable. See ``guess_mult_hp``. Default: "linalg".
+    - ``ncpus`` -- number of processors to be used for computing modular images in parallel
+      when `K` is `QQ` or `GF(p)(t)`. Default: 1.
     - ``infolevel`` -- an integer specifying the level of details of progress
       reports during the calculation. 
 
@@ -1254,6 +1338,24 @@ def guess_mult(data, algebra, **kwargs):
       sage: guess_mult(data, OreAlgebra(ZZ['x','k'], 'Dx', 'Sk'), order=1, degree=1)
       Left Ideal (Dx*Sk + (-x - 1)*Dx - 1, x*Dx*Sk + (x + 1)*Dx + (-k)*Sk - x, (x + 1)*Dx - k, (x + 1)*Dx*Sk + (-k - 1)*Sk) of Multivariate Ore algebra in Dx, Sk over Fraction Field of Multivariate Polynomial Ring in x, k over Integer Ring
 
+    The modular images are independent of each other once the support of the solutions is known, 
+    and they can be computed in parallel::
+
+      sage: data = [[binomial(n,k)/(n+1) for n in range(12)] for k in range(12)]
+      sage: A = OreAlgebra(ZZ['n','k'], 'Sn', 'Sk')
+      sage: I = guess_mult(data, A, order=1, degree=1, ncpus=2)
+      sage: I == guess_mult(data, A, order=1, degree=1, sparse=True)
+      True
+
+    Instead of generic linear algebra, the structure of the systems can be exploited::
+
+      sage: I == guess_mult(data, A, order=1, degree=1, method='hp')
+      True
+      sage: data = [[binomial(n,k) for n in range(10)] for k in range(10)]
+      sage: B = OreAlgebra(ZZ['x','y'], 'Dx', 'Dy')
+      sage: guess_mult(data, B, order=1, degree=1, method='hp') == guess_mult(data, B, order=1, degree=1)
+      True
+
     """
 
     infolevel = kwargs.setdefault('infolevel', 0)
@@ -1328,6 +1430,15 @@ def guess_mult(data, algebra, **kwargs):
     if len(terms) + kwargs.setdefault("ensure", 0) >= len(points):
         raise ValueError("not enough data"    )
 
+    method = kwargs.setdefault('method', 'linalg')
+    if method == 'hp': ## approximation along the first derivation, if any
+        var = ([i for i in range_dim if algebra.is_D(i)] + [0])[0]
+        raw = lambda *args, **kwds: guess_mult_hp(*args, var=var, diff=bool(algebra.is_D(var)), **kwds)
+    elif method in ('linalg', 'automatic', 'default'):
+        raw = guess_mult_raw
+    else:
+        raise ValueError("unknown method: " + str(method))
+
     C = algebra.base_ring().base_ring().fraction_field() ### constant field 
 
     if C.characteristic() in Primes() and C is GF(C.characteristic()): ### constant field is GF(p) --> raw guessing
@@ -1341,7 +1452,7 @@ def guess_mult(data, algebra, **kwargs):
             elif algebra.is_Q(i):
                 power.append(_power_factory(C))
 
-        sol = guess_mult_raw(C, data, terms, points, power, A, B, **kwargs)
+        sol = raw(C, data, terms, points, power, A, B, **kwargs)
 
     elif C is QQ or is_PolynomialRing(C.base()) and len(C.base().gens()) == 1 and C.base_ring() is GF(C.characteristic()): 
         ### C == QQ or C == GF(p)(t) --> plain chinese remaindering (resp interpolation) plus rational reconstruction
@@ -1351,79 +1462,107 @@ def guess_mult(data, algebra, **kwargs):
         R = ZZ if C is QQ else C.base()
         mod = [R.one()]
         sol = None
-        power = [None]*dim
         imgs = []
+        ncpus = kwargs.pop('ncpus', 1)
         kwargs['infolevel'] = infolevel - 2 
 
-        while not all(m.is_zero() for m in mod):
-
-            p = next(modulus_generator)
-            info(1, "modulus = " + str(p))
+        def image(p):
+            # the solution space modulo p, computed from the data reduced on the fly
             C_mod = GF(p) if C is QQ else C.base_ring()
             phi = to_hom(p)
-            
+            A_mod = list(A); power = [None]*dim
             for i in range_dim:
                 if algebra.is_D(i):
                     power[i] = _ff_factory(C_mod)
                 elif algebra.is_S(i):
                     power[i] = _power_factory(C_mod)
                 elif algebra.is_Q(i):
-                    _, q = algebra.is_Q(i); A[i] = lambda n, u, v: (phi(q), n*u)
+                    _, q = algebra.is_Q(i); A_mod[i] = lambda n, u, v, q=phi(q): (q, n*u)
                     power[i] = _power_factory(C_mod)
+            return raw(C_mod, data, terms, points, power, A_mod, B, phi=phi, **kwargs)
+
+        if ncpus > 1:
+            @parallel(ncpus=ncpus)
+            def forked_image(p):
+                try:
+                    return [list(s) for s in image(p)]
+                except ZeroDivisionError: # unlucky modulus
+                    return None
 
-            ## compute modular image 
-            kwargs['phi'] = phi
-            solp = guess_mult_raw(C_mod, data, terms, points, power, A, B, **kwargs)
-            del kwargs['phi']
+        while not all(m.is_zero() for m in mod):
 
-            if sol is None: ## initialization
+            if sol is None or ncpus == 1:
+                p = next(modulus_generator)
+                info(1, "modulus = " + str(p))
+                batch = [(p, image(p))]
+            else: ## the support is known, so the remaining images are independent
+                primes = [next(modulus_generator) for i in range(ncpus)]
+                info(1, "moduli = " + str(primes))
+                batch = []
+                for (arg, solp) in forked_image(primes):
+                    if isinstance(solp, str): ## the worker failed; redo the computation here, so that its error is raised
+                        solp = image(arg[0][0])
+                    if solp is None:
+                        info(2, "unlucky modulus " + str(arg[0][0]) + " discarded")
+                    else:
+                        batch.append((arg[0][0], solp))
 
-                ## early termination check
-                if len(solp) == 0:
-                    info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed by early termination."))
-                    return algebra.ideal([])
-                
-                ## extract support of solutions
-                for i in range(len(terms)):
-                    if all(v[i].is_zero() for v in solp):
-                        terms[i] = None
-
-                sol = [[] for i in range(len(solp))]
-                new_terms = []
-                for i in range(len(terms)):
-                    if terms[i] is not None:
-                        new_terms.append(terms[i])
-                        for j in range(len(solp)):
-                            sol[j].append(R(solp[j][i]))
-                terms = new_terms
-                sol = [vector(R, s) for s in sol]
-                mod = [p]*len(sol)
-
-                if cut is not None and len(points) > len(terms) + cut:
-                    points = points[:len(terms) + cut]
-
-            else: ## subsequent iterations
-
-                try: ## save
-                    imgs[imgs.index(None)] = ([vector(R, s) for s in solp], p)
-                except: ## merge, merge, and reconstruct
-
-                    p = [p]*len(solp); solp = [vector(R, s) for s in solp]
-                    for (solpp, pp) in imgs:
-                        for i in range(len(solp)):
-                            try:
-                                solp[i], p[i] = _merge_homomorphic_images(solp[i], p[i], solpp[i], pp, reconstruct=False)
-                            except:
-                                info(2, "unlucky modulus " + str(pp) + " discarded")
+            for (p, solp) in batch:
+
+                if sol is None: ## initialization
+
+                    ## early termination check
+                    if len(solp) == 0:
+                        info(1, lazy_string(lambda: datetime.today().ctime() + " : multivariate guessing completed by early termination."))
+                        return algebra.ideal([])
+
+                    ## extract support of solutions
+                    for i in range(len(terms)):
+                        if all(v[i].is_zero() for v in solp):
+                            terms[i] = None
+
+                    sol = [[] for i in range(len(solp))]
+                    new_terms = []
+                    for i in range(len(terms)):
+                        if terms[i] is not None:
+                            new_terms.append(terms[i])
+                            for j in range(len(solp)):
+                                sol[j].append(R(solp[j][i]))
+                    terms = new_terms
+                    sol = [vector(R, s) for s in sol]
+                    mod = [p]*len(sol)
+
+                    if cut is not None and len(points) > len(terms) + cut:
+                        points = points[:len(terms) + cut]
+
+                elif all(m.is_zero() for m in mod):
+                    break
+
+                elif len(solp) != len(sol):
+                    info(2, "unlucky modulus " + str(p) + " discarded")
+
+                else: ## subsequent iterations
+
+                    try: ## save
+                        imgs[imgs.index(None)] = ([vector(R, s) for s in solp], p)
+                    except: ## merge, merge, and reconstruct
+
+                        p = [p]*len(solp); solp = [vector(R, s) for s in solp]
+                        for (solpp, pp) in imgs:
+                            for i in range(len(solp)):
+                                try:
+                                    solp[i], p[i] = _merge_homomorphic_images(solp[i], p[i], solpp[i], pp, reconstruct=False)
+                                except:
+                                    info(2, "unlucky modulus " + str(pp) + " discarded")
 
-                    imgs = [None]*(len(imgs) + 1)
+                        imgs = [None]*(len(imgs) + 1)
 
-                    for i in range(len(sol)):
-                        try:
-                            # if all mod[i] are zero in the end, this will terminate the while loop
-                            sol[i], mod[i] = _merge_homomorphic_images(sol[i], mod[i], solp[i], p[i], reconstruct=True)
-                        except:
-                            info(2, "unlucky modulus " + str(p[i]) + " discarded")
+                        for i in range(len(sol)):
+                            try:
+                                # if all mod[i] are zero in the end, this will terminate the while loop
+                                sol[i], mod[i] = _merge_homomorphic_images(sol[i], mod[i], solp[i], p[i], reconstruct=True)
+                            except:
+                                info(2, "unlucky modulus " + str(p[i]) + " discarded")
 
     elif C.base_ring().fraction_field() is QQ and is_PolynomialRing(C.base()) and len(C.base().gens()) == 1:
         ### C = QQ(t)
@@ -1471,6 +1610,9 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
     - `A` -- a list of functions mapping triples (n, u, v) to integers
     - `B` -- a list of functions mapping triples (n, u, v) to integers
 
+    Optional arguments: ``phi`` (a map applied to the data before they are used), ``sparse``
+    (whether the matrix is stored sparsely), ``ensure``, ``infolevel``. 
+
     OUTPUT:
     
     A list of vectors generating the space of all vectors in C^len(terms) for which 
@@ -1488,39 +1630,54 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
             print(msg)
 
     phi = kwargs.setdefault('phi', lambda x: x)
+    sparse = kwargs.setdefault('sparse', False)
     C = C.fraction_field()
-    mat = []
     info(1, lazy_string(lambda: datetime.today().ctime() + " : setting up modular system..."))
     monomial_cache = dict()
     range_dim = list(range(len(A)))
 
+    # the rows are written into the matrix as soon as they are computed, so that no
+    # intermediate list of lists of ring elements is ever held in memory.
+    if sparse:
+        entries = dict()
+    else:
+        mat = MatrixSpace(C, len(points), len(terms)).zero_matrix().__copy__()
+    rows = 0
+
     for k, n in enumerate(points):
 
         row = []
-        for u, v in terms:
+        for j, (u, v) in enumerate(terms):
 
             idx = tuple(B[i](n[i], u[i], v[i]) for i in range_dim)
             if min(idx) < 0:
-                row.append(phi(C.zero()))
-            else:
-                exp = tuple(A[i](n[i], u[i], v[i]) for i in range_dim)
-                d = data
-                try:
-                    factor = monomial_cache[exp]
-                    for i in idx: 
-                        d = d[i]
-                except KeyError:
-                    factor = phi(C.one())
-                    for p, i, e in zip(*(power, idx, exp)):
-                        d = d[i]
-                        factor *= p(e[0], e[1])
-                    monomial_cache[exp] = factor
-                row.append(phi(d) * factor)
-
-        if all(e.is_zero() for e in row):
+                continue
+            exp = tuple(A[i](n[i], u[i], v[i]) for i in range_dim)
+            d = data
+            try:
+                factor = monomial_cache[exp]
+                for i in idx: 
+                    d = d[i]
+            except KeyError:
+                factor = phi(C.one())
+                for p, i, e in zip(*(power, idx, exp)):
+                    d = d[i]
+                    factor *= p(e[0], e[1])
+                monomial_cache[exp] = factor
+            c = C(phi(d) * factor)
+            if not c.is_zero():
+                row.append((j, c))
+
+        if len(row) == 0:
             points[k] = None
+        elif sparse:
+            for j, c in row:
+                entries[rows, j] = c
+            rows += 1
         else:
-            mat.append(row)
+            for j, c in row:
+                mat[rows, j] = c
+            rows += 1
 
     try:
         while True:
@@ -1529,11 +1686,123 @@ def guess_mult_raw(C, data, terms, points, power, A, B, **kwargs):
         pass
 
     monomial_cache.clear()
-    if len(terms) + kwargs.setdefault('ensure') >= len(mat):
+    if len(terms) + kwargs.setdefault('ensure') >= rows:
         raise ValueError("not enough data, or too many zeros")
 
+    if sparse:
+        mat = matrix(C, rows, len(terms), entries, sparse=True)
+        entries.clear()
+    elif rows < mat.nrows():
+        mat = mat.matrix_from_rows(range(rows))
+
     info(1, lazy_string(lambda: datetime.today().ctime() + " : solving modular system..."))
-    sol = MatrixSpace(C, len(points), len(terms))(mat).right_kernel().basis()
+    sol = mat.right_kernel().basis()
+
+    info(1, lazy_string(lambda: datetime.today().ctime() + " : " + str(len(sol)) + " solutions detected."))
+    return sol
+
+def guess_mult_hp(C, data, terms, points, power, A, B, var=0, diff=False, **kwargs):
+    """
+    Low-level multivariate guessing function based on approximant bases. Do not call this method 
+    unless you know what you are doing. In most situations, you will want to call the function `guess` instead.
+
+    The ansatz is viewed as a vector of unknown univariate polynomials in the variable with index ``var``,
+    one for each combination of the other exponents. The equations coming from the points which differ
+    only in the ``var``-th coordinate are then combined into a single polynomial condition, 
+    which is solved by Hermite-Pade approximation if ``diff`` is ``True`` and by interpolation otherwise. 
+    The remaining variables are thus handled by evaluation only. 
+    
+    INPUT:
+
+    - `C`, `data`, `terms`, `points`, `power`, `A`, `B` -- as for ``guess_mult_raw``
+    - `var` -- index of the variable whose exponents are treated as polynomials
+    - `diff` -- whether the algebra generator of index ``var`` is a derivation. In this case the 
+      power series in this variable are approximated up to the order permitted by the size of the 
+      data, regardless of the ``var``-th coordinates of the elements of ``points``. Otherwise, the 
+      interpolation points are given by ``power[var](*A[var](n, 1, 0))``.
+
+    OUTPUT:
+    
+    The same as ``guess_mult_raw``. The list ``points`` is not modified.
+    """
+
+    infolevel = kwargs.setdefault('infolevel', 0)
+    def info(bound, msg):
+        if bound <= infolevel:
+            print(msg)
+
+    phi = kwargs.setdefault('phi', lambda x: x)
+    C = C.fraction_field()
+    R = PolynomialRing(C, 'x')
+    range_dim = list(range(len(A)))
+    info(1, lazy_string(lambda: datetime.today().ctime() + " : setting up approximation problem..."))
+
+    dims = []; l = data
+    while type(l) in (list, tuple):
+        dims.append(len(l))
+        l = l[0]
+
+    # 1. unknown polynomials: one for each key (u', v), where u' is u without its var-th component
+    bounds = dict()
+    for u, v in terms:
+        key = (u[:var] + (0,) + u[var + 1:], v)
+        bounds[key] = max(bounds.get(key, 0), u[var])
+    keys = list(bounds)
+    delta = max(bounds.values())
+    shift = [delta - bounds[key] for key in keys] # becomes the list of shifted degrees of the basis
+    closure = [(key[0][:var] + (e,) + key[0][var + 1:], key[1]) for key in keys for e in range(bounds[key] + 1)]
+
+    def value(n, key):
+        # the coefficient of the constant term of the unknown polynomial for key at the point n
+        u, v = key
+        idx = tuple(B[i](n[i], u[i], v[i]) for i in range_dim)
+        if min(idx) < 0:
+            return C.zero()
+        d = data; factor = phi(C.one())
+        for p, i, a in zip(power, idx, range_dim):
+            d = d[i]
+            factor *= p(*A[a](n[a], u[a], v[a]))
+        return C(phi(d) * factor)
+
+    # 2. set up and solve the approximation problem
+    if diff:
+        others = sorted(set(n[:var] + (0,) + n[var + 1:] for n in points))
+        cut = dims[var] - max(key[1][var] for key in keys)
+        if len(terms) + kwargs.setdefault('ensure', 0) >= cut*len(others):
+            raise ValueError("not enough data")
+        mat = [[R([value(n[:var] + (k,) + n[var + 1:], key) for k in range(cut)]) for key in keys] for n in others]
+        info(1, lazy_string(lambda: datetime.today().ctime() + " : computing order basis..."))
+        V, _ = _hermite_rec(False, R, Matrix(R, mat), cut, shift, infolevel - 2)
+    else:
+        if len(terms) + kwargs.setdefault('ensure', 0) >= len(points):
+            raise ValueError("not enough data")
+        mat = []
+        for n in points:
+            row = [value(n, key) for key in keys]
+            if any(row):
+                mat.append((C(power[var](*A[var](n[var], 1, 0))), row))
+        info(1, lazy_string(lambda: datetime.today().ctime() + " : computing interpolation basis..."))
+        V = _interpolation_base(R, mat, shift)
+
+    # 3. by the predictable degree property, the multiples x^k*V[:,j] with shift[j] + k <= delta 
+    #    form a basis of the solutions in the ansatz 
+    x = R.gen(); sol = []
+    for j in range(len(keys)):
+        for k in range(delta - shift[j] + 1):
+            w = [x**k*V[i, j] for i in range(len(keys))]
+            sol.append([w[i][e] for i in range(len(keys)) for e in range(bounds[keys[i]] + 1)])
+    if len(sol) == 0:
+        return []
+    sol = matrix(C, sol)
+
+    # 4. restrict to the given terms 
+    index = dict((t, i) for i, t in enumerate(closure))
+    given = set(terms)
+    missing = [index[t] for t in closure if t not in given]
+    if len(missing) > 0:
+        sol = sol.matrix_from_columns(missing).left_kernel().basis_matrix()*sol
+    sol = sol.matrix_from_columns([index[t] for t in terms]).echelon_form()
+    sol = [v for v in sol.rows() if not v.is_zero()]
 
     info(1, lazy_string(lambda: datetime.today().ctime() + " : " + str(len(sol)) + " solutions detected."))
     return sol
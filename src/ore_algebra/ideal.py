@@ -33,6 +33,7 @@ from sage.rings.fraction_field import is_FractionField
 from . import nullspace
 
 from .tools import clear_denominators
+from .ore_operator_mult import _CompactBasis, _PackedMonomials
 
 class OreLeftIdeal(Ideal_nc):
 
@@ -205,11 +206,12 @@ class OreLeftIdeal(Ideal_nc):
         G = self.groebner_basis()
         B = self.vector_space_basis()
 
-        mat = [(D*b).reduce(G) for b in B]
+        G = _CompactBasis(self.ring(), G)
+        mat = [G.reduce(D*b) for b in B]
         mat = [[m[b.exp()] for b in B] for m in mat]
         return matrix(self.ring().base_ring(), mat).transpose()
         
-    def groebner_basis(self, infolevel=0, update_hook=None):
+    def groebner_basis(self, infolevel=0, update_hook=None, algorithm="buchberger", modular=False, ncpus=1, verify=True):
         """
         Returns the Groebner basis of this ideal. 
 
@@ -224,10 +226,30 @@ class OreLeftIdeal(Ideal_nc):
           b. The hook facility gives a possibility to interfere with the
           computation. Fiddling with the lists G and C may destroy correctness
           or termination.
+        - algorithm -- either "buchberger" (default), which reduces the
+          S-polynomials one at a time, or "f4", which takes all critical pairs
+          of minimal sugar at once and reduces their S-polynomials
+          simultaneously by sparse fraction free elimination on a Macaulay
+          matrix (see _f4_reduction). The latter is typically much faster for
+          larger ideals, e.g., the holonomic ideals in examples.ssw.
+        - modular -- if True, and the base ring is a field of rational
+          functions over ZZ or QQ, compute the Groebner basis modulo several
+          word size primes with the chosen algorithm and reconstruct it by
+          chinese remaindering and rational reconstruction (see
+          _groebner_basis_modular). This avoids the growth of the coefficients
+          in the intermediate results. If no basis can be reconstructed
+          from a bounded number of primes, the basis is computed without
+          modular arithmetic instead. Default: False.
+        - ncpus -- number of primes processed in parallel in modular mode.
+        - verify -- if True (default), the result of the modular mode is
+          certified to be a Groebner basis of an ideal containing self; if
+          False, it is only checked that it is stable under additional primes.
 
         OUTPUT:
 
-        The Groebner basis of self. The output is cached.
+        The Groebner basis of self. The output is cached, except in modular
+        mode, where it is not certified to generate self and is therefore not
+        used by the other methods of self.
 
         The monomial order is taken from the ambient ring (the common parent of
         the generators of self). Conceptually, the base ring of the ambient
@@ -252,12 +274,34 @@ class OreLeftIdeal(Ideal_nc):
            [(n - 2*k + 3)*Sn + Sk - n + 2*k - 5,
             (n - 2*k + 3)*Sk^2 + (-3*n + 6*k - 7)*Sk + 2*n - 4*k + 2]
 
+        The F4 variant yields the same basis::
+
+           sage: A.ideal([-5+2*k-n + Sk + (3-2*k+n)*Sn, -2+4*k-2*n + (7-6*k+3*n)*Sk + (-3+2*k-n)*Sk^2]).groebner_basis(algorithm="f4")
+           [(n - 2*k + 3)*Sn + Sk - n + 2*k - 5,
+            (n - 2*k + 3)*Sk^2 + (-3*n + 6*k - 7)*Sk + 2*n - 4*k + 2]
+           sage: R.<x,y> = ZZ[]
+           sage: A.<Dx,Dy> = OreAlgebra(R)
+           sage: sorted(A.ideal([Dy^3*(Dx + (-1 + 2*x - 2*y)*Dy - 1), Dx^2*((-2 + 2*x - 2*y)*Dy^2 - 3*Dy)]).groebner_basis(algorithm="f4"))
+           [3*Dx^2*Dy + (-4)*Dx*Dy^2 + (-7)*Dy^3,
+            (2*x - 2*y - 2)*Dy^4 + (-7)*Dy^3,
+            (2*x - 2*y - 2)*Dx*Dy^3 + 7*Dy^3]
+
+        Multimodular computation::
+
+           sage: sorted(A.ideal([Dy^3*(Dx + (-1 + 2*x - 2*y)*Dy - 1), Dx^2*((-2 + 2*x - 2*y)*Dy^2 - 3*Dy)]).groebner_basis(modular=True))
+           [3*Dx^2*Dy + (-4)*Dx*Dy^2 + (-7)*Dy^3,
+            (2*x - 2*y - 2)*Dy^4 + (-7)*Dy^3,
+            (2*x - 2*y - 2)*Dx*Dy^3 + 7*Dy^3]
+
         """
         try:
             return list(self.__gb)
         except:
             pass
 
+        if algorithm not in ("buchberger", "f4"):
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
         gens = self.gens()
         if all(g.is_zero() for g in gens):
             self.__gb = ()
@@ -266,6 +310,15 @@ class OreLeftIdeal(Ideal_nc):
         A = gens[0].parent()
         A = A.change_ring(A.base_ring().ring())
         gens = list(map(A, gens))
+
+        if modular:
+            if update_hook is not None:
+                raise ValueError("update_hook is not supported in modular mode")
+            try:
+                return _groebner_basis_modular(A, gens, algorithm=algorithm, ncpus=ncpus, verify=verify, infolevel=infolevel)
+            except ArithmeticError:
+                if infolevel >= 1:
+                    print("modular computation failed, falling back to the exact computation")
         
         # ~~~ relatively naive code ~~~
 
@@ -294,15 +347,17 @@ class OreLeftIdeal(Ideal_nc):
             if update_hook is not None:
                 info(1, "invoking update_hook...")
                 update_hook(G, B, h)
-            C = [g for g in G]
-            C.sort(key=smallest_lt_first, reverse=True) # smallest leading term last
-            # 1. discard the pairs (C[i],h) for which there is another pair (C[j], h) with lt(C[j],h)|lt(C[i],h)
-            for i in range(len(C)): 
-                for j in range(len(C)):
-                    if C[j] is not None and i != j and min(lcm(C[i],h).esub(lcm(C[j],h))) >= 0:
-                        C[i] = None
-                        break
-            C = [makepair(g, h) for g in C if g is not None]
+            # 1. discard the pairs (g,h) for which there is another pair (g', h) with lt(g',h)|lt(g,h).
+            # The lcm's are computed once; candidates are visited by increasing total degree, so that
+            # only the pairs kept so far need to be checked. Among pairs with equal lcm, the one with
+            # the smallest leading term is kept.
+            C = sorted(G, key=smallest_lt_first)
+            C = sorted(((lcm(g, h), g) for g in C), key=lambda c: sum(c[0]))
+            kept = []
+            for t, g in C:
+                if all(min(t.esub(t0)) < 0 for t0, _ in kept):
+                    kept.append((t, g))
+            C = [makepair(g, h) for _, g in kept]
             # 2. discard an old pair (u,v) if (u,h,v) is a bb-pair but (h,u,v) and (u,v,h) are not
             for b in B:
                 if min(b[0].exp().esub(h.exp())) < 0 or b[0].exp() in [lcm(h, b[1]), lcm(h, b[2])]:
@@ -320,6 +375,17 @@ class OreLeftIdeal(Ideal_nc):
             g.sugar = g.tdeg()
             G, C = update(G, C, g.reduce(G, normalize=True, coerce=False))
 
+        # f4 loop
+        while algorithm == "f4" and len(C) > 0:
+            s = C[-1][-1]; k = len(C)
+            while k > 0 and C[k - 1][-1] == s:
+                k -= 1
+            P = C[k:]; C = C[:k]
+            info(2, datetime.today().ctime() + ": " + str(len(C) + len(P)) + " pairs left; taking " + str(len(P)) + " pairs of sugar " + str(s))
+            for h in _f4_reduction(A, P, G, infolevel=infolevel-2):
+                h.sugar = s
+                G, C = update(G, C, h)
+
         # buchberger loop
         info(1, "main loop...")
         while len(C) > 0:
@@ -761,7 +827,7 @@ class OreLeftIdeal(Ideal_nc):
         return B.ideal(fglm(B, one, mats, infolevel=infolevel-1, solver=B._solver(R0), early_termination=early_termination), is_known_to_be_a_groebner_basis=True)
 
     
-    def ct(self, D, algebra=None, certificates=True, early_termination=False, infolevel=0, iteration_limit=0):
+    def ct(self, D, algebra=None, certificates=True, early_termination=False, infolevel=0, iteration_limit=0, modular=False):
         """
         Computes an ideal of telescopers for self.
 
@@ -784,6 +850,14 @@ class OreLeftIdeal(Ideal_nc):
         - iteration_limit -- if set to a positive integer, the computation is
           terminated as soon as the support of the telescopers in the ansatz
           exceeds the specified number.
+        - modular -- if True and the coefficients of self are defined over ZZ
+          or QQ, the FGLM-like iteration is first carried out modulo a word
+          size prime, which is cheap and reveals the leading monomials of the
+          telescopers. The exact computation then only calls the solver once
+          per telescoper, with the right support, using a solver based on
+          chinese remaindering, Kronecker substitution and interpolation. If
+          the prime turns out to be unlucky, the method falls back to the
+          ordinary iteration. Default: False.
 
         OUTPUT:
 
@@ -798,6 +872,8 @@ class OreLeftIdeal(Ideal_nc):
            sage: A.<Sn,Sk> = OreAlgebra(R)
            sage: A.ideal([(k+1)*Sk+(k-n),(1-k+n)*Sn+(-1-n)]).ct(Sk-1) # random
            ([Sn - 2], [k/(k - n - 1)])
+           sage: A.ideal([(k+1)*Sk+(k-n),(1-k+n)*Sn+(-1-n)]).ct(Sk-1, certificates=False, modular=True)
+           [Sn - 2]
 
            sage: # gfun of legendre polynomials 
            sage: R.<t,n,x> = ZZ[]
@@ -844,6 +920,17 @@ class OreLeftIdeal(Ideal_nc):
         
         info(1, "Output ideal will belong to " + repr(algebra))
         info(2, "Summation/Integration variable recognized as " + str(var))
+
+        targets = None
+        if modular and A.base_ring().base_ring() in (ZZ, QQ):
+            info(1, "Searching for telescopers modulo a prime...")
+            targets = self._ct_leading_monomials(D, algebra, early_termination, iteration_limit, infolevel)
+            if targets is None:
+                info(1, "No suitable prime found, continuing without modular search")
+            else:
+                info(1, "Telescopers expected at " + str(targets))
+                if len(targets) == 0:
+                    return ([], []) if certificates else []
         
         # translate delta to matrix equation over univariate operator algebra
         info(1, "Constructing coupled system...")
@@ -883,7 +970,7 @@ class OreLeftIdeal(Ideal_nc):
 
         # uncouple
         info(1, lazy_string(lambda: datetime.today().ctime() + ": Uncoupling coupled system..."))
-        T, U = uncouple(sys, extended=True, infolevel=infolevel+2)
+        T, U = uncouple(sys, extended=True, infolevel=infolevel+2, modular=modular)
         info(2, lazy_string(lambda: datetime.today().ctime() + ": Uncoupling completed."))
         if algebra.is_D():
             @cached_function
@@ -900,7 +987,11 @@ class OreLeftIdeal(Ideal_nc):
         telescopers = []
         iterator = MonomialIterator(algebra)
         terms = {next(iterator)[0] : vector(GG, [1] + [0]*(len(T)-1))}
-        coresolver = nullspace.kronecker(nullspace.gauss())
+        G0 = algebra.base_ring().fraction_field()
+        if targets is None or not (is_FractionField(G0) and G0.ring().ngens() > 0):
+            coresolver = nullspace.kronecker(nullspace.gauss())
+        else:
+            coresolver = nullspace.cra(nullspace.kronecker(nullspace.lagrange(nullspace.sage_native)))
         zerocount = [0] # so many zero telescopers have been found so far
         solver = [nullspace.quick_check(coresolver, cutoffdim=0)]
 
@@ -926,10 +1017,13 @@ class OreLeftIdeal(Ideal_nc):
         
         info(1, "next monomial: 1")
         info(2, lazy_string(lambda: datetime.today().ctime() + ": calling solver..."))
-        sol = findrelation()
+        sol = findrelation() if targets is None or B[0] in targets else None
 
         if sol is not None:
             telescopers.append(sol)
+        elif targets is not None and B[0] in targets:
+            info(1, "unlucky prime, starting over without modular search")
+            return self.ct(D, algebra, certificates, early_termination, infolevel, iteration_limit)
         else:
             try:
                 while True:
@@ -944,17 +1038,23 @@ class OreLeftIdeal(Ideal_nc):
                     terms[tau*d] = v
                     B.append(tau*d); rhs.append(Ufy(terms[tau*d]))
                 
-                    # solve
-                    info(2, lazy_string(lambda: datetime.today().ctime() + ": calling solver..."))
-                    sol = findrelation()
-                    info(3, lazy_string(lambda: datetime.today().ctime() + ": solving completed."))
-                    if sol is not None:
-                        info(2, "telescoper detected.")
-                        telescopers.append(sol)
-                        B.pop(); rhs.pop(); del terms[tau*d]; iterator.declare_step()
-                        if early_termination is True:
-                            info(3, "early termination")
-                            break
+                    # solve, unless the modular search predicts that there is no telescoper with this leading monomial
+                    if targets is None or tau*d in targets:
+                        info(2, lazy_string(lambda: datetime.today().ctime() + ": calling solver..."))
+                        sol = findrelation()
+                        info(3, lazy_string(lambda: datetime.today().ctime() + ": solving completed."))
+                        if sol is None and targets is not None:
+                            info(1, "unlucky prime, starting over without modular search")
+                            return self.ct(D, algebra, certificates, early_termination, infolevel, iteration_limit)
+                        if sol is not None:
+                            info(2, "telescoper detected.")
+                            telescopers.append(sol)
+                            B.pop(); rhs.pop(); del terms[tau*d]; iterator.declare_step()
+                            if early_termination is True:
+                                info(3, "early termination")
+                                break
+                            if targets is not None and len(telescopers) == len(targets):
+                                break
 
                     if iteration_limit > 0 and len(B) >= iteration_limit:
                         info(1, "iteration limit exceeded")
@@ -983,6 +1083,47 @@ class OreLeftIdeal(Ideal_nc):
         
             
     creative_telescoping = ct
+
+    def _ct_leading_monomials(self, D, algebra, early_termination=False, iteration_limit=0, infolevel=0, max_primes=10):
+        """
+        Returns the leading monomials of the telescopers of self with respect to D,
+        as elements of algebra, determined by running ct modulo a word size prime.
+
+        Primes for which the reduction of self or the computation fails are skipped.
+        If this happens for max_primes primes in a row, or if the base rings are not
+        fraction fields of polynomial rings, the method returns None.
+
+        EXAMPLES::
+
+           sage: from ore_algebra import *
+           sage: R.<n,k> = ZZ[]
+           sage: A.<Sn,Sk> = OreAlgebra(R)
+           sage: I = A.ideal([(k+1)*Sk+(k-n),(1-k+n)*Sn+(-1-n)])
+           sage: B = OreAlgebra(ZZ['n'].fraction_field(), 'Sn')
+           sage: I._ct_leading_monomials(Sk-1, B)
+           [Sn]
+        """
+        from sage.rings.finite_rings.finite_field_constructor import GF
+        from .guessing import _word_size_primes
+
+        A = self.ring()
+        try:
+            R = A.base_ring().ring(); S = algebra.base_ring().ring()
+        except AttributeError: # base rings other than fraction fields
+            return None
+        def modp(alg, ring, p):
+            return alg.change_ring(ring.change_ring(GF(p)).fraction_field())
+
+        for _, p in zip(range(max_primes), _word_size_primes()):
+            try:
+                Ap = modp(A, R, p); algp = modp(algebra, S, p)
+                Ip = Ap.ideal([Ap(g) for g in self.gens()])
+                T = Ip.ct(Ap(D), algebra=algp, certificates=False, early_termination=early_termination,
+                          infolevel=infolevel-2, iteration_limit=iteration_limit)
+            except (ArithmeticError, TypeError, ValueError):
+                continue
+            return [prod(g**e for g, e in zip(algebra.gens(), _exp(t))) for t in T]
+        return None
     
 class MonomialIterator(object):
     """
@@ -1014,6 +1155,12 @@ class MonomialIterator(object):
         self.__clear_pool()
         return (u, v)
 
+    def frontier(self):
+        """
+        Returns the list of pairs (tau, D) which are candidates for being returned by future calls to next.
+        """
+        return list(self.__pool)
+
     def declare_step(self):
         """
         Informs this iterator that among the terms to be outputted in the future there should not be any multiples
@@ -1023,8 +1170,8 @@ class MonomialIterator(object):
         self.__clear_pool()
 
     def __clear_pool(self):
-        self.__pool = [u for u in self.__pool
-                       if not (u[0]*u[1]).reduce(self.__stairs).is_zero()]
+        stairs = _PackedMonomials([_exp(tau) for tau in self.__stairs])
+        self.__pool = [u for u in self.__pool if stairs.divisor(_exp(u[0]*u[1])) is None]
         # discard stuff above the stairs
         self.__pool.sort(key=lambda u: smallest_lt_first(u[0]*u[1]), reverse=True) # smallest last
         prev = None
@@ -1036,6 +1183,13 @@ class MonomialIterator(object):
             prev = tau
         self.__pool = [tau for tau in self.__pool if tau is not None]
 
+def _exp(tau):
+    # exponent vector of a monomial of a univariate or multivariate Ore algebra
+    try:
+        return tau.exp()
+    except AttributeError:
+        return (tau.order(),)
+
 def fglm(algebra, one_vector, gen_matrices, infolevel=0, solver=None, early_termination=False):
     """
     Constructs a Groebner basis using linear algebra.
@@ -1046,7 +1200,9 @@ def fglm(algebra, one_vector, gen_matrices, infolevel=0, solver=None, early_term
       one_vector -- a vector in K(x,...)^n corresponding to the term 1
       gen_matrices -- a dictionary mapping the generators of A to nxn multiplication matrices
       infolevel -- verbosity of progress reports
-      solver -- callable to be used to determine bases of right kernels of matrices over K(x,...)
+      solver -- callable to be used to determine bases of right kernels of matrices over K(x,...).
+                It is only called once a linear dependency has been detected, see _fglm_incremental.
+                If no solver is given, the algebra's preferred solver is used.
       early_termination -- if set to True, this returns only the first nonzero Groebner basis element encountered
 
     OUTPUT:
@@ -1081,51 +1237,115 @@ def fglm(algebra, one_vector, gen_matrices, infolevel=0, solver=None, early_term
     if one_vector.is_zero():
         return [algebra.one()]
 
+    return _fglm_incremental(algebra, one_vector, gen_matrices, infolevel=infolevel, solver=solver, early_termination=early_termination)
+
+
+def _fglm_incremental(algebra, one_vector, gen_matrices, infolevel=0, solver=None, early_termination=False):
+    """
+    Implementation of fglm with batched matrix-vector products and incremental kernel computation.
+
+    The vectors corresponding to the terms are computed in batches: whenever the vector of the
+    next term is not known yet, the vectors of all the candidate terms (tau, D) of the monomial
+    iterator whose prefix tau is known are computed at once, by one product of the sparse
+    multiplication matrix of D with the matrix whose columns are the images of the vectors of
+    the prefixes under sigma.
+
+    Linear dependencies are detected by Gaussian elimination which is updated term by term: the
+    vectors of the terms under the stairs are kept in echelon form, so that the vector of a new
+    term only has to be reduced by them. Either it extends the echelon form by one vector, or it
+    reduces to zero. Only in the latter case the solver is called, on the matrix whose columns are
+    the vectors of the terms under the stairs and of the new term, and its kernel vector yields the
+    new Groebner basis element. The output is therefore the same as if the solver was applied after
+    every term.
+
+    EXAMPLES::
+
+      sage: from ore_algebra import *
+      sage: from ore_algebra.ideal import _fglm_incremental
+      sage: R.<x, y> = ZZ[]
+      sage: A.<Dx,Dy> = OreAlgebra(R)
+      sage: id = A.ideal([Dy - x, Dx - y])
+      sage: mats = dict((g, id.multiplication_matrix(g)) for g in A.gens())
+      sage: G = _fglm_incremental(id.ring(), id.operator_to_vector(1), mats)
+      sage: len(G), id.ring().ideal(G) == id
+      (2, True)
+
+    """
     def info(i, msg):
         if infolevel >= i:
             print(msg)
-    
-    basis = []; terms = {}
+
+    if solver is None:
+        solver = algebra._solver()
+
+    K = one_vector.base_ring()
+    if not K.is_field():
+        K = K.fraction_field()
     sigma = dict( (d, algebra.sigma(d)) for d in algebra.gens() )
     delta = dict( (d, algebra.delta(d)) for d in algebra.gens() )
+    mats = dict( (d, gen_matrices[d].change_ring(K).sparse_matrix()) for d in algebra.gens() )
 
     iterator = MonomialIterator(algebra)
-    terms[next(iterator)[0]] = one_vector ## map terms->vectors
-
-    B = [algebra.one()] ## terms under the stairs
-    M = matrix(algebra.base_ring(), len(one_vector), 1, one_vector) ## matrix whose columns are the vectors corresponding to B
-
-    if solver is None:
-        solver = algebra._solver()
-    
+    B = [next(iterator)[0]] ## terms under the stairs
+    terms = {B[0]: one_vector.change_ring(K)} ## map terms->vectors
+    one_vector = terms[B[0]]
+
+    # echelon form of the vectors of the terms in B: pairs (pivot index, vector w with w[pivot] = 1)
+    piv = min(one_vector.nonzero_positions())
+    echelon = [(piv, one_vector/one_vector[piv])]
+
+    def compute_batch():
+        batch = {}
+        for tau, d in iterator.frontier():
+            if tau in terms and tau*d not in terms and d in mats:
+                batch.setdefault(d, []).append(tau)
+        for d, taus in batch.items():
+            info(3, "computing " + str(len(taus)) + " vectors for " + str(d))
+            cols = [terms[tau] if sigma[d].is_identity() else terms[tau].apply_map(sigma[d]) for tau in taus]
+            prod = mats[d]*matrix(K, cols).transpose()
+            for k, tau in enumerate(taus):
+                v = prod.column(k)
+                if not delta[d].is_zero():
+                    v += terms[tau].apply_map(delta[d])
+                terms[tau*d] = v
+
+    basis = []
     try:
         while True:
             tau, d = next(iterator) # current term
             info(1, "next monomial: " + str(tau*d))
+            if tau*d not in terms:
+                compute_batch()
+            v = terms[tau*d]
 
-            # corresponding vector
-            v = terms[tau] if sigma[d].is_identity() else terms[tau].apply_map(sigma[d])
-            v = gen_matrices[d]*v
-            if not delta[d].is_zero():
-                v += terms[tau].apply_map(delta[d])
-            terms[tau*d] = v
-            
-            B.append(tau*d); Mold = M; M = M.augment(terms[tau*d])
-            ker = solver(M, infolevel=infolevel-3)
-            if len(ker) > 0:
+            # reduce by the echelon form
+            for j, w in echelon:
+                a = v[j]
+                if not a.is_zero():
+                    v = v - a*w
+
+            if v.is_zero():
                 info(2, "relation found.")
-                basis.append(add([ker[0][i]*B[i] for i in range(len(B))])) ## new basis element
-                B.pop(); M = Mold; iterator.declare_step() ## current term is not under the stairs
-                del terms[tau*d] # no longer needed -- hint to garbage collector
+                M = matrix(algebra.base_ring(), [terms[t] for t in B] + [terms[tau*d]]).transpose()
+                ker = solver(M, infolevel=infolevel-3)
+                if len(ker) == 0:
+                    raise ArithmeticError("solver did not find the relation")
+                basis.append(add([ker[0][i]*B[i] for i in range(len(B))]) + ker[0][len(B)]*tau*d) ## new basis element
+                iterator.declare_step() ## current term is not under the stairs
+                keep = set(B).union(u*g for u, g in iterator.frontier())
+                terms = dict((t, terms[t]) for t in terms if t in keep)
                 if early_termination:
                     break
+            else:
+                j = min(v.nonzero_positions())
+                echelon.append((j, v/v[j]))
+                B.append(tau*d)
     except StopIteration:
         pass
 
     return basis
 
-
-def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0):
+def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0, modular=False):
     """
     Triangularizes an operator matrix. 
 
@@ -1133,6 +1353,12 @@ def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0)
     The output matrix will be in staircase form. Row operations applied during the transformation act 
     on the matrix from the left.
 
+    By default, the pivot of each elimination step is an entry of smallest order and degree in the
+    current column. If modular is set to True, the pivots are instead chosen by running the elimination
+    on a homomorphic image of the matrix (see _uncouple_pivots), where among the entries of smallest
+    order the one is taken which leads to the smallest rows after the elimination step. The exact
+    elimination then follows these choices as long as they are consistent with the exact matrix.
+
     EXAMPLES::
 
       sage: from ore_algebra import *
@@ -1147,12 +1373,21 @@ def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0)
        [0,
         0,
         (-3*x^4 + 4*x^3 - 15*x^2 + 56*x - 48)*Dx^2 + (x^6 + x^5 + 9*x^4 - 9*x^3 - 4*x^2 - 88*x + 112)*Dx - x^5 + 4*x^4 - 19*x^3 + 44*x^2 - 88*x + 80]]
+      sage: T = uncouple([[Dx-x, 2,x], [3, x, Dx-4], [x*Dx-4, 4-x, 4]], modular=True)
+      sage: [[a.is_zero() for a in row] for row in T]
+      [[False, False, False], [True, False, False], [True, True, False]]
+      sage: T[2][2].order()
+      2
 
     """
 
     if column_swaps:
         raise NotImplementedError
 
+    def info(i, msg):
+        if infolevel >= i:
+            print(msg)
+
     if algebra is None:
         A = coercion_model.common_parent(*[elt for row in mat for elt in row])
     else:
@@ -1173,6 +1408,8 @@ def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0)
             U[i] = [d if i == j else zero for j in range(n)]
             V[i] = [(one if i == j else zero) for j in range(m)]
 
+    trace = _uncouple_pivots(mat, A_ff, infolevel=infolevel-1) if modular else None
+
     r = 0 # all rows before this one have been handled. 
     for c in range(m):
 
@@ -1182,7 +1419,15 @@ def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0)
         
         while len(nonzero) > 1:
 
-            piv_row = min(nonzero, key=lambda i: (mat[i][c].order(), mat[i][c].degree()))
+            piv_row = None
+            if trace:
+                c0, piv_row = trace.pop(0)
+                if c0 != c or piv_row not in nonzero or \
+                   mat[piv_row][c].order() > min(mat[i][c].order() for i in nonzero):
+                    info(1, "pivot pattern of the homomorphic image does not match, continuing without")
+                    piv_row = trace = None
+            if piv_row is None:
+                piv_row = min(nonzero, key=lambda i: (mat[i][c].order(), mat[i][c].degree()))
                 
             # move pivot to front
             mat[r], mat[piv_row] = mat[piv_row], mat[r]
@@ -1230,6 +1475,99 @@ def uncouple(mat, algebra=None, extended=False, column_swaps=False, infolevel=0)
         return mat
 
     
+def _uncouple_pivots(mat, A_ff, infolevel=0):
+    """
+    Determines the pivot choices for uncouple on a homomorphic image of mat.
+
+    INPUT:
+
+      mat -- a matrix of operators in A_ff, given as a list of lists, whose coefficients are
+             polynomials in one variable over some domain B
+      A_ff -- an Ore algebra over a univariate polynomial ring
+
+    OUTPUT:
+
+      A list of pairs (c, i) meaning that during the elimination of column c, the next pivot
+      should be taken from row i.
+
+    The entries of mat are mapped to operators over GF(p)[x] for a word size prime p, by
+    reducing the coefficients modulo p and, if B has generators, evaluating them at a random
+    point. The elimination of uncouple is then carried out on the image. Among the entries of
+    smallest order in the current column, it takes as pivot the one for which the total size
+    of the affected rows after the elimination step is smallest. If the denominator of some
+    coefficient vanishes at the chosen point, another prime and point are tried.
+
+    EXAMPLES::
+
+      sage: from ore_algebra import *
+      sage: from ore_algebra.ideal import _uncouple_pivots
+      sage: R.<x> = ZZ[]
+      sage: A.<Dx> = OreAlgebra(R)
+      sage: trace = _uncouple_pivots([list(map(A, [Dx, 1])), list(map(A, [x^3*Dx, x])), list(map(A, [x*Dx, x^2]))], A)
+      sage: [c for c, _ in trace]
+      [0]
+
+    """
+    import random
+    from sage.rings.finite_rings.finite_field_constructor import GF
+    from .guessing import _word_size_primes
+
+    R = A_ff.base_ring(); B = R.base_ring()
+    n = len(mat); m = len(mat[0])
+    rnd = random.Random(0)
+
+    def size(row):
+        return sum(max(q.degree(), 0) + 1 for op in row for q in op.coefficients(sparse=False))
+
+    for p in _word_size_primes():
+        F = GF(p) if B.characteristic() == 0 else GF(B.characteristic())
+        if B is ZZ or B is QQ or B.is_finite():
+            phi = F
+        else:
+            Bp = B.ring() if is_FractionField(B) else B
+            point = [F(rnd.randrange(p)) for _ in Bp.gens()]
+            phi = lambda q: F(q.numerator()(*point))/F(q.denominator()(*point))
+        Rp = R.change_ring(F); Ap = A_ff.change_ring(Rp)
+        try:
+            img = [[Ap([Rp([phi(a) for a in q]) for q in op.coefficients(sparse=False)]) for op in row] for row in mat]
+        except ZeroDivisionError:
+            continue
+        break
+
+    trace = []; r = 0
+    for c in range(m):
+        nonzero = [i for i in range(r, n) if not img[i][c].is_zero()]
+        if len(nonzero) == 0:
+            continue
+        while len(nonzero) > 1:
+            order = min(img[i][c].order() for i in nonzero)
+            best = None
+            for k in nonzero:
+                if img[k][c].order() > order:
+                    continue
+                rows = {}
+                for i in nonzero:
+                    if i != k:
+                        d, Q, _ = img[i][c].pseudo_quo_rem(img[k][c])
+                        rows[i] = [d*img[i][j] - Q*img[k][j] for j in range(c, m)]
+                cost = sum(size(row) for row in rows.values())
+                if best is None or cost < best[0]:
+                    best = (cost, k, rows)
+            _, k, rows = best
+            trace.append((c, k))
+            img[r], img[k] = img[k], img[r]
+            for i, row in rows.items():
+                i = k if i == r else i
+                img[i][c:] = row
+            nonzero = [i for i in range(r, n) if not img[i][c].is_zero()]
+        k = nonzero[0]
+        img[r], img[k] = img[k], img[r]
+        r += 1
+
+    if infolevel >= 1:
+        print("pivot pattern: " + str(trace))
+    return trace
+
 def solve_triangular_system(mat, rhs, solver=None):
     """
     Constructs a vector space basis for the uncoupled system mat*f = rhs
@@ -1273,6 +1611,271 @@ def solve_triangular_system(mat, rhs, solver=None):
 
     return sol
 
+def _f4_reduction(A, pairs, G, infolevel=0):
+    """
+    Reduces the S-polynomials of several critical pairs simultaneously.
+
+    INPUT:
+
+    - A -- an Ore algebra whose base ring is a polynomial ring
+    - pairs -- a list of critical pairs (t, u, v, s) as produced in groebner_basis
+    - G -- the current basis
+    - infolevel -- verbosity of progress reports
+
+    OUTPUT:
+
+    A list of elements of the left ideal generated by G whose leading terms are
+    not divisible by any leading term of an element of G, and which together
+    with G generate the S-polynomials of all the given pairs.
+
+    The rows of the Macaulay matrix are the left multiples tau*u and tau*v whose
+    leading monomial is the lcm t of a pair, completed by a symbolic
+    preprocessing which adds a multiple of an element of G for every monomial
+    appearing in the matrix that is divisible by one of their leading monomials.
+    The matrix is stored sparsely as a list of dictionaries and brought to
+    echelon form by fraction free elimination over the base ring, removing the
+    content of each row after every step. Those rows of the echelon form whose
+    leading monomial is not the leading monomial of one of the original rows
+    are returned.
+
+    EXAMPLES::
+
+       sage: from ore_algebra import *
+       sage: from ore_algebra.ideal import _f4_reduction
+       sage: R.<x,y> = ZZ[]
+       sage: A.<Dx,Dy> = OreAlgebra(R)
+       sage: u = x*Dx - y; v = Dy - x
+       sage: [h.exp() for h in _f4_reduction(A, [(Dx*Dy, u, v, 2)], [v, u])]
+       [(0, 0)]
+
+    """
+    X = A.gens()
+    P = A.associated_commutative_algebra()
+
+    def info(i, msg):
+        if infolevel >= i:
+            print(msg)
+
+    def multiple(e, g): # the left multiple of g with leading monomial e
+        return prod(x**i for x, i in zip(X, e.esub(g.exp())))*g
+
+    rows = []; seen = set(); done = set(); todo = []
+    def add_row(r):
+        rows.append(r.dict())
+        done.add(r.exp())
+        todo.extend(e for e in r.exponents() if e not in done)
+
+    for t, u, v, _ in pairs:
+        for g in (u, v):
+            if (t.exp(), id(g)) not in seen:
+                seen.add((t.exp(), id(g)))
+                add_row(multiple(t.exp(), g))
+
+    # symbolic preprocessing
+    lms = [g.exp() for g in G]
+    while len(todo) > 0:
+        e = todo.pop()
+        if e in done:
+            continue
+        done.add(e)
+        for g, m in zip(G, lms):
+            if min(e.esub(m)) >= 0:
+                add_row(multiple(e, g))
+                break
+
+    cols = sorted(set(e for r in rows for e in r), key=lambda e: P.monomial(*e), reverse=True)
+    index = dict((e, j) for j, e in enumerate(cols))
+    rows = [dict((index[e], c) for e, c in r.items()) for r in rows]
+    rows.sort(key=min)
+    leads = set(min(r) for r in rows)
+    info(1, lazy_string(lambda: "Macaulay matrix of size " + str(len(rows)) + "x" + str(len(cols)) + " with "
+                        + str(sum(len(r) for r in rows)) + " nonzero entries"))
+
+    # fraction free elimination
+    zero = P.base_ring().zero()
+    pivots = {}
+    for r in rows:
+        while len(r) > 0 and min(r) in pivots:
+            p = pivots[min(r)]; a = p[min(r)]; b = r[min(r)]
+            g = a.gcd(b); a = a//g; b = b//g
+            r = dict((k, a*c) for k, c in r.items())
+            for k, c in p.items():
+                r[k] = r.get(k, zero) - b*c
+            r = dict((k, c) for k, c in r.items() if not c.is_zero())
+            g = reduce(lambda u, v: u.gcd(v), r.values(), zero)
+            if not g.is_zero() and not g.is_one():
+                r = dict((k, c//g) for k, c in r.items())
+        if len(r) > 0:
+            pivots[min(r)] = r
+
+    new = [A(dict((cols[k], c) for k, c in pivots[j].items())) for j in sorted(pivots) if j not in leads]
+    info(1, str(len(new)) + " new basis elements")
+    return new
+
+def _groebner_basis_modular(A, gens, algorithm="buchberger", ncpus=1, verify=True, infolevel=0, max_primes=1000):
+    """
+    Multimodular computation of the reduced Groebner basis of a left ideal.
+
+    INPUT:
+
+    - A -- an Ore algebra whose base ring is a polynomial ring over ZZ or QQ
+    - gens -- a list of elements of A
+    - algorithm -- algorithm used for the Groebner bases modulo primes, see
+      OreLeftIdeal.groebner_basis
+    - ncpus -- number of primes to be processed in parallel
+    - verify -- whether to certify the result
+    - infolevel -- verbosity of progress reports
+    - max_primes -- maximal number of primes to be used
+
+    OUTPUT:
+
+    The reduced Groebner basis of the left ideal generated by gens, as a list of
+    elements of A with primitive coefficients, sorted such that the smallest
+    leading term comes first.
+
+    For each word size prime p, the reduced Groebner basis of the ideal over
+    GF(p)(x,...) is computed and normalized so that the coefficients of each
+    element are coprime polynomials and the leading coefficient of its leading
+    coefficient is one. The shape of an image is the list of the supports of
+    all its coefficients. Images of different shapes are reconstructed
+    separately, and only the shape that was obtained for the largest number of
+    primes is taken into account, so that the images of unlucky primes, which
+    typically have other leading monomials or lose some terms, are outvoted.
+
+    A reconstructed basis is accepted once rational reconstruction gives the
+    same result for two consecutive primes. If verify is True, it is moreover
+    checked that all the generators reduce to zero and that all S-polynomials
+    of the basis reduce to zero, which proves that it is a Groebner basis of an
+    ideal containing the given one. Otherwise, more primes are used. If no
+    basis has been accepted after max_primes primes, an ArithmeticError is
+    raised.
+
+    EXAMPLES::
+
+       sage: from ore_algebra import *
+       sage: from ore_algebra.ideal import _groebner_basis_modular
+       sage: R.<n,k> = ZZ[]
+       sage: A.<Sn,Sk> = OreAlgebra(R)
+       sage: gens = [-5+2*k-n + Sk + (3-2*k+n)*Sn, -2+4*k-2*n + (7-6*k+3*n)*Sk + (-3+2*k-n)*Sk^2]
+       sage: _groebner_basis_modular(A, gens)
+       [(n - 2*k + 3)*Sn + Sk - n + 2*k - 5,
+        (n - 2*k + 3)*Sk^2 + (-3*n + 6*k - 7)*Sk + 2*n - 4*k + 2]
+       sage: _groebner_basis_modular(A, gens, algorithm="f4", verify=False) == _
+       True
+
+    """
+    from sage.parallel.decorate import parallel
+    from sage.rings.finite_rings.finite_field_constructor import GF
+    from .guessing import _word_size_primes, _merge_homomorphic_images
+
+    def info(i, msg):
+        if infolevel >= i:
+            print(msg)
+
+    A0 = A; R = A.base_ring()
+    if R.base_ring() is QQ:
+        R = R.change_ring(ZZ)
+        A = A.change_ring(R)
+        gens = [A(lcm([c.denominator() for q in g.coefficients() for c in q.coefficients()])*g) for g in gens]
+    elif R.base_ring() is not ZZ:
+        raise NotImplementedError("modular Groebner bases require a base ring defined over ZZ or QQ")
+
+    def image(p):
+        Rp = R.change_ring(GF(p))
+        Ap = A.change_ring(Rp)
+        try:
+            Gp = Ap.ideal([Ap(g) for g in gens]).groebner_basis(algorithm=algorithm)
+        except ZeroDivisionError:
+            return None
+        shape = []; coords = []
+        for g in Gp:
+            terms = g.dict()
+            c = reduce(lambda a, b: a.gcd(b), list(terms.values()))
+            c = c*g.lc().lc()/c.lc()
+            support = []
+            for e in sorted(terms):
+                q = (terms[e]//c).dict()
+                support.append((e, tuple(sorted(q))))
+                coords.extend(q[m] for m in sorted(q))
+            shape.append(tuple(support))
+        return tuple(shape), vector(GF(p), coords)
+
+    def operators(shape, v):
+        G = []; i = 0
+        for support in shape:
+            terms = {}
+            for e, monomials in support:
+                terms[e] = R(dict(zip(monomials, v[i:i + len(monomials)])))
+                i += len(monomials)
+            g = A(terms)
+            c = reduce(lambda a, b: a.gcd(b), g.coefficients())
+            c *= g.lc().lc().sign()*c.lc().sign()
+            G.append(g.map_coefficients(lambda q: q//c))
+        G.sort(key=smallest_lt_first)
+        return G
+
+    X = A.gens()
+    def maketerm(e):
+        return prod(x**i for x, i in zip(X, e))
+
+    def is_groebner_basis(G):
+        if any(not g.reduce(G, normalize=True, coerce=False).is_zero() for g in gens):
+            return False
+        for j in range(len(G)):
+            for i in range(j):
+                u, w = G[i], G[j]
+                t = u.exp().emax(w.exp())
+                u = maketerm(t.esub(u.exp()))*u; w = maketerm(t.esub(w.exp()))*w
+                spol = w.lc()*u - u.lc()*w
+                if not spol.reduce(G, normalize=True, coerce=False).is_zero():
+                    return False
+        return True
+
+    primes = _word_size_primes()
+    if ncpus > 1:
+        forked_image = parallel(ncpus=ncpus)(image)
+
+    images = {} # shape -> [number of images, crt vector, modulus, previous and current reconstruction]
+    rejected = []
+    used = 0
+    while True:
+        if used >= max_primes:
+            raise ArithmeticError("no Groebner basis could be reconstructed from " + str(used) + " primes")
+        used += ncpus
+        if ncpus == 1:
+            p = next(primes)
+            batch = [(p, image(p))]
+        else:
+            batch = [next(primes) for i in range(ncpus)]
+            batch = sorted(((args[0][0], img) for args, img in forked_image(batch)), reverse=True)
+        for p, img in batch:
+            if img is None or isinstance(img, str): # unlucky or failed worker
+                continue
+            shape, vp = img
+            if shape not in images:
+                images[shape] = [0, vector(ZZ, len(vp)), ZZ.one(), None, None]
+            entry = images[shape]
+            rec, m = _merge_homomorphic_images(entry[1], entry[2], vp, p)
+            entry[1], entry[2] = _merge_homomorphic_images(entry[1], entry[2], vp, p, reconstruct=False)
+            entry[0] += 1
+            entry[3], entry[4] = entry[4], (rec if m.is_zero() else None)
+        if len(images) == 0:
+            continue
+        shape = max(images, key=lambda s: images[s][0])
+        count, _, mod, last, rec = images[shape]
+        info(1, lazy_string(lambda: datetime.today().ctime() + ": " + str(sum(e[0] for e in images.values())) +
+                            " images, " + str(count) + " of the majority shape, modulus of " + str(mod.nbits()) + " bits"))
+        if rec is None or rec != last or rec in rejected:
+            continue
+        G = operators(shape, rec)
+        if verify:
+            info(1, "verifying candidate...")
+            if not is_groebner_basis(G):
+                info(1, "verification failed, continuing with more primes")
+                rejected.append(rec)
+                continue
+        return [A0(g) for g in G]
+
 smallest_lt_first = cmp_to_key(
         lambda u,v: 1 if (u.lm()+v.lm()).lm() == u.lm() else -1)
 
@@ -672,20 +672,28 @@ def hermite(early_termination=True):
        sage: V = my_solver(A)
        sage: A*V[0]
        (0, 0, 0, 0)
+       sage: A = MatrixSpace(GF(1093)['x'], 1, 3).random_element(degree=100)
+       sage: V = my_solver(A)
+       sage: A*V[0]
+       (0)
 
-    ALGORITHM: Hermite-Pade approximation
+    ALGORITHM: Hermite-Pade approximation. The approximant bases are computed by divide and
+    conquer; over prime fields of word size, the base case works with matrices over the prime
+    field rather than with individual polynomial coefficients.
     """
     def hermite_solver(mat, degrees=[], infolevel=0):
         r"""See docstring of hermite() for further information"""
         return _hermite(early_termination, mat, degrees, infolevel)
     return hermite_solver
 
-def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
+def _hermite(early_termination, mat, degrees, infolevel, truncate=None, shifts=None):
     r"""
     internal version of nullspace.hermite_.
     """
     # if the truncate option is set to an integer, approximation proceeds to order x^truncate
     # and, if len(degrees)>0, only solutions whose degree is at most degrees[0] are returned. 
+    # if shifts is given, the degree of the ith component of a solution is counted as its 
+    # actual degree plus shifts[i], so that the components can have different degree bounds.
     
     n, m = mat.dimensions(); matdeg = max( mat[i,j].degree() for i in range(n) for j in range(m) )
     _launch_info(infolevel, "hermite", dim=(n,m), deg=matdeg, domain=mat.parent().base_ring())
@@ -699,12 +707,13 @@ def _hermite(early_termination, mat, degrees, infolevel, truncate=None):
         deg = degrees[0] + matdeg 
         early_termination = False
     R = mat.parent().base_ring() # expected to be univariate polynomial ring over a field
-    V, done = _hermite_rec(early_termination, R, mat, deg + 1, [0 for i in range(m) ], \
+    shifts = [0 for i in range(m)] if shifts is None else list(shifts)
+    V, done = _hermite_rec(early_termination, R, mat, deg + 1, list(shifts), \
                            _alter_infolevel(infolevel, -1, 1))
     V = V.transpose()
     if truncate is not None:
         if len(degrees) > 0:
-            V = [ v for v in V if max(p.degree() for p in v) <= degrees[0] ] 
+            V = [ v for v in V if max(p.degree() + s for p, s in zip(v, shifts)) <= degrees[0] ] 
     elif not done:
         V = [ v for v in V if max(p.degree() for p in v) <= deg - matdeg ] 
     # if the coefficient domain is a field, make the lowest-indexed nonzero component of each vector monic
@@ -794,6 +803,126 @@ def _hermite_base(early_termination, R, A, u, D):
 
     return Matrix(R, V), False
 
+def _hermite_base_modn(early_termination, R, A, u, D):
+    r"""
+    Variant of ``_hermite_base`` for polynomials over a prime field of word size.
+
+    Same input and output as ``_hermite_base``, except that ``A`` is a matrix over ``R``. 
+
+    The order is raised by one in each step (M-Basis). The coefficients of `V` and the 
+    coefficients of `A\cdot V` which remain to be cancelled are kept as stacks of matrices over 
+    the prime field, so that each step amounts to one echelon form of a constant matrix and 
+    a few products of word size matrices. 
+    """
+
+    K = R.base_ring(); n, m = A.dimensions()
+    Z = MatrixSpace(K, m, m).zero_matrix()
+
+    # Res has the coefficients of x^k, ..., x^(u-1) of A*V, stacked on top of each other
+    Res = matrix(K, u*n, m, [A[i, j][k] for k in range(u) for i in range(n) for j in range(m)])
+    # Vs has the coefficients of x^0, x^1, ... of V, stacked on top of each other
+    Vs = MatrixSpace(K, m, m).identity_matrix()
+
+    for k in range(u):
+
+        if early_termination and k < u - 1:
+            # if V[j] is already a solution vector, then the j-th column of Res must be zero.
+            candidates = [j for j in range(m) if Res.column(j).is_zero()]
+            if candidates:
+                V = Vs.matrix_from_columns(candidates)
+                return Matrix(R, m, len(candidates), [R([V[d*m + i, j] for d in range(V.nrows()//m)]) 
+                                                       for i in range(m) for j in range(len(candidates))]), True
+
+        rows = Res.nrows() - n
+        R0 = Res.submatrix(0, 0, n, m)
+        if R0.is_zero():
+            Res = Res.submatrix(n, 0, rows, m)
+            continue # kth coefficient of A*V is already zero
+
+        # pivots: the first columns spanning the column space of R0, with respect to increasing D
+        perm = sorted(range(m), key=lambda j: (D[j], j))
+        E = R0.matrix_from_columns(perm).echelon_form()
+        pivots = E.pivots(); is_pivot = set(pivots)
+
+        # V <- V*T0 + x*V*T1, where T0 eliminates the non-pivot columns and T1 selects the pivots
+        T0 = Z.__copy__(); T1 = Z.__copy__()
+        for t in range(m):
+            j = perm[t]
+            if t in is_pivot:
+                T1[j, j] = 1
+                D[j] += 1
+            else:
+                T0[j, j] = 1
+                for r, c in enumerate(pivots):
+                    if c > t:
+                        break
+                    T0[perm[c], j] = -E[r, t]
+
+        Vs = (Vs*T0).stack(Z) + Z.stack(Vs*T1)
+        Res = Res.submatrix(n, 0, rows, m)*T0 + Res.submatrix(0, 0, rows, m)*T1
+
+    return Matrix(R, m, m, [R([Vs[d*m + i, j] for d in range(Vs.nrows()//m)]) 
+                            for i in range(m) for j in range(m)]), False
+
+def _interpolation_base(R, A, D):
+    r"""
+    Interpolation analog of ``_hermite_base`` (iterative version):
+
+    INPUT:
+
+    - ``R`` -- a univariate polynomial ring over a field ``k``
+    - ``A`` -- a list of pairs ``(z, row)`` where ``z`` is an element of ``k`` and ``row`` is a list
+      of ``len(D)`` elements of ``k``
+    - ``D`` -- a list of integers
+
+    OUTPUT: a polynomial square matrix ``V`` of size ``len(D)`` such that
+    
+    - :math:`\det(V)\neq0`
+    - :math:`\sum_i \mathrm{row}[i] V_{i,j}(z) = 0` for all ``(z, row)`` in ``A`` and all `j`
+    - :math:`\max_{i,j}( \deg(V_{i,j}) + D[i] )` is as small as possible
+
+    Several pairs may share the same point ``z``. 
+
+    .. NOTE::
+    
+      - The rows in ``A`` will be overwritten during the calculation
+      - The ``D`` vector will be updated to :math:`[\max_i( \deg V_{i,j}) + D[i] ), j=0,\dots,n-1]`
+    """
+
+    m = len(D); x = R.gen(); one = R.one(); zero = R.zero()
+    V = [ [ (one if i==j else zero) for i in range(m) ] for j in range(m) ]
+    infinity = max(D) + len(A) + 1 # larger than the largest possible value in D throughout this calculation
+    one = R.base_ring().one()
+
+    for k in range(len(A)):
+        z, row = A[k]
+        # pivot: among the indices j where row[j]!=0, pick one where D[j] is minimal
+        piv = -1; d = infinity
+        for j in range(m):
+            if D[j] < d and row[j]:
+                piv = j; d = D[j]
+        if piv == -1:
+            continue # condition is already satisfied
+        # elimination
+        piv_element = -one/row[piv]
+        for j in range(m):
+            if j != piv and row[j]:
+                q = piv_element*row[j]
+                for v in V:
+                    v[j] += q*v[piv]
+                for l in range(k + 1, len(A)):
+                    r = A[l][1]
+                    r[j] += q*r[piv]
+        # multiplication by x - z and degree update
+        for v in V:
+            v[piv] *= x - z
+        for l in range(k + 1, len(A)):
+            r = A[l][1]
+            r[piv] *= A[l][0] - z
+        D[piv] += 1
+
+    return Matrix(R, V)
+
 def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
     r"""
     Recursive step of Hermite-Pade (divide and conquer):
@@ -823,8 +952,11 @@ def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
 
     # 0. if cut is small, switch to direct method
     if cut <= 64:
-        # B = low degree coeffs of A.
         _info(infolevel, "base case: switching to direct method.")
+        K = R.base_ring()
+        if K.is_prime_field() and 0 < K.characteristic() < MAX_MODULUS:
+            return _hermite_base_modn(early_termination, R, A, cut, offset)
+        # B = low degree coeffs of A.
         B = [ [ A[i,j].coefficients(sparse=False)[:cut] for j in range(A.ncols()) ] for i in range(A.nrows()) ]
         z = R.base_ring().zero()
         for row in B:
@@ -834,6 +966,8 @@ def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
         return _hermite_base(early_termination, R, B, cut, offset)
     
     # 1. write A = A0 + A1 x^ceil(k/2) with deg(A0), deg(A1) < ceil(k/2)
+    #    (higher order terms do not matter and would only slow down the product in step 3)
+    A = A.apply_map(lambda p : p.truncate(cut))
     cut2 = int(math.ceil(cut/2))
 
     _info(infolevel, "decending into first recursive call...")
@@ -844,7 +978,7 @@ def _hermite_rec(early_termination, R, A, cut, offset, infolevel):
         return V0, done
 
     # 3. set B=A1*V0 rem x^ceil(k/2)
-    B = (A*V0).apply_map(lambda p : p.shift(-cut2))
+    B = (A*V0).apply_map(lambda p : p.shift(-cut2).truncate(cut - cut2))
     
     # 4. compute V1 such that B*V1 == 0 mod x^ceil(k/2) recursively
     _info(infolevel, "decending into second recursive call...")
@@ -94,7 +94,10 @@ def taylor_shift_univ_modp_ratfun(q, i):
     den = taylor_shift_univ_modp_poly(q.denominator(), i)
     return q.parent()(num, den, coerce=False, reduce=False)
 
+from collections import OrderedDict
+
 from sage.misc.cachefunc import cached_method
+from sage.misc.misc_c import prod
 from sage.structure.element import RingElement
 from sage.structure.unique_representation import UniqueRepresentation
 from sage.rings.ring import Algebra
@@ -111,6 +114,53 @@ from sage.rings.finite_rings.all import GF
 
 from . import nullspace
 
+def taylor_shift_table(polys, points):
+    r"""
+    Return the table ``[[p(x + a) for a in points] for p in polys]`` for
+    univariate polynomials ``polys`` over a ring of characteristic zero.
+
+    All shifts are computed at once: writing `p(x + a) = \sum_m q_m(x) a^m`
+    with `q_m = p^{(m)}/m!`, the coefficients of all the shifted polynomials
+    are the entries of the product of the Vandermonde matrix `(a^m)` by the
+    matrix of the coefficients of the `q_m`.
+
+    EXAMPLES::
+
+        sage: from ore_algebra.ore_algebra import taylor_shift_table
+        sage: R.<x> = ZZ['x']
+        sage: taylor_shift_table([x^3, 2*x - 1, R(5)], [0, 1, -2])
+        [[x^3, x^3 + 3*x^2 + 3*x + 1, x^3 - 6*x^2 + 12*x - 8],
+         [2*x - 1, 2*x + 1, 2*x - 5],
+         [5, 5, 5]]
+    """
+    from sage.matrix.constructor import Matrix
+    polys = list(polys)
+    if not polys:
+        return []
+    P = polys[0].parent()
+    C = P.base_ring()
+    points = [C(a) for a in points]
+    d = max(p.degree() for p in polys)
+    if d <= 0:
+        return [[p for a in points] for p in polys]
+    # one block of columns per polynomial: column l of block i, row m holds
+    # the coefficient of x^l in p_i^{(m)}/m!
+    blocks = []
+    for p in polys:
+        q = p; rows = []
+        for m in range(d + 1):
+            if m > 0:
+                q = q.derivative()
+                q = q // m if C is ZZ else q / m
+            rows.append(q.padded_list(d + 1))
+        blocks.append(rows)
+    T = Matrix(C, d + 1, (d + 1)*len(polys),
+               [[u for rows in blocks for u in rows[m]] for m in range(d + 1)])
+    V = Matrix(C, len(points), d + 1, [[a**m for m in range(d + 1)] for a in points])
+    W = V*T
+    return [[P(W[k][i*(d + 1):(i + 1)*(d + 1)].list()) for k in range(len(points))]
+            for i in range(len(polys))]
+
 def is_OreAlgebra(A):
     r"""
     Checks whether `A` is an Ore algebra object.     
@@ -197,6 +247,8 @@ class Sigma_class(object):
         [('x1', 2*x1), ('x2', -x2 + 1), ('x3', x3 + 1)]
     """
 
+    cache_size = 1024
+
     def __init__(self, R, d):
 
         Rgens = R.gens(); my_dict = {}; is_id = True
@@ -220,15 +272,49 @@ class Sigma_class(object):
         self.__dict = my_dict
         self.__is_identity = is_id
         self.__powers = {1: my_dict}
+        self.__fun = None
+        self.__cache = OrderedDict()
 
     def __call__(self, p, exp=1):
 
-        if self.__is_identity:
+        if self.__is_identity or exp == 0:
             return p
-        elif exp == 1:
+        key = (p, exp)
+        try:
+            return self._cache_lookup(key)
+        except (KeyError, TypeError):
+            pass
+        q = self._apply(p, exp)
+        self._cache_store(key, q)
+        return q
+
+    def _cache_lookup(self, key):
+        cache = self.__cache
+        q = cache.pop(key)
+        cache[key] = q
+        return q
+
+    def _cache_store(self, key, q):
+        cache = self.__cache
+        try:
+            cache[key] = q
+        except TypeError: # unhashable argument
+            return
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def clear_cache(self):
+        r"""
+        Forget all images memoized by ``self``.
+        """
+        self.__cache.clear()
+
+    def _apply(self, p, exp):
+
+        if exp == 1 and self.__fun is None:
             return self.__R(p)(**self.__dict)
-        elif exp == 0:
-            return p
+        elif exp > 0 and self.__fun is not None:
+            return self.__fun(p, exp)
         elif exp > 1:
 
             pows = self.__powers
@@ -243,10 +329,10 @@ class Sigma_class(object):
                 if n in pows:
                     return pows[n].copy()
                 elif n % 2 == 0:
-                    d = pow_dict(n/2)
+                    d = pow_dict(n//2)
                     pows[n] = d = merge(d, d)
                 else:
-                    d = pow_dict((n - 1)/2)
+                    d = pow_dict((n - 1)//2)
                     pows[n] = d = merge(merge(d, d), self.__dict)
                 return d
 
@@ -258,11 +344,127 @@ class Sigma_class(object):
             raise ValueError("illegal sigma power " + str(exp))
 
     def set_call(self, fun):
-        self.__call__ = fun 
+        r"""
+        Use ``fun(p, k)`` for computing `\sigma^k(p)` for `k > 0` instead of
+        substituting the images of the generators.
+        """
+        self.__fun = fun
+        self.__cache.clear()
 
     def is_identity(self):
         return self.__is_identity
 
+    def _shift_constant(self):
+        r"""
+        Return `c` if ``self`` is `x \mapsto x + c` for the generator `x` of a
+        univariate polynomial ring (or of its fraction field) over a ring of
+        characteristic zero, and ``None`` otherwise.
+        """
+        try:
+            return self.__shift_constant
+        except AttributeError:
+            pass
+        c = None
+        R = self.__R
+        P = R.ring() if is_FractionField(R) else R
+        if is_PolynomialRing(P) and P.characteristic() == 0 and \
+           (P.base_ring() is ZZ or P.base_ring().is_field()):
+            x = P.gen()
+            try:
+                sx = P(self.__dict[str(x)])
+                if sx.degree() == 1 and sx[1].is_one() and not sx[0].is_zero():
+                    c = sx[0]
+            except (TypeError, ValueError):
+                pass
+        self.__shift_constant = c
+        return c
+
+    def shifts(self, polys, n):
+        r"""
+        Return the table ``[[p, sigma(p), ..., sigma^n(p)] for p in polys]``.
+
+        If `n` is negative, the rows are ``[p, sigma^(-1)(p), ...,
+        sigma^n(p)]`` instead. When ``self`` is a shift `x \mapsto x + c` of a
+        univariate polynomial ring or of its fraction field, all the shifted
+        polynomials are computed at once by a batched Taylor shift (see
+        :func:`taylor_shift_table`). The results are memoized.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']
+            sage: A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: A.sigma().shifts([x^2, 3*x + 1], 3)
+            [[x^2, x^2 + 2*x + 1, x^2 + 4*x + 4, x^2 + 6*x + 9],
+             [3*x + 1, 3*x + 4, 3*x + 7, 3*x + 10]]
+            sage: A.sigma().shifts([x^2], -2)
+            [[x^2, x^2 - 2*x + 1, x^2 - 4*x + 4]]
+            sage: B.<Sx> = OreAlgebra(R.fraction_field(), 'Sx')
+            sage: B.sigma().shifts([1/x], 2)
+            [[1/x, 1/(x + 1), 1/(x + 2)]]
+        """
+        return self._shift_table(polys, list(range(0, n + 1) if n >= 0 else range(0, n - 1, -1)))
+
+    def apply_all(self, polys, exp=1):
+        r"""
+        Return the list ``[sigma^exp(p) for p in polys]``, computed in one batch
+        when possible.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = QQ['x']
+            sage: A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: A.sigma().apply_all([x, x^2, 1/2], -1)
+            [x - 1, x^2 - 2*x + 1, 1/2]
+        """
+        return [row[0] for row in self._shift_table(polys, [exp])]
+
+    def _shift_table(self, polys, exps):
+
+        polys = list(polys)
+        if self.__is_identity:
+            return [[p for e in exps] for p in polys]
+
+        table = [[None]*len(exps) for p in polys]
+        todo = {}
+        for i, p in enumerate(polys):
+            for j, e in enumerate(exps):
+                if e == 0:
+                    table[i][j] = p
+                    continue
+                try:
+                    table[i][j] = self._cache_lookup((p, e))
+                except (KeyError, TypeError):
+                    todo.setdefault(i, []).append(j)
+        if not todo:
+            return table
+
+        c = self._shift_constant()
+        if c is None:
+            for i, js in todo.items():
+                for j in js:
+                    table[i][j] = self(polys[i], exps[j])
+            return table
+
+        R = self.__R
+        rows = sorted(todo)
+        todo_exps = sorted(set(exps[j] for i in rows for j in todo[i]))
+        if is_FractionField(R):
+            elts = [R(polys[i]) for i in rows]
+            nums = taylor_shift_table([q.numerator() for q in elts], [c*e for e in todo_exps])
+            dens = taylor_shift_table([q.denominator() for q in elts], [c*e for e in todo_exps])
+            shifted = [[R(u, v, coerce=False, reduce=False) for u, v in zip(nu, de)]
+                       for nu, de in zip(nums, dens)]
+        else:
+            shifted = taylor_shift_table([R(polys[i]) for i in rows], [c*e for e in todo_exps])
+        pos = dict((e, k) for k, e in enumerate(todo_exps))
+        for i, row in zip(rows, shifted):
+            for j in todo[i]:
+                q = table[i][j] = row[pos[exps[j]]]
+                self._cache_store((polys[i], exps[j]), q)
+        return table
+
     def dict(self):
         r"""
         Returns a dictionary representing ``self``
@@ -310,19 +512,9 @@ class Sigma_class(object):
         elif n == 1:
             return p
         elif n > 1:
-            q = p; out = p
-            for i in range(n - 1):
-                q = self(q)
-                out = out*q
-            return out
+            return prod(self.shifts([p], n - 1)[0])
         elif n < 0:
-            s = self.inverse()
-            q = ~s(p); out = q
-            n = -n 
-            for i in range(n - 1):
-                q = s(q)
-                out = out*q
-            return out                
+            return ~prod(self.shifts([p], n)[0][1:])
         else:
             raise ValueError("illegal argument to Sigma.factorial: " + str(n))
 
@@ -1024,6 +1216,7 @@ class OreAlgebra_generic(UniqueRepresentation, Algebra):
         self._operator_class = operator_class
         self.__solvers = {}
         self.__product_rules = product_rules
+        self.__product_cache = OrderedDict()
 
     # information extraction
 
@@ -1197,6 +1390,67 @@ class OreAlgebra_generic(UniqueRepresentation, Algebra):
         """
         return self._gens[self._gen_to_idx(n)][2]
 
+    product_cache_size = 4096
+
+    def _monomial_times(self, exp, c):
+        r"""
+        Returns the product `D^{exp} c` of a monomial in the generators of this algebra
+        and an element `c` of the base ring, in normal form.
+
+        The result is a dictionary mapping exponent tuples to nonzero elements of the
+        base ring, and must not be modified. The products `D^a c D^b` needed by the
+        multiplication of operators are obtained from it by adding `b` to the exponents.
+        All the products encountered while computing `D^{exp} c` by induction on the
+        exponents are memoized in a cache of at most ``product_cache_size`` entries,
+        which is shared by all the elements of this algebra and from which the least
+        recently used entries are evicted.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import OreAlgebra
+            sage: R.<x,y> = QQ['x','y']
+            sage: A.<Dx,Sy> = OreAlgebra(R, 'Dx', 'Sy')
+            sage: sorted(A._monomial_times((2, 1), x*y).items())
+            [((1, 1), 2*y + 2), ((2, 1), x*y + x)]
+            sage: (Dx^2*Sy)*(x*y) == A({(1, 1): 2*y + 2, (2, 1): x*y + x})
+            True
+        """
+        exp = tuple(int(e) for e in exp)
+        key = (exp, c)
+        cache = self.__product_cache
+        try:
+            res = cache.pop(key)
+            cache[key] = res
+            return res
+        except KeyError:
+            pass
+
+        i = len(exp) - 1
+        while i >= 0 and exp[i] == 0:
+            i -= 1
+        if i < 0:
+            res = {exp: c} if not c.is_zero() else {}
+        else:
+            sigma = self.sigma(i); delta = self.delta(i)
+            sub = list(exp); sub[i] -= 1
+            res = {}
+            for e, q in self._monomial_times(sub, c).items():
+                shifted = list(e); shifted[i] += 1
+                for f, r in ((tuple(shifted), sigma(q)), (e, delta(q))):
+                    res[f] = res[f] + r if f in res else r
+            res = dict((e, q) for e, q in res.items() if not q.is_zero())
+
+        cache[key] = res
+        while len(cache) > self.product_cache_size:
+            cache.popitem(last=False)
+        return res
+
+    def clear_product_cache(self):
+        r"""
+        Forget all the products memoized by :meth:`_monomial_times`.
+        """
+        self.__product_cache.clear()
+
     def is_D(self, n=0):
         r"""
         Checks whether the `n` th generator of this algebra is the standard derivation `d/dx`
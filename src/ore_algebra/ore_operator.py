@@ -743,6 +743,33 @@ class UnivariateOreOperator(OreOperator):
         if self.is_zero(): return self
         if right.is_zero(): return right
 
+        R = self.parent() # Ore algebra
+        if R.sigma().is_identity():
+            return self._mul_derivation(right)
+        elif R.delta().is_zero():
+            return self._mul_endomorphism(right)
+        else:
+            return self._mul_generic(right)
+
+    def _mul_generic(self, right):
+        r"""
+        Multiply ``self`` by ``right`` by repeatedly applying the commutation
+        rule `D b = \sigma(b) D + \delta(b)` to ``right``.
+
+        This works for every Ore algebra, but applies ``sigma`` and ``delta``
+        to all coefficients of `D^i B` for each `i`. The multiplication
+        operator ``*`` uses the faster kernels :meth:`_mul_derivation` and
+        :meth:`_mul_endomorphism` whenever ``delta`` or ``sigma`` is trivial.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = QQ['x']
+            sage: A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: L = x*Dx^2 + 1; M = Dx + x^2
+            sage: L._mul_generic(M) == L*M
+            True
+        """
         R = self.parent() # Ore algebra
         sigma = R.sigma(); delta = R.delta()
         D = R.associated_commutative_algebra().gen()
@@ -765,6 +792,93 @@ class UnivariateOreOperator(OreOperator):
 
         return R(res)
 
+    def _mul_derivation(self, right):
+        r"""
+        Multiply ``self`` by ``right`` in an Ore algebra where ``sigma`` is
+        the identity (e.g., differential operators or Euler operators).
+
+        The commutation rule is applied in bulk using the Leibniz formula
+        `D^i b = \sum_k \binom{i}{k} \delta^k(b) D^{i-k}`, so that the product
+        is
+
+        .. MATH::
+
+            A B = \sum_{k \geq 0} A_k \, \delta^k(B),
+            \qquad A_k = \sum_i \binom{i}{k} a_i D^{i-k},
+
+        where the products on the right are taken in the associated commutative
+        algebra and `\delta^k(B)` is ``B`` with `\delta^k` applied to each
+        coefficient. The sum stops as soon as `k` exceeds the order of ``self``
+        or `\delta^k(B)` vanishes, so that only `\min(r, d) + 1` commutative
+        products are needed, where `r` is the order of ``self`` and `d` the
+        degree of ``right`` when ``delta`` lowers degrees.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = QQ['x']
+            sage: A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: L = (x^2+1)*Dx^3 + x*Dx + 5; M = x^3*Dx^2 - Dx + x
+            sage: L._mul_derivation(M) == L._mul_generic(M)
+            True
+            sage: T.<Tx> = OreAlgebra(R, 'Tx')
+            sage: L = (x+1)*Tx^2 - x^2; M = x^3*Tx + 1
+            sage: L._mul_derivation(M) == L._mul_generic(M)
+            True
+        """
+        R = self.parent()
+        delta = R.delta()
+        P = R.associated_commutative_algebra()
+        a = self.coefficients(sparse=False)
+        r = len(a) - 1
+        B = right.polynomial()
+        res = self.polynomial()*B
+        for k in range(1, r + 1):
+            B = B.map_coefficients(delta)
+            if B.is_zero():
+                break
+            Ak = P([ZZ(i).binomial(k)*a[i] for i in range(k, r + 1)])
+            res += Ak*B
+        return R(res)
+
+    def _mul_endomorphism(self, right):
+        r"""
+        Multiply ``self`` by ``right`` in an Ore algebra where ``delta`` is
+        zero (e.g., shift or `q`-shift operators).
+
+        In this case `a_i D^i \cdot b_j D^j = a_i \sigma^i(b_j) D^{i+j}`. All the
+        shifts `\sigma^0(b_j), \dots, \sigma^r(b_j)` of the coefficients of
+        ``right`` are computed in one batch by ``sigma.shifts()`` (a Taylor
+        shift table for the standard shift), and the coefficients of the
+        product are accumulated directly, without forming the intermediate
+        operators `D^i B`.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']
+            sage: A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: L = (x^2+1)*Sx^3 + x*Sx + 5; M = x^3*Sx^2 - Sx + x
+            sage: L._mul_endomorphism(M) == L._mul_generic(M)
+            True
+            sage: L = (x+1)*Sx^2 - x^2; L._mul_endomorphism(R(3)) == 3*L
+            True
+        """
+        R = self.parent()
+        sigma = R.sigma()
+        zero = R.base_ring().zero()
+        a = self.coefficients(sparse=False)
+        b = right.coefficients(sparse=False)
+        r = len(a) - 1
+        c = [zero]*(r + len(b))
+        for j, bj in enumerate(sigma.shifts(b, r)):
+            if bj[0].is_zero():
+                continue
+            for i, ai in enumerate(a):
+                if not ai.is_zero():
+                    c[i + j] += ai*bj[i]
+        return R(c)
+
     def _rmul_(self, left):
         return self.parent()([left*c for c in self])
 
@@ -801,6 +915,8 @@ class UnivariateOreOperator(OreOperator):
             R = R.change_ring(R.base_ring().fraction_field())
             p=R(p)
             q=R(q)
+        if fractionFree==False:
+            return p._right_division(q)
         sigma = R.sigma()
         D = R.gen()
         orddiff = p.order() - q.order()
@@ -826,6 +942,64 @@ class UnivariateOreOperator(OreOperator):
 
     quo_rem.__doc__ = OreOperator.quo_rem.__doc__
 
+    def _right_division(self, other):
+        r"""
+        Right division with remainder of ``self`` by ``other``, for operators over a field.
+
+        The operators `D^k B`, `k = 0, \dots, r - s`, where `B` is ``other`` and `r`, `s`
+        are the orders of the operands, are computed once as coefficient lists, each from
+        the previous one by a single application of the commutation rule (or all at once
+        by ``sigma.shifts()`` if ``delta`` is zero). The coefficients of the quotient are
+        then found from the top, and each step only subtracts a scalar multiple of one of
+        these lists from the current remainder. This takes `O((r - s) s)` operations in
+        the base ring instead of the `O((r - s)^2 s)` needed for forming the products
+        `c D^k B` with the multiplication of the algebra.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = QQ['x']; A.<Dx> = OreAlgebra(R.fraction_field(), 'Dx')
+            sage: L = (x^2+1)*Dx^5 + x*Dx^3 - 7; M = x*Dx^2 + Dx - x
+            sage: Q, Rem = L._right_division(M)
+            sage: Q*M + Rem == L and Rem.order() < 2
+            True
+            sage: A.<Sx> = OreAlgebra(R.fraction_field(), 'Sx')
+            sage: L = (x^2+1)*Sx^5 + x*Sx^3 - 7; M = x*Sx^2 + Sx - x
+            sage: Q, Rem = L._right_division(M)
+            sage: Q*M + Rem == L and Rem.order() < 2
+            True
+        """
+        R = self.parent(); K = R.base_ring(); zero = K.zero()
+        sigma = R.sigma(); delta = R.delta()
+        p = self.coefficients(sparse=False)
+        q = other.coefficients(sparse=False)
+        r = len(p) - 1; s = len(q) - 1
+        if r < s:
+            return R.zero(), self
+
+        # rows[k] = coefficients of D^k*other
+        if delta.is_zero():
+            shifted = sigma.shifts(q, r - s)
+            rows = [[zero]*k + [shifted[j][k] for j in range(s + 1)] for k in range(r - s + 1)]
+        else:
+            rows = [q]
+            for k in range(r - s):
+                b = rows[-1]
+                rows.append([delta(b[0])] + [sigma(b[j - 1]) + delta(b[j]) for j in range(1, len(b))]
+                            + [sigma(b[-1])])
+
+        quo = [zero]*(r - s + 1)
+        for k in range(r - s, -1, -1):
+            c = p[k + s]
+            if c.is_zero():
+                continue
+            c = quo[k] = c/rows[k][k + s]
+            row = rows[k]
+            for j in range(k + s + 1):
+                if not row[j].is_zero():
+                    p[j] -= c*row[j]
+        return R(quo), R(p[:s])
+
     def pseudo_quo_rem(self, other):
 
         if other.is_zero():
@@ -882,6 +1056,10 @@ class UnivariateOreOperator(OreOperator):
         - ``other`` -- one or more operators which together with ``self`` can be coerced to a common parent.
         - ``prs`` (default: "essential") -- pseudo remainder sequence to be used. Possible values are
           "essential", "primitive", "classic", "subresultant", "monic".
+        - ``algorithm`` -- either "prs" (use a pseudo remainder sequence), or "modular" (compute the
+          gcrd modulo several primes and reconstruct it, see ``_gcrd_modular``; only for operators 
+          with coefficients in `\ZZ[x]` or `\QQ[x]`). Default: "prs".
+        - ``ncpus`` (default: 1) -- number of primes processed in parallel by the modular algorithm.
         
         OUTPUT:
 
@@ -922,6 +1100,12 @@ class UnivariateOreOperator(OreOperator):
         prs = kwargs["prs"] if "prs" in kwargs else None
         infolevel = kwargs["infolevel"] if "infolevel" in kwargs else 0
 
+        algorithm = kwargs.get("algorithm", None)
+        if algorithm == "modular":
+            return self._gcrd_modular(other, ncpus=kwargs.get("ncpus", 1))
+        elif algorithm not in (None, "prs"):
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
         r = (self,other)
         if (r[0].order()<r[1].order()):
             r=(other,self)
@@ -956,6 +1140,137 @@ class UnivariateOreOperator(OreOperator):
 
         return r.normalize()
 
+    def _gcrd_modular(self, other, ncpus=1):
+        """
+        Multimodular algorithm for ``self.gcrd(other)``.
+
+        For a sequence of word size primes `p`, the gcrd of the images of the operators in
+        `GF(p)[x][D]` is computed with a pseudo remainder sequence, made primitive and normalized
+        so that the leading coefficient of its leading coefficient is one. The gcrd modulo an
+        unlucky prime has a larger order than the actual gcrd, or the same order and a smaller
+        degree; such images are discarded. The remaining images are combined by chinese
+        remaindering and rational reconstruction, and the result is checked to right divide
+        both operators, which also proves that its order is maximal. The images for ``ncpus``
+        primes are computed in parallel.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']; A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: G = (x^2 - 3)*Dx^2 + 5*x*Dx - 1
+            sage: L1 = ((x+1)*Dx^3 + x^2*Dx - 7)*G; L2 = ((2*x-3)*Dx^2 + Dx + x^3)*G
+            sage: L1._gcrd_modular(L2) == G.normalize()
+            True
+            sage: L1.gcrd(L2, algorithm="modular", ncpus=2) == L1.gcrd(L2, prs="essential")
+            True
+            sage: A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: (Sx - x)._gcrd_modular(Sx^2 - 1)
+            1
+        """
+        from sage.rings.finite_rings.finite_field_constructor import GF
+
+        A = self.parent(); R = A.base_ring()
+        if R.is_field() or R.base_ring().fraction_field() is not QQ:
+            raise TypeError("modular gcrd is not supported for " + str(A))
+
+        U = self.numerator(); V = other.numerator(); a = U.order(); b = V.order()
+
+        def image(p):
+            Rp = R.change_ring(GF(p)); Ap = A.change_ring(Rp)
+            try:
+                Up = Ap([Rp(c) for c in U.coefficients(sparse=False)])
+                Vp = Ap([Rp(c) for c in V.coefficients(sparse=False)])
+            except ZeroDivisionError:
+                return None
+            if Up.order() < a or Vp.order() < b:
+                return None
+            Gp = Up.gcrd(Vp)
+            return (Gp.order(), Gp.degree()), _primitive_image(Gp)
+
+        def luckier(k1, k2):
+            return k1[0] < k2[0] or (k1[0] == k2[0] and k1[1] > k2[1])
+
+        def check(v):
+            G = A(list(v))
+            if G.order() == 0:
+                return A.one()
+            if U.quo_rem(G)[1].is_zero() and V.quo_rem(G)[1].is_zero():
+                return G.normalize()
+
+        return _multimodular(image, luckier, check, ncpus)
+
+    def _xgcrd_modular(self, other, ncpus=1):
+        """
+        Multimodular algorithm for ``self.xgcrd(other)``.
+
+        The gcrd `G` and the cofactors `S`, `T` with `S \cdot self + T \cdot other = G` of minimal
+        orders are computed modulo a sequence of word size primes by the extended Euclidean
+        algorithm over `GF(p)(x)`. The gcrd is normalized as in ``_gcrd_modular``, and the
+        cofactors are written as `S = \tilde S/d`, `T = \tilde T/d` where `d` is the monic least
+        common multiple of the denominators of their coefficients. The coefficients of `G`, `d`,
+        `\tilde S` and `\tilde T` are reconstructed by chinese remaindering and rational
+        reconstruction, and the identity `S \cdot self + T \cdot other = G` is checked, together with
+        the fact that `G` right divides both operators.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']; A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: G = x*Sx - 1
+            sage: L1 = ((x+1)*Sx^2 + x^2*Sx - 7)*G; L2 = ((2*x-3)*Sx + x^3)*G
+            sage: G2, S, T = L1._xgcrd_modular(L2)
+            sage: G2 == G.normalize() and S*L1 + T*L2 == G2
+            True
+        """
+        from sage.rings.finite_rings.finite_field_constructor import GF
+        from sage.modules.free_module_element import vector
+
+        A = self.parent(); R = A.base_ring()
+        if R.is_field() or R.base_ring().fraction_field() is not QQ:
+            raise TypeError("modular xgcrd is not supported for " + str(A))
+
+        U = self.numerator(); V = other.numerator(); a = U.order(); b = V.order()
+
+        def image(p):
+            Rp = R.change_ring(GF(p)); Ap = A.change_ring(Rp)
+            try:
+                Up = Ap([Rp(c) for c in U.coefficients(sparse=False)])
+                Vp = Ap([Rp(c) for c in V.coefficients(sparse=False)])
+            except ZeroDivisionError:
+                return None
+            if Up.order() < a or Vp.order() < b:
+                return None
+            Kp = Rp.fraction_field()
+            Gp, Sp, Tp = Up.change_ring(Kp)._xeuclid(Vp.change_ring(Kp))
+            k = Gp.order()
+            if Sp.order() >= b - k or Tp.order() >= a - k:
+                return None
+            Gp = Ap(Gp.numerator())
+            g = _primitive_image(Gp)
+            c = g[k]/Gp[k] # Sp*Up + Tp*Vp == Gp, scaled to the normalized gcrd
+            cofs = [c*f for f in Sp.coefficients(sparse=False, padd=b - k - 1)] + \
+                   [c*f for f in Tp.coefficients(sparse=False, padd=a - k - 1)]
+            d = lcm([f.denominator() for f in cofs])
+            d = d/d.leading_coefficient()
+            vp = vector(Rp, list(g) + [d] + [Rp(f*d) for f in cofs])
+            return (k, Gp.degree(), d.degree()), vp
+
+        def luckier(k1, k2):
+            return k1[0] < k2[0] or (k1[0] == k2[0] and k1[1:] > k2[1:])
+
+        def check(v):
+            v = list(v)
+            k = a + b + 2 - len(v)
+            G = A(v[:k + 1]); d = v[k + 1]
+            AK = A.change_ring(R.fraction_field())
+            S = AK([f/d for f in v[k + 2:b + 2]]); T = AK([f/d for f in v[b + 2:]])
+            if S*U + T*V != G or not U.quo_rem(G)[1].is_zero() or not V.quo_rem(G)[1].is_zero():
+                return None
+            Gn = G.normalize(); f = Gn.leading_coefficient()/G.leading_coefficient()
+            return Gn, f*S, f*T
+
+        return _multimodular(image, luckier, check, ncpus)
+
     def xgcrd(self, other, **kwargs):
         """
         Returns the greatest common right divisor of ``self`` and ``other`` together with the cofactors. 
@@ -965,6 +1280,7 @@ class UnivariateOreOperator(OreOperator):
         - ``other`` -- one operator which together with ``self`` can be coerced to a common parent.
         - ``prs`` (default: "essential") -- pseudo remainder sequence to be used. Possible values are
           "essential", "primitive", "classic", "subresultant", "monic".
+        - ``algorithm``, ``ncpus`` -- as for ``gcrd``, see also ``_xgcrd_modular``.
         
         OUTPUT:
 
@@ -988,6 +1304,15 @@ class UnivariateOreOperator(OreOperator):
         """
         prs = kwargs["prs"] if "prs" in kwargs else None
         infolevel = kwargs["infolevel"] if "infolevel" in kwargs else 0
+
+        algorithm = kwargs.get("algorithm", None)
+        if self.parent() is other.parent() and not self.is_zero() and not other.is_zero() \
+           and min(self.order(), other.order()) > 0:
+            if algorithm == "modular":
+                return self._xgcrd_modular(other, ncpus=kwargs.get("ncpus", 1))
+        if algorithm not in (None, "prs", "modular"):
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
         return self._xeuclid(other, prs, "bezout", infolevel)
 
     def _xeuclid(self, other, prs=None, retval="bezout", infolevel=0):
@@ -1073,7 +1398,7 @@ class UnivariateOreOperator(OreOperator):
         The optional argument ``algorithm`` allows to select between the following
         methods.
 
-        * ``linalg`` (default) -- makes an ansatz for cofactors and solves a linear
+        * ``linalg`` -- makes an ansatz for cofactors and solves a linear
           system over the base ring. 
           Through the optional argument ``solver``, a callable object can be
           provided which the function should use for computing the kernel of
@@ -1085,11 +1410,26 @@ class UnivariateOreOperator(OreOperator):
 
         * ``guess`` -- computes the first terms of a solution of ``self`` and ``other``
           and guesses from these a minimal operator annihilating a generic linear
-          combination. Unless the input are recurrence operators, an keyword argument
-          ``to_list`` has to be present which specifies a function for computing the
-          terms (input: an operator, a list of initial values, and the desired number
-          of terms). This method is heuristic. It may be much faster than the others,
-          but with low probability its output is incorrect or it aborts with an error. 
+          combination. A keyword argument ``to_list`` may specify a function for
+          computing the terms (input: an operator, a list of initial values, and the
+          desired number of terms). Without it, recurrence operators are expanded with
+          ``to_list``, and differential operators with coefficients in `\QQ[x]` are
+          handled by ``_closure_guess``, which also checks the result. This method is
+          heuristic. It may be much faster than the others, but with low probability
+          its output is incorrect or it aborts with an error. 
+
+        * ``modular`` -- computes the lclm modulo several word size primes with the
+          ``linalg`` method over `GF(p)[x]` and reconstructs the result by chinese
+          remaindering and rational reconstruction, see ``_lclm_modular``. The result
+          is checked by right division. Only operators with coefficients in `\ZZ[x]`
+          or `\QQ[x]` are supported.
+
+        * ``auto`` -- chooses ``linalg`` or ``modular`` according to the expected size
+          of the output, see ``_lclm_strategy``. Operators whose coefficients are not in
+          `\ZZ[x]` or `\QQ[x]`, and small operators, are handled by ``linalg``. If the
+          modular computation fails, ``linalg`` is used instead. 
+
+        The default is ``auto``.
 
         EXAMPLES::
 
@@ -1130,17 +1470,130 @@ class UnivariateOreOperator(OreOperator):
         elif not isinstance(other, UnivariateOreOperator):
             raise TypeError("unexpected argument in lclm")
 
-        if not "algorithm" in kwargs or kwargs['algorithm'] == 'linalg':
+        algorithm = kwargs.get('algorithm', 'auto')
+        if algorithm == 'auto':
+            algorithm = 'linalg' if 'solver' in kwargs else self._lclm_strategy(other)
+            if algorithm == 'modular':
+                try:
+                    return self._lclm_modular(other, ncpus=kwargs.get('ncpus', 1))
+                except (TypeError, ArithmeticError):
+                    algorithm = 'linalg'
+
+        if algorithm == 'linalg':
             return self._lclm_linalg(other, **kwargs)
-        elif kwargs['algorithm'] == 'euclid':
+        elif algorithm == 'euclid':
             del kwargs['algorithm']; kwargs['retval'] = 'syzygy'
             u, v = self._xeuclid(other, **kwargs)
             return (u*other).normalize()
-        elif kwargs['algorithm'] == 'guess':
+        elif algorithm == 'guess':
             del kwargs['algorithm']
-            return self._lclm_guess(other, **kwargs)
+            if 'to_list' in kwargs or self.parent().is_S():
+                return self._lclm_guess(other, **kwargs)
+            L = self._closure_guess(other, 'lclm', **kwargs)
+            return L if L is not None else self._lclm_linalg(other)
+        elif algorithm == 'modular':
+            return self._lclm_modular(other, ncpus=kwargs.get('ncpus', 1))
         else:
-            raise ValueError("unknown algorithm: " + str(kwargs['algorithm']))
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
+    def _lclm_strategy(self, other):
+        """
+        Choose an lclm algorithm for ``self`` and ``other``.
+
+        The order of the lclm is expected to be the sum `r` of the orders of the
+        input, and its degree is estimated by `d = d_1 + d_2 + d_1 r_2 + d_2 r_1`
+        where `r_i` and `d_i` are the orders and degrees of the input (the sum
+        of the degrees of the leading coefficients plus the degree of the
+        apparent singularities). Small cases, and operators whose coefficients
+        are not in `\ZZ[x]` or `\QQ[x]`, are handled by ``linalg``. Larger cases
+        are handled by ``modular``, which avoids the coefficient growth of the
+        linear algebra over `\QQ[x]`.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']; A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: (Dx - x)._lclm_strategy(Dx^2 + x)
+            'linalg'
+            sage: L = sum((x + i)^10*Dx^i for i in range(6))
+            sage: L._lclm_strategy(L + x)
+            'modular'
+            sage: L = sum((x + i)^30*Dx^i for i in range(10))
+            sage: L._lclm_strategy(L + x)
+            'modular'
+        """
+        A = self.parent(); R = A.base_ring()
+        if R.is_field() or not hasattr(R, 'gen') or R.ngens() != 1 \
+           or R.base_ring().fraction_field() is not QQ:
+            return 'linalg'
+        r1, r2 = self.order(), other.order()
+        d1, d2 = self.degree(), other.degree()
+        r = r1 + r2
+        d = d1 + d2 + d1*r2 + d2*r1
+        if r*d <= self._lclm_modular_threshold:
+            return 'linalg'
+        else:
+            return 'modular'
+
+    _lclm_modular_threshold = 400
+
+    def _lclm_modular(self, other, ncpus=1):
+        """
+        Multimodular algorithm for ``self.lclm(other)``.
+
+        For a sequence of word size primes `p`, the lclm of the images of the
+        operators in `GF(p)[x][D]` is computed by ``_lclm_linalg``, made
+        primitive and normalized so that the leading coefficient of its leading
+        coefficient is one. Images whose order or degree is smaller than that of
+        the others are discarded as unlucky. The images are combined by chinese
+        remaindering and rational reconstruction, which terminates as soon as the
+        reconstruction succeeds, and the result is checked by right division by
+        ``self`` and ``other``. As the lclm of the images of the operators cannot
+        have a larger order than the image of their lclm, a common left multiple
+        of the same order as the images is least. If the check fails, more primes
+        are used. The images for ``ncpus`` primes are computed in parallel.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']; A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: L1 = 5*(x+1)*Dx + (x - 7); L2 = (3*x+5)*Dx - (8*x+1)
+            sage: L1._lclm_modular(L2) == L1.lclm(L2, algorithm='linalg')
+            True
+            sage: A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: L1 = (x+1)*Sx^2 + (x-1)*Sx + 8; L2 = (x-1)*Sx^2 + (2*x+3)*Sx + (8*x+5)
+            sage: L1._lclm_modular(L2, ncpus=2) == L1.lclm(L2, algorithm='linalg')
+            True
+        """
+        from sage.rings.finite_rings.finite_field_constructor import GF
+
+        A = self.parent(); R = A.base_ring()
+        if R.is_field() or R.base_ring().fraction_field() is not QQ:
+            raise TypeError("modular lclm is not supported for " + str(A))
+
+        U = self.numerator(); V = other.numerator(); a = U.order(); b = V.order()
+
+        def image(p):
+            Rp = R.change_ring(GF(p)); Ap = A.change_ring(Rp)
+            try:
+                Up = Ap([Rp(c) for c in U.coefficients(sparse=False)])
+                Vp = Ap([Rp(c) for c in V.coefficients(sparse=False)])
+            except ZeroDivisionError:
+                return None
+            if Up.order() < a or Vp.order() < b:
+                return None
+            Lp = Up._lclm_linalg(Vp)
+            return (Lp.order(), Lp.degree()), _primitive_image(Lp)
+
+        def luckier(k1, k2):
+            return k1[0] > k2[0] or (k1[0] == k2[0] and k1[1] > k2[1])
+
+        def check(v):
+            L = A(list(v))
+            if L.quo_rem(U)[1].is_zero() and L.quo_rem(V)[1].is_zero():
+                return L.normalize()
+
+        return _multimodular(image, luckier, check, ncpus)
 
     def _lclm_linalg(self, other, **kwargs):
         """
@@ -1225,6 +1678,132 @@ class UnivariateOreOperator(OreOperator):
         from guessing import guess
         return guess(data, self.parent(), min_order=r_lcm)
 
+    def _closure_guess(self, other, closure, max_terms=4096, **kwargs):
+        """
+        Guess-and-verify computation of ``self.lclm(other)`` (if ``closure`` is ``'lclm'``)
+        or of ``self.symmetric_product(other)`` (if ``closure`` is ``'symmetric_product'``).
+
+        Terms of random solutions of ``self`` and ``other`` are first computed modulo a 
+        word size prime and combined into terms of a solution of the result. Guessing
+        modulo this prime, with the order bounded by the sum (lclm) or the product
+        (symmetric product) of the input orders, determines the order and the degree of
+        the result. As the terms come from a generic solution, the guessed operator of
+        smallest order is the lclm also when the operators have a common right factor. Then just enough terms for this order and degree are computed over
+        the rationals, the operator is guessed from them, and it is checked to be a 
+        left multiple of both input operators (lclm) or to annihilate the product of
+        any two solutions (symmetric product).
+
+        Solutions of recurrence operators are expanded from an index beyond the integer
+        singularities, and solutions of differential operators as power series at an 
+        ordinary point; the operators are translated accordingly.
+
+        Returns ``None`` if the check fails. Raises a ``ValueError`` if no operator could
+        be guessed from ``max_terms`` terms, an ``ArithmeticError`` if all primes turn out
+        to be unsuitable, and a ``TypeError`` if the operators are neither
+        recurrence nor differential operators with coefficients in `\QQ[x]`.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = QQ['x']; A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: L1 = (x^2 + 1)*Dx^2 + x*Dx - 3; L2 = (x - 2)*Dx + x^2
+            sage: L = L1._closure_guess(L2, 'symmetric_product')
+            sage: L.order()
+            2
+            sage: L.normalize() == L1.symmetric_product(L2).normalize()
+            True
+            sage: L1._closure_guess(L2, 'lclm').normalize() == L1.lclm(L2).normalize()
+            True
+            sage: G = x*Dx - 1; L = (L1*G)._closure_guess(L2*G, 'lclm')
+            sage: L.order(), L.normalize() == (L1*G).lclm(L2*G).normalize()
+            (4, True)
+            sage: B.<Sn> = OreAlgebra(QQ['n'], 'Sn'); n = B.base_ring().gen()
+            sage: M1 = (n - 3)*Sn^2 - Sn - n; M2 = (n + 1)*Sn - 2*n + 5
+            sage: M1._closure_guess(M2, 'symmetric_product').normalize() == M1.symmetric_product(M2).normalize()
+            True
+
+        """
+        A = self.parent(); R = A.base_ring(); x = R.gen(); K = R.base_ring()
+        if not (A.is_S() or A.is_D()) or R.is_field() or K.fraction_field() is not QQ:
+            raise TypeError("guessing closure operators is not supported for " + str(A))
+
+        U = self.normalize().numerator(); V = other.normalize().numerator()
+        r, s = U.order(), V.order()
+        if min(r, s) < 1:
+            return getattr(self, closure)(other)
+
+        # no lower bound on the order of the lclm, it is smaller than r + s if the operators have a common right factor
+        if closure == 'lclm':
+            order = r + s; min_order = 1
+            combine = lambda u, v: [a + b for a, b in zip(u, v)]
+        elif A.is_S():
+            order = r*s; min_order = 1
+            combine = lambda u, v: [a*b for a, b in zip(u, v)]
+        else:
+            order = r*s; min_order = 1
+            combine = lambda u, v: [sum(u[i]*v[k-i] for i in range(k + 1)) for k in range(len(u))]
+
+        # translate the operators so that the solutions can be expanded from 0
+        if A.is_S():
+            c = max([0] + [k - L.order() + 1 for L in (U, V) for k in L.singularities()])
+        else:
+            c = 0
+            while U.leading_coefficient()(c).is_zero() or V.leading_coefficient()(c).is_zero():
+                c += 1
+        U = U.map_coefficients(lambda p: p(x + c))
+        V = V.map_coefficients(lambda p: p(x + c))
+
+        from sage.rings.finite_rings.finite_field_constructor import GF
+        from .guessing import guess, _word_size_primes
+
+        # find order and degree of the result modulo a prime
+        n = 200; Lp = None
+        for p in _word_size_primes():
+            Rp = R.change_ring(GF(p)); Ap = A.change_ring(Rp)
+            try:
+                Up = Ap([Rp(q) for q in U.coefficients(sparse=False)])
+                Vp = Ap([Rp(q) for q in V.coefficients(sparse=False)])
+                if Up.order() < r or Vp.order() < s:
+                    continue
+                data = combine(_random_solution_terms(Up, n), _random_solution_terms(Vp, n))
+            except ZeroDivisionError:
+                continue
+            if any(t is None for t in data):
+                continue
+            try:
+                Lp = guess(data, Ap, order=order, min_order=min_order)
+                break
+            except ValueError:
+                if 2*n > max_terms:
+                    raise
+                n = 2*n
+        if Lp is None:
+            raise ArithmeticError("no suitable prime found")
+
+        # guess over the rationals from just enough terms
+        r, d = Lp.order(), Lp.degree()
+        n = int(1.20*(r + 2)*(d + 2) + 10)
+        data = combine(_random_solution_terms(U, n), _random_solution_terms(V, n))
+        L = guess(data, A, order=r, min_order=r, degree=d)
+        L = A(L.map_coefficients(lambda p: p(x - c)))
+
+        # verify
+        U = self.numerator(); V = other.numerator()
+        if closure == 'lclm':
+            if not (L.quo_rem(U)[1].is_zero() and L.quo_rem(V)[1].is_zero()):
+                return None
+        else:
+            F = R.fraction_field()
+            rows = U.change_ring(F)._symmetric_product_rows(V.change_ring(F))
+            acc = next(rows)
+            acc = [L[0]*t for t in acc]
+            for k in range(1, L.order() + 1):
+                acc = [t + L[k]*t2 for t, t2 in zip(acc, next(rows))]
+            if not all(t.is_zero() for t in acc):
+                return None
+
+        return L.normalize()
+
     def xlclm(self, other):
         """
         Computes the least common left multiple of ``self`` and ``other`` along
@@ -1361,7 +1940,7 @@ class UnivariateOreOperator(OreOperator):
             M[r - 1, j] = self[j] / (-self[r])
         return M
 
-    def symmetric_product(self, other, solver=None):
+    def symmetric_product(self, other, solver=None, algorithm=None, **kwargs):
         """
         Returns the symmetric product of ``self`` and ``other``.
 
@@ -1375,6 +1954,24 @@ class UnivariateOreOperator(OreOperator):
 
         If no ``solver`` is specified, the the Ore algebra's solver is used.         
 
+        The optional argument ``algorithm`` allows to select between the following
+        methods.
+
+        * ``linalg`` (default) -- makes an ansatz for the coefficients of `C` and 
+          solves a linear system over the fraction field of the base ring.
+
+        * ``guess`` -- guesses `C` from the first terms of a product of random solutions
+          of ``self`` and ``other`` and checks the result, see ``_closure_guess``. Only
+          recurrence and differential operators with rational coefficients are supported.
+          If the check fails, or if no operator can be guessed, the method falls back to ``linalg``.
+
+        * ``modular`` -- solves the same linear system as ``linalg``, but modulo several
+          word size primes and at many evaluation points of the base ring's generator,
+          and reconstructs the result by interpolation, chinese remaindering and rational
+          reconstruction, see ``_symmetric_product_modular``. Only operators with
+          coefficients in `\ZZ[x]` or `\QQ[x]` are supported. This avoids the growth of
+          the coefficients of the intermediate normal forms.
+
         EXAMPLES::
 
            sage: from ore_algebra import *
@@ -1401,7 +1998,17 @@ class UnivariateOreOperator(OreOperator):
 
         if self.parent() != other.parent():
             A, B = canonical_coercion(self, other)
-            return A.symmetric_product(B, solver=solver)
+            return A.symmetric_product(B, solver=solver, algorithm=algorithm, **kwargs)
+
+        if algorithm == 'guess':
+            try:
+                L = self._closure_guess(other, 'symmetric_product', **kwargs)
+                if L is not None:
+                    return L
+            except (TypeError, ValueError, ZeroDivisionError, ArithmeticError):
+                pass # fall back to linalg
+        elif algorithm not in (None, 'linalg', 'modular'):
+            raise ValueError("unknown algorithm: " + str(algorithm))
 
         R = self.base_ring().fraction_field(); zero = R.zero(); one = R.one()
         
@@ -1448,20 +2055,209 @@ class UnivariateOreOperator(OreOperator):
 
         # general case via linear algebra
 
-        Ared = tuple(-A[i]/A[a] for i in range(a)); Bred = tuple(-B[j]/B[b] for j in range(b))
+        if algorithm == 'modular':
+            return self._symmetric_product_modular(other, **kwargs)
 
         if solver is None:
             solver = Alg._solver()
 
-        # Dkuv[i][j] is the coefficient of D^i(u)*D^j(v) in the normal form of D^k(u*v) 
-        Dkuv = [[zero for i in range(b + 1)] for j in range(a + 1)]; Dkuv[0][0] = one
-        
-        mat = [[Dkuv[i][j] for i in range(a) for j in range(b)]]
-
         from sage.matrix.constructor import Matrix
+        rows = A._symmetric_product_rows(B)
+        mat = [next(rows)]
         sol = solver(Matrix(mat).transpose())
 
         while len(sol) == 0:
+            mat.append(next(rows))
+            sol = solver(Matrix(mat).transpose())
+
+        L = A.parent()(list(sol[0]))
+        return L
+
+    def _symmetric_product_modular(self, other, batch=16, max_primes=200):
+        """
+        Multimodular evaluation/interpolation algorithm for ``self.symmetric_product(other)``.
+
+        For a sequence of word size primes `p`, the normal forms of `D^k(uv)` are computed
+        over `GF(p)(x)`, where their coefficients do not grow. They are evaluated at points
+        `x_0 \in GF(p)`, where the constant systems are solved, in batches of ``batch`` points.
+        The solutions are interpolated and turned into rational functions by rational
+        reconstruction. For the first prime, the number of points is increased until the
+        reconstruction stabilizes; this determines the degrees of the result, and for the 
+        following primes just enough points for these degrees are used. Finally, the
+        images for the various primes are combined by chinese remaindering and rational
+        reconstruction of the coefficients, which terminates as soon as the reconstruction
+        succeeds. The result is checked against the image modulo one more prime.
+
+        Images for which the order of the result or the degrees drop are discarded as
+        unlucky. Conversely, an image of larger order or degrees shows that the previous
+        images were unlucky, and the reconstruction starts over from it. If no result is
+        found after ``max_primes`` primes, an ``ArithmeticError`` is raised. 
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']; A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: L1 = (x+1)*Dx^2 + (x-1)*Dx + 8; L2 = (x-1)*Dx^2 + (2*x+3)*Dx + (8*x+5)
+            sage: L = L1._symmetric_product_modular(L2)
+            sage: L == L1.symmetric_product(L2).normalize()
+            True
+            sage: A.<Sx> = OreAlgebra(R, 'Sx')
+            sage: L1 = (x+1)*Sx^2 + (x-1)*Sx + 8; L2 = (x-1)*Sx^2 + (2*x+3)*Sx + (8*x+5)
+            sage: L1._symmetric_product_modular(L2) == L1.symmetric_product(L2).normalize()
+            True
+
+        """
+        from sage.matrix.constructor import Matrix
+        from sage.misc.all import prod
+        from sage.rings.finite_rings.finite_field_constructor import GF
+        from sage.modules.free_module_element import vector
+        from .guessing import _word_size_primes, _merge_homomorphic_images
+
+        A = self.parent(); R = A.base_ring()
+        if R.is_field() or R.base_ring().fraction_field() is not QQ:
+            raise TypeError("modular symmetric product is not supported for " + str(A))
+
+        U = self.numerator(); V = other.numerator(); a = U.order(); b = V.order()
+        ZZx = R.change_ring(ZZ)
+        primes = _word_size_primes()
+
+        def image(p, order=None, degrees=None):
+            # returns (order, degrees, vector over GF(p)[x]) or None if p is unlucky. If the
+            # order of the image is the given order, the given degrees are tried first.
+            Fp = GF(p); Rp = R.change_ring(Fp); Kp = Rp.fraction_field(); Ap = A.change_ring(Kp)
+            try:
+                Up = Ap([Rp(c) for c in U.coefficients(sparse=False)])
+                Vp = Ap([Rp(c) for c in V.coefficients(sparse=False)])
+            except ZeroDivisionError:
+                return None
+            if Up.order() < a or Vp.order() < b:
+                return None
+            rows = Up._symmetric_product_rows(Vp)
+
+            def evaluate(row, x0):
+                return [Fp(c.numerator()(x0))/Fp(c.denominator()(x0)) for c in row]
+
+            def kernel(mat, x0):
+                M = Matrix(Fp, [evaluate(row, x0) for row in mat]).transpose()
+                return M.right_kernel_matrix()
+
+            # order of the result: first k for which the rows evaluated at two random points are dependent
+            mat = [next(rows)]; failures = 0
+            while True:
+                try:
+                    if all(kernel(mat, Fp.random_element()).nrows() > 0 for i in range(2)):
+                        break
+                except ZeroDivisionError:
+                    failures += 1
+                    if failures > 10:
+                        return None
+                    continue
+                if len(mat) > a*b:
+                    return None # the symmetric product has order at most a*b
+                mat.append(next(rows))
+            k = len(mat) - 1
+            if k != order:
+                degrees = None
+
+            # values of the normalized solution at many points
+            points = []; values = []; x0 = Fp.zero(); old = None
+            while True:
+                for i in range(batch):
+                    x0 += 1
+                    try:
+                        ker = kernel(mat, x0)
+                    except ZeroDivisionError:
+                        continue
+                    if ker.nrows() != 1 or ker[0, k].is_zero():
+                        continue
+                    points.append(x0); values.append(ker[0]/ker[0, k])
+                n = len(points)
+                if n >= p - batch:
+                    return None # ran out of evaluation points
+                if degrees is None:
+                    ndeg = ddeg = (n - 1)//2
+                else:
+                    ndeg, ddeg = degrees
+                    if n < ndeg + ddeg + 3:
+                        continue
+                modulus = prod(Rp.gen() - x0 for x0 in points)
+                try:
+                    sol = []
+                    for j in range(k + 1):
+                        f = Rp.lagrange_polynomial([(points[i], values[i][j]) for i in range(n)])
+                        num, den = f.rational_reconstruction(modulus, ndeg, ddeg)
+                        sol.append(num/den)
+                except (ArithmeticError, ValueError):
+                    degrees = None # the hint was wrong, determine the degrees from scratch
+                    continue
+                if degrees is not None or sol == old:
+                    break
+                old = sol
+
+            d = lcm([f.denominator() for f in sol])
+            sol = [Rp(f*d) for f in sol]
+            c = sol[k].leading_coefficient()
+            sol = vector(Rp, [f/c for f in sol])
+            return k, (max(f.degree() for f in sol), sol[k].degree()), sol
+
+        def luckier(k, deg, order, degrees):
+            # a larger order or larger degrees indicate that the previous images were unlucky
+            return k > order or k == order and deg != degrees and all(e >= f for e, f in zip(deg, degrees))
+
+        order = degrees = None; crt = None; mod = ZZ.one(); cand = None
+        for count in range(max_primes):
+            try:
+                p = next(primes)
+            except StopIteration:
+                break
+            img = image(p, order, degrees)
+            if img is None:
+                continue
+            k, deg, vp = img
+            if order is None or luckier(k, deg, order, degrees):
+                order, degrees, cand = k, deg, None
+                crt, mod = vector(ZZx, k + 1), ZZ.one()
+            elif (k, deg) != (order, degrees):
+                continue # unlucky
+            elif cand is not None:
+                # check the reconstructed operator against this image
+                Rp = vp.base_ring(); lc = Rp(cand[order]).leading_coefficient()
+                if vector(Rp, [Rp(c)/lc for c in cand]) == vp:
+                    return A(list(cand)).normalize()
+                cand = None
+            rec, m = _merge_homomorphic_images(crt, mod, vp, p)
+            crt, mod = _merge_homomorphic_images(crt, mod, vp, p, reconstruct=False)
+            if m.is_zero():
+                cand = rec # to be checked against the next image
+
+        raise ArithmeticError("modular symmetric product did not converge within " + str(max_primes) + " primes")
+
+    def _symmetric_product_rows(self, other):
+        """
+        Iterate over the normal forms of `D^k(u v)`, `k = 0, 1, 2, \dots`, where `D` is the generator of the
+        Ore algebra and `u`, `v` are solutions of ``self`` and ``other``, respectively.
+
+        The normal forms are given as the lists of their coefficients with respect to the products
+        `D^i(u) D^j(v)`, `0 \leq i < a`, `0 \leq j < b`, where `a` and `b` are the orders of ``self``
+        and ``other``. The coefficients of both operators must belong to a field.
+        """
+        A = self; a = A.order()
+        B = other; b = B.order()
+        R = A.base_ring(); zero = R.zero(); one = R.one()
+
+        Alg = A.parent(); sigma = Alg.sigma(); delta = Alg.delta()
+        pr = Alg._product_rule()
+        if pr is None:
+            raise ValueError("no product rule found")
+
+        Ared = tuple(-A[i]/A[a] for i in range(a)); Bred = tuple(-B[j]/B[b] for j in range(b))
+
+        # Dkuv[i][j] is the coefficient of D^i(u)*D^j(v) in the normal form of D^k(u*v) 
+        Dkuv = [[zero for i in range(b + 1)] for j in range(a + 1)]; Dkuv[0][0] = one
+        
+        yield [Dkuv[i][j] for i in range(a) for j in range(b)]
+
+        while True:
 
             # push
             for i in range(a - 1, -1, -1):
@@ -1485,14 +2281,9 @@ class UnivariateOreOperator(OreOperator):
                         Dkuv[i][j] += Ared[i]*Dkuv[a][j]
                     Dkuv[a][j] = zero
 
-            # solve
-            mat.append([Dkuv[i][j] for i in range(a) for j in range(b)])
-            sol = solver(Matrix(mat).transpose())
-
-        L = A.parent()(list(sol[0]))
-        return L
+            yield [Dkuv[i][j] for i in range(a) for j in range(b)]
 
-    def symmetric_power(self, exp, solver=None):
+    def symmetric_power(self, exp, solver=None, **kwargs):
         """
         Returns a symmetric power of this operator.
 
@@ -1500,7 +2291,8 @@ class UnivariateOreOperator(OreOperator):
         such that for all \"functions\" `f` annihilated by `L` the operator `Q` annihilates
         the function `f^n`.
 
-        For further information, see the docstring of ``symmetric_product``.
+        For further information, and for the optional arguments, see the docstring of
+        ``symmetric_product``.
 
         EXAMPLES::
 
@@ -1514,6 +2306,9 @@ class UnivariateOreOperator(OreOperator):
            -x*Sx^3 + (x^3 + 2*x^2 + 3*x + 2)*Sx^2 + (2*x^3 + 2*x^2 + 4*x)*Sx - 8*x - 8
            sage: A.random_element().symmetric_power(0)
            Sx - 1
+           sage: L = (Sx^2 + x*Sx - 2)
+           sage: L.symmetric_power(3, algorithm='modular') == L.symmetric_power(3).normalize()
+           True
         
         """
         if exp < 0:
@@ -1524,11 +2319,11 @@ class UnivariateOreOperator(OreOperator):
         elif exp == 1:
             return self
         elif exp % 2 == 1:
-            L = self.symmetric_power(exp - 1, solver=solver)
-            return L.symmetric_product(self, solver=solver)
+            L = self.symmetric_power(exp - 1, solver=solver, **kwargs)
+            return L.symmetric_product(self, solver=solver, **kwargs)
         elif exp % 2 == 0:
-            L = self.symmetric_power(exp/2, solver=solver)
-            return L.symmetric_product(L, solver=solver)
+            L = self.symmetric_power(exp/2, solver=solver, **kwargs)
+            return L.symmetric_product(L, solver=solver, **kwargs)
         else:
             raise TypeError("unexpected exponent received in symmetric_power")
 
@@ -1997,3 +2792,115 @@ def __subresultantPRS__(r,additional):
     additional.extend([phi,d1])
 
     return ((r[1],r2),newRem[0],alpha,beta,True)
+
+def _random_solution_terms(L, n):
+    """
+    Returns the first ``n`` terms of a random solution of ``L``.
+
+    For a recurrence operator, these are the terms with indices `0, \dots, n-1` of a sequence
+    solution, computed by ``to_list``; terms that cannot be computed because the leading 
+    coefficient vanishes are ``None``. For a differential operator, these are the first ``n``
+    coefficients of a power series solution; the origin must be an ordinary point of ``L``
+    and ``n`` must be smaller than the characteristic of the coefficient field, if any.
+    """
+    A = L.parent(); R = A.base_ring(); K = R.base_ring().fraction_field()
+    r = L.order()
+    init = [K.random_element() for i in range(r)]
+    if A.is_S():
+        return L.to_list(init, n)
+    elif not A.is_D():
+        raise TypeError("don't know how to expand a generic solution for operators in " + str(A))
+
+    # coefficient of x^k in x^j*D^i(y) is (k-j+i)*(k-j+i-1)*...*(k-j+1)*y[k-j+i]
+    terms = [(i, j, K(c)) for i, p in enumerate(L.coefficients(sparse=False))
+                          for j, c in enumerate(R(p).coefficients(sparse=False)) if c != 0 and (i, j) != (r, 0)]
+    lc = K(R(L[r])[0])
+    y = init + [K.zero()]*max(0, n - r)
+    for k in range(n - r):
+        acc = K.zero()
+        for i, j, c in terms:
+            m = k - j + i
+            if m >= 0:
+                f = K.one()
+                for t in range(m - i + 1, m + 1):
+                    f *= t
+                acc += c*f*y[m]
+        f = K.one()
+        for t in range(k + 1, k + r + 1):
+            f *= t
+        y[k + r] = -acc/(lc*f)
+    return y[:n]
+
+def _multimodular(image, luckier, check, ncpus=1, max_primes=1000):
+    r"""
+    Common driver of the multimodular algorithms for univariate operators.
+
+    INPUT:
+
+    - ``image`` -- a function which takes a word size prime `p` and returns either
+      ``None``, if `p` is known to be unlucky, or a pair ``(key, vp)``, where ``vp``
+      is a vector over `GF(p)[x]` and ``key`` describes the shape of the image
+      (e.g., its order and degree).
+    - ``luckier`` -- a function which takes two keys and tells whether an image with
+      the first key is more trustworthy than one with the second. When an image is
+      luckier than the current ones, the reconstruction starts over from it; images
+      with a different key which are not luckier are discarded.
+    - ``check`` -- a function which takes a vector over `\QQ[x]` obtained by chinese
+      remaindering and rational reconstruction of the images, and returns the final
+      result, or ``None`` if the vector is wrong. In the latter case more primes are
+      used, and the check is repeated when the reconstruction changes.
+    - ``ncpus`` (default: 1) -- number of primes whose images are computed in parallel.
+    - ``max_primes`` (default: 1000) -- number of primes after which an ``ArithmeticError``
+      is raised.
+
+    The primes are taken in decreasing order from ``_word_size_primes()``.
+    """
+    from sage.parallel.decorate import parallel
+    from sage.modules.free_module_element import vector
+    from .guessing import _word_size_primes, _merge_homomorphic_images
+
+    primes = _word_size_primes()
+    if ncpus > 1:
+        forked_image = parallel(ncpus=ncpus)(image)
+
+    key = None; crt = None; mod = ZZ.one(); rejected = []; count = 0
+    while count < max_primes:
+        batch = [p for i, p in zip(range(ncpus), primes)]
+        if len(batch) == 0:
+            break
+        count += len(batch)
+        if ncpus == 1:
+            images = [(batch[0], image(batch[0]))]
+        else:
+            images = sorted(((args[0][0], img) for args, img in forked_image(batch)), reverse=True)
+        for p, img in images:
+            if img is None or isinstance(img, str): # unlucky or failed worker
+                continue
+            k, vp = img
+            if key is None or luckier(k, key):
+                key = k; rejected = []
+                crt, mod = vector(vp.base_ring().change_ring(ZZ), len(vp)), ZZ.one()
+            elif k != key:
+                continue
+            rec, m = _merge_homomorphic_images(crt, mod, vp, p)
+            crt, mod = _merge_homomorphic_images(crt, mod, vp, p, reconstruct=False)
+            if m.is_zero() and rec not in rejected:
+                res = check(rec)
+                if res is not None:
+                    return res
+                rejected.append(rec)
+
+    raise ArithmeticError("multimodular reconstruction did not succeed within " + str(count) + " primes")
+
+def _primitive_image(L):
+    r"""
+    Return the coefficient vector of ``L``, an operator over `GF(p)[x]`, divided by its
+    content and normalized so that the leading coefficient of its leading coefficient is one.
+    """
+    from sage.modules.free_module_element import vector
+    Rp = L.base_ring()
+    coeffs = L.coefficients(sparse=False)
+    g = gcd(coeffs)
+    coeffs = [q//g for q in coeffs]
+    c = ~coeffs[-1].leading_coefficient()
+    return vector(Rp, [c*q for q in coeffs])
@@ -577,7 +577,7 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
         s = self.spread()
         return 0 if len(s) == 0 else max(0, max([-k for k in s]))
 
-    def desingularize(self, m=-1):
+    def desingularize(self, m=-1, algorithm=None, ncpus=1):
         r"""
         Returns a left multiple of ``self`` whose coefficients are polynomials and whose leading
         coefficient does not contain unnecessary factors.
@@ -588,6 +588,12 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
           In order to ensure that all removable factors of the leading coefficient are removed in the 
           output, `m` has to be chosen sufficiently large. If no `m` is given, a generic upper bound
           is determined. This feature may not be available for every class.
+        - ``algorithm`` (optional) -- either ``"lclm"``, which computes the left multiple from the
+          lclm of ``self`` with a random operator, or ``"modular"``, which does the same computation
+          modulo several primes and reconstructs the result, see ``_desingularize_modular``. The
+          modular algorithm is only available for operators with coefficients in `\ZZ[x]` or `\QQ[x]`,
+          and is the default for such operators of degree at least ``_desingularize_modular_threshold``.
+        - ``ncpus`` (default: 1) -- number of primes processed in parallel by the modular algorithm.
 
         OUTPUT:
         
@@ -608,6 +614,11 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
           3
           sage: Q.leading_coefficient().degree()
           1
+          sage: Q = P.desingularize(algorithm="modular")
+          sage: Q.order(), Q.leading_coefficient().degree()
+          (3, 1)
+          sage: Q.quo_rem(P)[1]
+          0
 
         """
 
@@ -626,6 +637,16 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
         if m <= 0:
             return L
 
+        if algorithm is None:
+            if C.fraction_field() is QQ and L.degree() >= L._desingularize_modular_threshold:
+                algorithm = "modular"
+            else:
+                algorithm = "lclm"
+        if algorithm == "modular":
+            return L._desingularize_modular(m, sub, ncpus=ncpus)
+        elif algorithm != "lclm":
+            raise ValueError("unknown algorithm: " + str(algorithm))
+
         deg = None; Dold = A.zero()
 
         for k in range(m, sub, -1):
@@ -646,6 +667,116 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
         
         return D                
 
+    _desingularize_modular_threshold = 10
+
+    def _desingularize_modular(self, m, sub=0, ncpus=1):
+        r"""
+        Multimodular version of ``desingularize`` for operators with coefficients in `\ZZ[x]`
+        or `\QQ[x]`.
+
+        The desingularized operator of order `r+k` is computed as `u D^k L + v D`, where `D` is
+        the lclm of ``self`` and an auxiliary operator `T` of order `k` and `u`, `v` are the
+        cofactors of the gcd of the leading coefficients. To make this a deterministic function
+        of ``self``, `T` has small integer coefficients drawn from a random generator with a
+        fixed seed, so that its reductions modulo different primes are consistent.
+
+        The smallest `k` between ``sub + 1`` and `m` for which the degree of the leading
+        coefficient is as small as for `k = m` is first determined modulo one word size prime.
+        Then the operator is computed modulo several primes (``ncpus`` at a time, in parallel),
+        normalized so that it is primitive with a monic leading coefficient of its leading
+        coefficient, and reconstructed by chinese remaindering and rational reconstruction.
+        Images whose leading coefficient has a larger degree are discarded. The result is
+        checked to be right divisible by ``self``.
+
+        EXAMPLES::
+
+            sage: from ore_algebra import *
+            sage: R.<x> = ZZ['x']; A.<Dx> = OreAlgebra(R, 'Dx')
+            sage: L = (x^2 - 1)*(x - 5)*Dx^2 + (x^3 + 1)*Dx - 3*x^2 + 1
+            sage: Q = L.desingularize(algorithm="modular", ncpus=2)
+            sage: Q.quo_rem(L)[1]
+            0
+            sage: Q.leading_coefficient().degree() <= L.desingularize(algorithm="lclm").leading_coefficient().degree()
+            True
+        """
+        import random
+        from sage.rings.finite_rings.finite_field_constructor import GF
+        from .guessing import _word_size_primes
+        from .ore_operator import _multimodular, _primitive_image
+
+        L = self; A = L.parent(); R = A.base_ring(); r = L.order()
+        if R.is_field() or R.base_ring().fraction_field() is not QQ:
+            raise TypeError("modular desingularization is not supported for " + str(A))
+
+        def multiplier(k, seed):
+            rnd = random.Random(seed)
+            return A([R([rnd.randint(-99, 99) for j in range(3)]) for i in range(k)] + [R.one()])
+
+        def reduce_mod(p, ops):
+            Rp = R.change_ring(GF(p)); Ap = A.change_ring(Rp)
+            return [Ap([Rp(c) for c in op.coefficients(sparse=False)]) for op in ops]
+
+        def step(Lp, Tp, k):
+            # desingularized left multiple of Lp of order r + k, or None
+            if Tp.order() < k or Tp[0].is_zero():
+                return None
+            D = Lp.lclm(Tp, algorithm="linalg")
+            if D.order() != r + k:
+                return None
+            L0 = (Lp.parent().gen()**k)*Lp
+            _, u, v = L0.leading_coefficient().xgcd(D.leading_coefficient())
+            return u*L0 + v*D
+
+        # determine k and the auxiliary operator modulo one prime
+        for p in _word_size_primes():
+            try:
+                Lp, = reduce_mod(p, [L])
+            except ZeroDivisionError:
+                continue
+            if Lp.order() == r:
+                break
+
+        seeds = {}; deg = None; k = m
+        for j in range(m, sub, -1):
+            for t in range(100):
+                seed = 1000*j + t
+                Dp = step(Lp, reduce_mod(p, [multiplier(j, seed)])[0], j)
+                if Dp is not None:
+                    break
+            else:
+                raise ArithmeticError("no suitable auxiliary operator found")
+            d = Dp.leading_coefficient().degree()
+            if j == m:
+                deg = d
+            elif deg < d:
+                break
+            k = j; seeds[j] = seed
+
+        T = multiplier(k, seeds[k])
+
+        def image(p):
+            try:
+                Lp, Tp = reduce_mod(p, [L, T])
+            except ZeroDivisionError:
+                return None
+            if Lp.order() < r:
+                return None
+            Dp = step(Lp, Tp, k)
+            if Dp is None:
+                return None
+            vp = _primitive_image(Dp)
+            return (vp[-1].degree(), -max(c.degree() for c in vp)), vp
+
+        def luckier(k1, k2):
+            return k1 < k2
+
+        def check(v):
+            D = A(list(v))
+            if D.order() == r + k and D.quo_rem(L)[1].is_zero():
+                return D.normalize()
+
+        return _multimodular(image, luckier, check, ncpus)
+
     def associate_solutions(self, D, p):
         r"""
         If ``self`` is `P`, this returns a list of pairs `(M, m)` such that `D*M = p + m*P`
@@ -1080,7 +1211,7 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
 
         return output
 
-    def left_factors(self, order=1, early_termination=False, infolevel=0):
+    def left_factors(self, order=1, early_termination=False, infolevel=0, ncpus=1, modular_filter=True):
         r"""
         Returns a list of left-hand factors of this operator.
 
@@ -1099,9 +1230,9 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
 
         """
         return [[f.adjoint() for f in F] for F in 
-                self.adjoint().right_factors(order, early_termination, infolevel)]
+                self.adjoint().right_factors(order, early_termination, infolevel, ncpus=ncpus, modular_filter=modular_filter)]
 
-    def right_factors(self, order=1, early_termination=False, infolevel=0):
+    def right_factors(self, order=1, early_termination=False, infolevel=0, ncpus=1, modular_filter=True):
         r"""
         Returns a list of right hand factors of this operator. 
 
@@ -1120,6 +1251,16 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
           of progress reports that should be printed during the
           calculation. Defaults to 0 for no output.
 
+        - ``ncpus`` (default=1) -- number of processes among which the
+          combinations of local solutions are distributed. With more than one
+          process, the candidates are solved in batches of ``ncpus``, and with
+          ``early_termination`` the processes share a flag which makes the
+          others stop as soon as one of them has found a factor.
+
+        - ``modular_filter`` (default=``True``) -- before looking for the
+          polynomial solutions that give rise to a factor, check modulo a word
+          size prime whether there are any, and discard the combination if not.
+
         OUTPUT:
 
         A list of bases for all vector spaces of first-order operators living in the parent 
@@ -1145,6 +1286,8 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
            [[n*Sn - 1], [Sn - n]]
            sage: (Sn^2 - 2*Sn + 1).right_factors()
            [[Sn - 1, n*Sn - n - 1]]
+           sage: ((Sn - n).lclm(n*Sn - 1)).right_factors(ncpus=2)
+           [[n*Sn - 1], [Sn - n]]
 
            sage: R.<x> = QQ['x']; A.<Qx> = OreAlgebra(R, q=2) 
            sage: ((2*x+3)*Qx - (8*x+3)).lclm(x*Qx-2*(x+5)).right_factors()
@@ -1278,69 +1421,132 @@ class UnivariateOreOperatorOverUnivariateRing(UnivariateOreOperator):
                         break
 
         # 5. for all combinations of local solutions determine the polynomial factors. 
-        #    this is the heavy loop.
-        stat = [prod(len(u[1]) for u in finite_local_data), 0, 0, 0, 0]
-        for c in combs(finite_local_data):
-
-            if stat[1] > 0 and stat[1] % 1000 == 0:
-                info(2, "%i/%i combinations completed (%.2f%%)" % (stat[1], stat[0], 100.0*stat[1]/stat[0]))
-                info(3, "%.2f%% disc. by dimension, %.2f%% disc. by Fuchs-relation, %.4f%% disc. by degree, %.4f%% actually solved" % tuple(map(lambda u: 100.0*u/stat[1], [stat[2], stat[3], stat[4], stat[1] - (stat[2]+stat[3]+stat[4])])))
-
-            stat[1] += 1
-
-            # determine valg, gamma, alpha, dim for this combination
-            valg = 0; dim = r; alpha = 1 if q_case else 0
-            for _, u in c:
-                valg += u[4]; dim = min(dim, u[1])
-                if q_case: 
-                    alpha *= u[5]
-                else:
-                    alpha += u[5]
-            if dim == 0: # all solutions with this finite local behaviour have already been identified
-                stat[2] += 1
-                continue
-            
-            # possible phi's are those that meet the current gamma and alpha+ZZ
-            gamma_phis = [u for u in special_local_data.setdefault(valg, []) if equiv(u[2], alpha)]
-            if len(gamma_phis) == 0: # Fuchs filter
-                stat[3] += 1
-                continue
+        #    this is the heavy loop. the cheap filters are applied while enumerating the
+        #    candidates, the polynomial solutions are computed by solve(), possibly in parallel.
+        stat = [prod(len(u[1]) for u in finite_local_data), 0, 0, 0, 0, 0]
 
-            # check whether all solutions with this behaviour at infinity have already been found
-            gamma_phis = [u for u in gamma_phis if u[3] > 0]
-            if len(gamma_phis) == 0:
-                stat[2] += 1 
-                continue
+        def candidates():
+            for c in combs(finite_local_data):
 
-            rat = prod( u[3] for _, u in c )
-            for gamma_phi_d_dim in gamma_phis:
+                if stat[1] > 0 and stat[1] % 1000 == 0:
+                    info(2, "%i/%i combinations completed (%.2f%%)" % (stat[1], stat[0], 100.0*stat[1]/stat[0]))
+                    info(3, "%.2f%% disc. by dimension, %.2f%% disc. by Fuchs-relation, %.4f%% disc. by degree, %.4f%% disc. modulo p, %.4f%% actually solved" % tuple(map(lambda u: 100.0*u/stat[1], [stat[2], stat[3], stat[4], stat[5], stat[1] - (stat[2]+stat[3]+stat[4]+stat[5])])))
 
-                gamma, phi, d, _ = gamma_phi_d_dim
+                stat[1] += 1
 
-                # determine degree bound 
-                d = q_log(q, d/alpha) if q_case else (d - alpha)
-                if d < 0 and not q_case:
-                    stat[4] += 1
-                    continue 
+                # determine valg, gamma, alpha, dim for this combination
+                valg = 0; dim = r; alpha = 1 if q_case else 0
+                for _, u in c:
+                    valg += u[4]; dim = min(dim, u[1])
+                    if q_case: 
+                        alpha *= u[5]
+                    else:
+                        alpha += u[5]
+                if dim == 0: # all solutions with this finite local behaviour have already been identified
+                    stat[2] += 1
+                    continue
 
-                # find polynomial solutions 
-                sols = SELF.symmetric_product(x**gamma*phi*S - rat ).polynomial_solutions(degree = d)
-                if len(sols) == 0:
+                # possible phi's are those that meet the current gamma and alpha+ZZ
+                gamma_phis = [u for u in special_local_data.setdefault(valg, []) if equiv(u[2], alpha)]
+                if len(gamma_phis) == 0: # Fuchs filter
+                    stat[3] += 1
+                    continue
+
+                # check whether all solutions with this behaviour at infinity have already been found
+                gamma_phis = [u for u in gamma_phis if u[3] > 0]
+                if len(gamma_phis) == 0:
+                    stat[2] += 1 
                     continue
 
-                # register solutions found 
-                info(1, "Factor found.")
-                for u in c: u[1][1] -= len(sols) 
-                gamma_phi_d_dim[3] -= len(sols)
-                factors.append( [ (rat*p[0]*S - phi*x**gamma*sigma(p[0])).normalize() for p in sols ] )
+                rat = prod( u[3] for _, u in c )
+                for gamma_phi_d_dim in gamma_phis:
+
+                    gamma, phi, d, _ = gamma_phi_d_dim
+
+                    # determine degree bound 
+                    d = q_log(q, d/alpha) if q_case else (d - alpha)
+                    if d < 0 and not q_case:
+                        stat[4] += 1
+                        continue 
+
+                    L = SELF.symmetric_product(x**gamma*phi*S - rat)
+                    if modular_filter and not _polynomial_solutions_modp(L, d):
+                        stat[5] += 1
+                        continue
+
+                    yield c, gamma_phis, rat, gamma_phi_d_dim, L, d
+
+        found = None
+        if ncpus > 1 and early_termination:
+            from multiprocessing import Event
+            found = Event()
+
+        def solve(L, d):
+            if found is not None and found.is_set():
+                return None
+            sols = L.polynomial_solutions(degree = d)
+            if len(sols) > 0 and found is not None:
+                found.set()
+            return sols
+
+        def register(c, rat, gamma_phi_d_dim, sols):
+            gamma, phi, _, _ = gamma_phi_d_dim
+            info(1, "Factor found.")
+            for u in c: u[1][1] -= len(sols) 
+            gamma_phi_d_dim[3] -= len(sols)
+            factors.append( [ (rat*p[0]*S - phi*x**gamma*sigma(p[0])).normalize() for p in sols ] )
+
+        if ncpus == 1:
+            for c, _, rat, gamma_phi_d_dim, L, d in candidates():
+                sols = solve(L, d)
+                if len(sols) == 0:
+                    continue
+                register(c, rat, gamma_phi_d_dim, sols)
                 if early_termination:
                     return factors
+        else:
+            from sage.parallel.decorate import parallel
+
+            @parallel(ncpus=ncpus)
+            def forked_solve(i, L, d):
+                return solve(L, d)
+
+            # the candidates of a batch are generated before the factors found for the earlier ones are
+            # registered. in order to get the same factors as the sequential loop, the dimension and the
+            # gamma_phi's of a combination are checked again when its first candidate is registered, and
+            # only the gamma_phi's which are still open at that point are accepted for this combination.
+            todo = candidates(); current = (None, set())
+            while True:
+                batch = [t for _, t in zip(range(ncpus), todo)]
+                if len(batch) == 0:
+                    break
+                sols = dict((args[0][0], res) for args, res in
+                            forked_solve([(i, t[4], t[5]) for i, t in enumerate(batch)]))
+                for i, (c, gamma_phis, rat, gamma_phi_d_dim, L, d) in enumerate(batch):
+                    if current[0] is not c:
+                        if all(u[1] > 0 for _, u in c):
+                            current = (c, set(id(u) for u in gamma_phis if u[3] > 0))
+                        else:
+                            current = (c, set())
+                    if id(gamma_phi_d_dim) not in current[1]:
+                        continue
+                    res = sols.get(i)
+                    if res is None and found is not None and found.is_set():
+                        continue
+                    if not isinstance(res, list): # the process failed, e.g. it ran out of memory
+                        info(1, "Parallel solver failed on a candidate (%s), solving it again." % (res,))
+                        res = solve(L, d)
+                    if res:
+                        register(c, rat, gamma_phi_d_dim, res)
+                        if early_termination:
+                            return factors
 
         info(1, "%i combinations have been investigated in total. Of them:" % stat[0])
-        stat[1] -= stat[2] + stat[3] + stat[4]
+        stat[1] -= stat[2] + stat[3] + stat[4] + stat[5]
         info(1, "--  %i were discarded by dimension arguments (%.4f%%)" % (stat[2], 100.0*stat[2]/stat[0] ))
         info(1, "--  %i were discarded by the Fuchs-relation (%.4f%%)" % (stat[3], 100.0*stat[3]/stat[0] ))
         info(1, "--  %i were discarded by negative degree bound (%.4f%%)" % (stat[4], 100.0*stat[4]/stat[0] ))
+        info(1, "--  %i were discarded modulo a prime (%.4f%%)" % (stat[5], 100.0*stat[5]/stat[0] ))
         info(1, "--  %i the polynomial solver was called on (%.4f%%)" % (stat[1], 100.0*stat[1]/stat[0] ))
         info(1, "We have found %i factors." % sum(len(f) for f in factors))
 
@@ -1620,7 +1826,7 @@ class UnivariateDifferentialOperatorOverUnivariateRing(UnivariateOreOperatorOver
         rec = rec_algebra(result)
         sigma = rec_algebra.sigma()
         v = rec.valuation()
-        return rec_algebra([sigma(p, -v) for p in list(rec)[v:]])
+        return rec_algebra(sigma.apply_all(list(rec)[v:], -v))
 
     def to_F(self, alg):
         r"""
@@ -3627,7 +3833,7 @@ class UnivariateRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverUn
            
         """
         A = self.parent()
-        return self.map_coefficients(A.sigma())*(A.gen() - A.one())
+        return A(A.sigma().apply_all(self.coefficients(sparse=False)))*(A.gen() - A.one())
 
     def annihilator_of_composition(self, a, solver=None):
         r"""
@@ -4496,7 +4702,7 @@ class UnivariateQRecurrenceOperatorOverUnivariateRing(UnivariateOreOperatorOverU
            
         """
         A = self.parent()
-        return self.map_coefficients(A.sigma())*(A.gen() - A.one())
+        return A(A.sigma().apply_all(self.coefficients(sparse=False)))*(A.gen() - A.one())
 
     def annihilator_of_composition(self, a, solver=None):
         r"""
@@ -5261,7 +5467,7 @@ def _rec2list(L, init, n, start, append, padd, deform, singularity_handler=None)
     #        raise TypeError("illegal initial value object")
 
     rec = L.numerator().coefficients(sparse=False); sigma = L.parent().sigma()
-    rec = tuple( -sigma(p, -r) for p in rec )
+    rec = tuple( -p for p in sigma.apply_all(rec, -r) )
     lc = -rec[-1]
 
     for k in range(len(terms), n):
@@ -5279,6 +5485,56 @@ def _rec2list(L, init, n, start, append, padd, deform, singularity_handler=None)
 
     return terms
     
+def _polynomial_solutions_modp(L, d, p=None):
+    r"""
+    Check modulo a prime whether the operator ``L`` may have nonzero polynomial
+    solutions of degree at most ``d``.
+
+    A basis of the polynomial solutions of degree at most `d` of an operator
+    with coefficients in `\QQ(x)` is a basis of the kernel of a matrix with
+    entries in `\QQ`. Clearing denominators and reducing modulo a prime `p` can
+    only decrease the rank of this matrix, so if the reduction of ``L`` modulo
+    `p` has no polynomial solutions of degree at most `d`, then neither has
+    ``L``. This function returns ``False`` in this case, and ``True`` if
+    there are solutions modulo `p` or if the test does not apply (e.g., if
+    the reduction modulo `p` is not defined or `d` is not an integer).
+
+    EXAMPLES::
+
+        sage: from ore_algebra import *
+        sage: from ore_algebra.ore_operator_1_1 import _polynomial_solutions_modp
+        sage: R.<n> = QQ['n']; A.<Sn> = OreAlgebra(R, 'Sn')
+        sage: L = n*Sn - (n + 1)
+        sage: _polynomial_solutions_modp(L, 1), _polynomial_solutions_modp(L, 0)
+        (True, False)
+    """
+    from sage.rings.finite_rings.finite_field_constructor import GF
+    from sage.matrix.constructor import matrix
+    from .guessing import _word_size_primes
+    if d not in ZZ or d < 0:
+        return True
+    d = ZZ(d)
+    if p is None:
+        p = next(_word_size_primes(2**20))
+    A = L.parent(); R = A.base_ring()
+    P = R.ring() if R.is_field() else R
+    try:
+        L = L.numerator()
+        L = L.change_ring(P)
+        den = lcm([c.denominator() for p_ in L.coefficients(sparse=False) for c in P(p_).coefficients()])
+        Pp = P.change_ring(GF(p))
+        Ap = L.parent().change_ring(Pp)
+        Lp = Ap([Pp(den*c) for c in L.coefficients(sparse=False)])
+    except (TypeError, ValueError, ZeroDivisionError, ArithmeticError):
+        return True
+    if Lp.order() < L.order():
+        return True
+    x = Pp.gen()
+    images = [Lp(x**j) for j in range(d + 1)]
+    deg = max([q.degree() for q in images] + [0])
+    M = matrix(GF(p), deg + 1, d + 1, lambda i, j: images[j][i])
+    return M.right_nullity() > 0
+
 def _power_series_solutions(op, rec, n, deform):
     r"""
     Common code for computing terms of holonomic and q-holonomic power series.
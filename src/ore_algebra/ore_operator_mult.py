@@ -31,6 +31,7 @@ from sage.modules.free_module_element import vector
 from sage.rings.rational_field import QQ
 from sage.rings.integer_ring import ZZ
 from sage.rings.infinity import infinity
+from sage.rings.fraction_field import is_FractionField
 
 from .ore_operator import OreOperator
 
@@ -138,31 +139,8 @@ class MultivariateOreOperator(OreOperator):
     # arithmetic
 
     def _mul_(self, other):
-
-        A = self.parent(); n = A.ngens()
-        sigma = [ A.sigma(i) for i in range(n) ] 
-        delta = [ A.delta(i) for i in range(n) ]
-        D = [ A.gen(i).polynomial() for i in range(n) ]
-        
-        monomial_times_other = {tuple(0 for i in range(n)): other.polynomial()}
-
-        def multiple(exp):
-            exp = tuple(int(e) for e in exp)
-            if exp not in monomial_times_other:
-                i = n - 1
-                while exp[i] == 0:
-                    i -= 1
-                sub = list(exp); sub[i] -= 1; prev = multiple(sub)
-                new = prev.map_coefficients(sigma[i])*D[i] + prev.map_coefficients(delta[i])
-                monomial_times_other[exp] = new
-            return monomial_times_other[exp]
-
-        out = A.zero(); poly = self.__poly
-        for exp in poly.dict():
-            out += poly[exp]*multiple(exp)
-
-        monomial_times_other.clear() # support garbage collector
-        return A(out)
+        A = self.parent()
+        return A(_sparse_mul(A, self.dict(), other.dict()))
 
     def _add_(self, other):
         return self.parent()(self.__poly + other.__poly)
@@ -386,8 +364,11 @@ class MultivariateOreOperator(OreOperator):
             
             basis = list(map(self.parent(), basis))
 
+        if normalize and not cofactors:
+            return _CompactBasis(self.parent(), basis).reduce(self, normalize=True, infolevel=infolevel)
+
         exp = [vector(ZZ, b.exp()) for b in basis]
-        gens = self.parent().gens(); p = self; r0 = self.parent().zero(); c = self.base_ring().one()
+        A = self.parent(); gens = A.gens(); p = self; r0 = A.zero(); c = one = self.base_ring().one()
         cofs = [self.parent().zero()]*len(basis)
         range_basis = [k for k in range(len(basis)) if not basis[k].is_zero()]
 
@@ -415,7 +396,7 @@ class MultivariateOreOperator(OreOperator):
                 k = candidates[0] ## care for a more clever choice?
                 b = basis[k]; tau = prod(x**i for x, i in zip(gens, e - exp[k]))
                 info(2, str(len(candidates)) + " basis elements apply, taking no " + str(k) + " with leading monomial " + str(b.lm()))
-                b0 = tau*b; b0lc = b0.lc();
+                b0 = A(_sparse_mul(A, {tuple(e - exp[k]): one}, b.dict())); b0lc = b0.lc();
                 if sugar is not None:
                     sugar = max(sugar, tau.tdeg() + basis_sugar[k])
                 if normalize:
@@ -461,3 +442,231 @@ class MultivariateOreOperator(OreOperator):
             
         info(1, "reduction completed, remainder has " + str(len(r0.coefficients())) + " terms.")
         return (r0, cofs, c) if cofactors else r0
+
+def _sparse_mul(A, a, b):
+    """
+    Term by term product of two operators of A given as dictionaries mapping exponent
+    tuples to elements of the base ring of A, as returned by the method dict().
+
+    The output is a dictionary of the same kind. The products of monomials and base
+    ring elements are taken from the cache of A, see OreAlgebra_generic._monomial_times.
+
+    EXAMPLES::
+
+       sage: from ore_algebra import *
+       sage: from ore_algebra.ore_operator_mult import _sparse_mul
+       sage: R.<x,y> = ZZ[]
+       sage: A.<Dx,Dy> = OreAlgebra(R)
+       sage: L = x*Dx*Dy + y; M = Dx - x*y
+       sage: A(_sparse_mul(A, L.dict(), M.dict())) == L*M
+       True
+       sage: sorted(_sparse_mul(A, {(1, 0): 1}, {(0, 1): x}).items())
+       [((0, 1), 1), ((1, 1), x)]
+
+    """
+    zero = A.base_ring().zero()
+    out = {}
+    for ea, ca in a.items():
+        for eb, cb in b.items():
+            for e, c in A._monomial_times(ea, cb).items():
+                e = tuple(i + j for i, j in zip(e, eb))
+                out[e] = out.get(e, zero) + ca*c
+    return dict((e, c) for e, c in out.items() if not c.is_zero())
+
+def _heap_key(P):
+    """
+    Returns a function mapping exponent tuples of monomials of the polynomial ring P to
+    keys which are smaller for larger monomials, for use with heapq.
+    """
+    order = P.term_order().name()
+    if order == 'degrevlex':
+        return lambda e: (-sum(e),) + tuple(reversed(e))
+    elif order == 'deglex':
+        return lambda e: (-sum(e),) + tuple(-i for i in e)
+    elif order == 'lex':
+        return lambda e: tuple(-i for i in e)
+
+    class key(object):
+        __slots__ = ['m']
+        def __init__(self, e):
+            self.m = P.monomial(*e)
+        def __lt__(self, other):
+            return other.m < self.m
+        def __eq__(self, other):
+            return self.m == other.m
+    return key
+
+class _PackedMonomials(object):
+    """
+    A list of exponent tuples, each packed into a single integer so that divisibility
+    can be tested with a few integer operations.
+
+    Each exponent is stored in a field of w+1 bits, where 2^w exceeds all the exponents
+    of the list. The top bit of each field is a guard bit: with the guard bits of u set,
+    subtracting the packed form of v from u does not borrow across fields, and the guard
+    bit of a field stays set if and only if the corresponding exponent of v does not
+    exceed the one of u. Exponents of u larger than 2^w - 1 can be truncated to 2^w - 1
+    without changing the outcome.
+
+    EXAMPLES::
+
+       sage: from ore_algebra.ore_operator_mult import _PackedMonomials
+       sage: P = _PackedMonomials([(2, 0, 1), (0, 3, 0), (1, 1, 0)])
+       sage: P.divisor((3, 1, 1)), P.divisor((0, 4, 7)), P.divisor((0, 2, 5))
+       (0, 1, None)
+    """
+
+    def __init__(self, exps):
+        self.exps = [tuple(e) for e in exps]
+        self.degrees = [sum(e) for e in self.exps]
+        w = max([int(i).bit_length() for e in self.exps for i in e] + [1])
+        self.__w = w; self.__cap = (1 << w) - 1
+        self.__guard = sum(1 << ((w + 1)*i + w) for i in range(len(self.exps[0]))) if self.exps else 0
+        self.packed = [self.pack(e) for e in self.exps]
+
+    def pack(self, e):
+        w = self.__w + 1; cap = self.__cap
+        return sum(min(int(i), cap) << (w*k) for k, i in enumerate(e))
+
+    def divisor(self, e):
+        """
+        Returns the index of the first exponent tuple of the list which is componentwise
+        bounded by e, or None if there is no such tuple.
+        """
+        d = sum(e); guard = self.__guard
+        u = self.pack(e) | guard
+        for k, v in enumerate(self.packed):
+            if self.degrees[k] <= d and (u - v) & guard == guard:
+                return k
+        return None
+
+class _CompactBasis(object):
+    """
+    A list of operators in a compact form suited for bulk reductions.
+
+    Each nonzero operator b of the list is multiplied by the common denominator of
+    its coefficients and stored as a dictionary mapping exponent tuples to elements
+    of the polynomial ring R underlying the base ring of the algebra. The leading
+    monomials are packed by _PackedMonomials. The compact form of an operator is
+    computed only once and remembered by the operator.
+
+    The method reduce performs fraction free reduction in this representation: the
+    remainder is a dictionary of numerators over R, its terms are visited in
+    decreasing order by means of a heap of exponent tuples, and multiples of basis
+    elements are formed by _sparse_mul. No intermediate operators are created.
+
+    EXAMPLES::
+
+       sage: from ore_algebra import *
+       sage: from ore_algebra.ore_operator_mult import _CompactBasis
+       sage: P.<x,y> = ZZ[]
+       sage: A.<Dx,Dy> = OreAlgebra(P)
+       sage: basis = [(x-y)*Dx+y,(x+y)*Dy-2]
+       sage: C = _CompactBasis(A, basis)
+       sage: p = Dx^2*Dy-1
+       sage: C.reduce(p, normalize=True)
+       1
+       sage: C.reduce(p) == p.reduce(basis)
+       True
+       sage: _CompactBasis(A, [Dx + x]).reduce(2*Dx + 4*x, normalize=True)
+       x
+    """
+
+    def __init__(self, A, basis):
+        K = A.base_ring()
+        self.R = R = K.ring() if is_FractionField(K) else K
+        self.A = A; self.AR = A.change_ring(R)
+        self.key = _heap_key(A.associated_commutative_algebra())
+        self.index = [k for k in range(len(basis)) if not basis[k].is_zero()]
+        self.basis = [self.__compact(basis[k] if basis[k].parent() is A else A(basis[k])) for k in self.index]
+        self.lms = _PackedMonomials([b[1] for b in self.basis])
+
+    def __compact(self, b):
+        try:
+            return b._compact_form
+        except AttributeError:
+            pass
+        terms, _ = self.numerators(b)
+        lm = tuple(int(i) for i in b.exp())
+        b._compact_form = c = (terms, lm, getattr(b, 'sugar', None))
+        return c
+
+    def numerators(self, p):
+        """
+        Returns a dictionary mapping exponent tuples to numerators in R, and the
+        common denominator d, such that the dictionary represents d*p.
+        """
+        R = self.R; terms = p.dict()
+        if R is self.A.base_ring():
+            return dict((tuple(int(i) for i in e), c) for e, c in terms.items()), R.one()
+        d = lcm([c.denominator() for c in terms.values()] + [R.one()])
+        return dict((tuple(int(i) for i in e), R(c*d)) for e, c in terms.items()), d
+
+    def reduce(self, p, normalize=False, infolevel=0):
+        """
+        Returns the remainder of p with respect to the basis, as MultivariateOreOperator.reduce.
+        """
+        import heapq
+
+        def info(i, msg):
+            if infolevel >= i:
+                print(msg)
+
+        A = p.parent(); R = self.R; AR = self.AR; key = self.key
+        sugar = getattr(p, 'sugar', None)
+        p, c = self.numerators(p)
+        c = R.fraction_field()(c)
+        r0 = {}
+        heap = [(key(e), e) for e in p]; heapq.heapify(heap)
+        if any(b[2] is None for b in self.basis):
+            sugar = None
+
+        while len(heap) > 0:
+            e = heapq.heappop(heap)[1]
+            if e not in p:
+                continue
+            k = self.lms.divisor(e)
+            if k is None:
+                info(2, "term goes to remainder")
+                r0[e] = p.pop(e)
+                continue
+            b, lm, s = self.basis[k]
+            tau = tuple(i - j for i, j in zip(e, lm))
+            info(2, lazy_string(lambda: str(len(p)) + " terms left; reducing exponent " + str(e) + " with basis element no " + str(self.index[k])))
+            b0 = _sparse_mul(AR, {tau: 1}, b)
+            if sugar is not None:
+                sugar = max(sugar, sum(tau) + s)
+            a = b0[e]; m = p[e]
+            g = a.gcd(m); a = a//g; m = m//g
+            if not a.is_one():
+                p = dict((f, a*q) for f, q in p.items())
+                r0 = dict((f, a*q) for f, q in r0.items())
+                c *= a
+            for f, q in b0.items():
+                if f in p:
+                    q = p[f] - m*q
+                    if q.is_zero():
+                        del p[f]
+                    else:
+                        p[f] = q
+                else:
+                    p[f] = -m*q
+                    heapq.heappush(heap, (key(f), f))
+            # remove the content after every step, so that remainders stay primitive
+            g = reduce(lambda u, v: u.gcd(v), list(p.values()) + list(r0.values()), R.zero())
+            if not g.is_zero() and not g.is_one():
+                c /= g
+                p = dict((f, q//g) for f, q in p.items())
+                r0 = dict((f, q//g) for f, q in r0.items())
+
+        r0 = A(r0)
+        if normalize:
+            if not r0.is_zero() and R.base_ring() is ZZ:
+                sgn = r0.lc().lc().sign()
+                r0 *= sgn; c *= sgn
+        elif not c.is_one():
+            r0 = A.change_ring(R.fraction_field())(r0).map_coefficients(lambda q: q/c)
+        if sugar is not None:
+            r0.sugar = sugar
+        info(1, "reduction completed, remainder has " + str(len(r0.coefficients())) + " terms.")
+        return r0